@@ -34,7 +34,8 @@ namespace TextHunter.Controllers
                 {
                     "naive_bayes",
                     "logistic_regression",
-                    "svm_model"
+                    "svm_model",
+                    "ensemble"
                 }
             };
             return View(model);
@@ -47,12 +48,12 @@ namespace TextHunter.Controllers
             if (string.IsNullOrWhiteSpace(model.Text))
             {
                 ModelState.AddModelError("Text", "Lütfen bir metin girin.");
-                model.AvailableModels = new List<string> { "naive_bayes", "logistic_regression", "svm_model" };
+                model.AvailableModels = new List<string> { "naive_bayes", "logistic_regression", "svm_model", "ensemble" };
                 return View(model);
             }
 
             // 2. Modelleri tekrar dolduralım (View için gerekli)
-            model.AvailableModels = new List<string> { "naive_bayes", "logistic_regression", "svm_model" };
+            model.AvailableModels = new List<string> { "naive_bayes", "logistic_regression", "svm_model", "ensemble" };
 
             try
             {
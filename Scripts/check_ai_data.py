@@ -1,15 +1,15 @@
-import pandas as pd
-import os
+from dataset_io import find_dataset, load_dataset, dataset_columns
 
-ai_file = '../Data/raw/ai_abstracts.csv'
-exists = os.path.exists(ai_file)
+ai_file = '../Data/raw/ai_abstracts'
+exists = find_dataset(ai_file) is not None
 print('Dosya var mı?', exists)
 print()
 
 if exists:
-    df = pd.read_csv(ai_file)
+    # Metinler okunmaz; yalnızca prompt kolonu
+    df = load_dataset(ai_file, columns=['prompt'])
     print(f'Mevcut AI verisi sayısı: {len(df)}')
-    print(f'Kolonlar: {list(df.columns)}')
+    print(f'Kolonlar: {dataset_columns(ai_file)}')
     if 'prompt' in df.columns:
         print('\nİlk 3 prompt örneği:')
         for i, p in enumerate(df['prompt'].head(3), 1):
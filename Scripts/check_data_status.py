@@ -3,8 +3,8 @@ Veri Seti Durum Kontrol Scripti
 Data/raw klasöründeki veri dosyalarını kontrol eder
 """
 
-import pandas as pd
 import os
+from dataset_io import find_dataset, load_dataset, dataset_columns
 
 def check_data_status():
     """Veri dosyalarının durumunu kontrol eder"""
@@ -16,14 +16,15 @@ def check_data_status():
     print()
     
     # Human abstracts kontrolü
-    human_path = os.path.join(base_path, "human_abstracts.csv")
-    if os.path.exists(human_path):
+    human_path = os.path.join(base_path, "human_abstracts")
+    if find_dataset(human_path):
         try:
-            human_df = pd.read_csv(human_path)
+            # Yalnızca label kolonu okunur
+            human_df = load_dataset(human_path, columns=['label'])
             human_count = len(human_df)
-            print(f"✅ Human abstracts dosyasi: MEVCUT")
+            print(f"✅ Human abstracts dosyasi: MEVCUT ({os.path.basename(find_dataset(human_path))})")
             print(f"   Satir sayisi: {human_count}")
-            print(f"   Sutunlar: {list(human_df.columns)}")
+            print(f"   Sutunlar: {dataset_columns(human_path)}")
             if 'label' in human_df.columns:
                 print(f"   Label kontrolu: {human_df['label'].value_counts().to_dict()}")
         except Exception as e:
@@ -36,14 +37,15 @@ def check_data_status():
     print()
     
     # AI abstracts kontrolü
-    ai_path = os.path.join(base_path, "ai_abstracts.csv")
-    if os.path.exists(ai_path):
+    ai_path = os.path.join(base_path, "ai_abstracts")
+    if find_dataset(ai_path):
         try:
-            ai_df = pd.read_csv(ai_path)
+            # Yalnızca label kolonu okunur
+            ai_df = load_dataset(ai_path, columns=['label'])
             ai_count = len(ai_df)
-            print(f"✅ AI abstracts dosyasi: MEVCUT")
+            print(f"✅ AI abstracts dosyasi: MEVCUT ({os.path.basename(find_dataset(ai_path))})")
             print(f"   Satir sayisi: {ai_count}")
-            print(f"   Sutunlar: {list(ai_df.columns)}")
+            print(f"   Sutunlar: {dataset_columns(ai_path)}")
             if 'label' in ai_df.columns:
                 print(f"   Label kontrolu: {ai_df['label'].value_counts().to_dict()}")
         except Exception as e:
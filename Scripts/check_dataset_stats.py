@@ -3,16 +3,17 @@ Veri seti istatistiklerini kontrol eden script
 User Story-1 gereksinimlerini kontrol eder
 """
 
-import json
 import os
+from dataset_io import find_dataset, load_dataset, dataset_row_count
 
 def check_dataset():
     """Veri seti istatistiklerini kontrol eder"""
     
     data_dir = "../Data/raw"
-    combined_file = os.path.join(data_dir, "combined_dataset.json")
-    human_file = os.path.join(data_dir, "human_abstracts.json")
-    ai_file = os.path.join(data_dir, "ai_abstracts.json")
+    # Uzantısız yollar: Parquet > JSON > CSV
+    combined_file = os.path.join(data_dir, "combined_dataset")
+    human_file = os.path.join(data_dir, "human_abstracts")
+    ai_file = os.path.join(data_dir, "ai_abstracts")
     
     print("=" * 70)
     print("USER STORY-1: VERİ SETİ TOPLAMA KONTROLÜ")
@@ -20,12 +21,18 @@ def check_dataset():
     print()
     
     # Combined dataset kontrolü
-    if os.path.exists(combined_file):
-        with open(combined_file, 'r', encoding='utf-8') as f:
-            combined_data = json.load(f)
+    if find_dataset(combined_file):
+        # Yalnızca gereken kolonlar okunur (metinler ayrıştırılmaz)
+        combined_data = load_dataset(combined_file, columns=['label', 'source', 'license'])
+        for column in ('label', 'source', 'license'):
+            if column not in combined_data.columns:
+                combined_data[column] = None
+        combined_data['source'] = combined_data['source'].fillna('unknown')
+        is_human = combined_data['label'] == 'Human'
+        is_ai = combined_data['label'] == 'AI'
         
-        human_count = len([x for x in combined_data if x.get('label') == 'Human'])
-        ai_count = len([x for x in combined_data if x.get('label') == 'AI'])
+        human_count = int(is_human.sum())
+        ai_count = int(is_ai.sum())
         total = len(combined_data)
         
         print(f"📊 COMBINED DATASET İSTATİSTİKLERİ:")
@@ -35,8 +42,8 @@ def check_dataset():
         print()
         
         # Kaynak kontrolü
-        human_sources = set([x.get('source', 'unknown') for x in combined_data if x.get('label') == 'Human'])
-        ai_sources = set([x.get('source', 'unknown') for x in combined_data if x.get('label') == 'AI'])
+        human_sources = set(combined_data.loc[is_human, 'source'])
+        ai_sources = set(combined_data.loc[is_ai, 'source'])
         
         print(f"📁 KAYNAK BİLGİLERİ:")
         print(f"   Human kaynakları: {human_sources}")
@@ -44,11 +51,11 @@ def check_dataset():
         print()
         
         # Lisans kontrolü
-        human_with_license = [x for x in combined_data if x.get('label') == 'Human' and 'license' in x]
+        human_with_license = combined_data.loc[is_human & combined_data['license'].notna(), 'license']
         print(f"📜 LİSANS BİLGİLERİ:")
         print(f"   Lisans bilgisi olan Human örnekler: {len(human_with_license)}/{human_count}")
-        if human_with_license:
-            licenses = set([x.get('license', 'unknown') for x in human_with_license])
+        if len(human_with_license):
+            licenses = set(human_with_license)
             print(f"   Lisans türleri: {licenses}")
         print()
         
@@ -106,24 +113,18 @@ def check_dataset():
         print("=" * 70)
         
     else:
-        print(f"❌ Combined dataset dosyası bulunamadı: {combined_file}")
+        print(f"❌ Combined dataset dosyası bulunamadı: {combined_file}.(parquet|json|csv)")
     
     # Ayrı dosyalar kontrolü
     print()
     print("📂 AYRI DOSYALAR:")
-    if os.path.exists(human_file):
-        with open(human_file, 'r', encoding='utf-8') as f:
-            human_data = json.load(f)
-        print(f"   ✓ human_abstracts.json: {len(human_data)} örnek")
-    else:
-        print(f"   ✗ human_abstracts.json bulunamadı")
-    
-    if os.path.exists(ai_file):
-        with open(ai_file, 'r', encoding='utf-8') as f:
-            ai_data = json.load(f)
-        print(f"   ✓ ai_abstracts.json: {len(ai_data)} örnek")
-    else:
-        print(f"   ✗ ai_abstracts.json bulunamadı")
+    for base_path in (human_file, ai_file):
+        path = find_dataset(base_path)
+        if path:
+            # Parquet'te satır sayısı dosya üst verisinden okunur
+            print(f"   ✓ {os.path.basename(path)}: {dataset_row_count(path)} örnek")
+        else:
+            print(f"   ✗ {os.path.basename(base_path)} bulunamadı")
 
 if __name__ == "__main__":
     check_dataset()
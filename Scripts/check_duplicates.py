@@ -1,26 +1,56 @@
 """
 Veri tekrarı kontrolü ve temizleme scripti
+- Varsayılan: birebir aynı metinler (veri setleri ve varsa JSON dışa aktarımları)
+- --near: MinHash + LSH ile yakın tekrar (near-duplicate) kümeleri; ikili karşılaştırma
+  yapılmaz, süre örnek sayısıyla doğrusal artar
 """
 
+import re
+import argparse
+import hashlib
+import numpy as np
 import pandas as pd
 import json
 import os
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataset_io import find_dataset, load_dataset, load_records, save_dataset
 
 DATA_DIR = Path("../Data/raw")
 
+# Yakın tekrar ayarları
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Kelime shingle kümelerinin Jaccard benzerliği eşiği
+SHINGLE_SIZE = 3  # Shingle başına kelime sayısı
+NUM_PERMUTATIONS = 128  # MinHash imza uzunluğu
+MINHASH_SEED = 1  # Aynı veri her çalıştırmada aynı imzaları üretir
+# LSH bant seçiminde yanlış pozitiflerin ağırlığı (yanlış negatifler: 1 - bu değer).
+# Adaylar imza benzerliğiyle doğrulandığı için yanlış pozitif ucuzdur; kaçırılan tekrar değil.
+LSH_FALSE_POSITIVE_WEIGHT = 0.1
+# Bir seferde işlenen shingle sayısı (bellek: NUM_PERMUTATIONS x bu değer x 8 bayt)
+MINHASH_BATCH_SHINGLES = 32768
+
+_SHIFT = np.uint64(32)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+_WORD_PATTERN = re.compile(r'\w+')
+
 def check_duplicates_csv(file_path, name):
     """CSV dosyasında duplicate kontrolü yapar"""
     print(f"\n{'='*60}")
     print(f"{name} - CSV Kontrolü")
     print(f"{'='*60}")
     
+    dataset_path = str(file_path)
     if not file_path.exists():
-        print(f"⚠ Dosya bulunamadı: {file_path}")
-        return None
+        # CSV dışa aktarımı varsayılan olarak yazılmaz; birincil veri seti (Parquet) okunur
+        dataset_path = find_dataset(str(file_path.with_suffix('')))
+        if dataset_path is None:
+            print(f"⚠ Dosya bulunamadı: {file_path}")
+            return None, None
+        print(f"CSV dışa aktarımı yok, veri seti okunuyor: {dataset_path}")
     
     try:
-        df = pd.read_csv(file_path)
+        df = load_dataset(dataset_path)
         total_rows = len(df)
         
         # Text kolonunda duplicate kontrolü
@@ -58,7 +88,7 @@ def check_duplicates_json(file_path, name):
     
     if not file_path.exists():
         print(f"⚠ Dosya bulunamadı: {file_path}")
-        return None
+        return None, None
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -100,6 +130,233 @@ def check_duplicates_json(file_path, name):
         print(f"❌ Hata: {e}")
         return None, None
 
+def _word_hash(word: str, cache: Dict[str, int]) -> int:
+    # Python hash() her süreçte farklıdır; blake2b çalıştırmalar arasında sabittir
+    value = cache.get(word)
+    if value is None:
+        value = int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+        cache[word] = value
+    return value
+
+def shingle_hashes(text, cache: Dict[str, int], size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    Metnin kelime shingle'larının 32 bit özetleri (tekrarsız).
+    size kelimeden kısa metinler tek shingle sayılır; boş metin boş dizi döner.
+    """
+    if not isinstance(text, str):
+        return np.empty(0, dtype=np.uint64)
+    words = _WORD_PATTERN.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    word_hashes = np.array([_word_hash(word, cache) for word in words], dtype=np.uint64)
+    count = max(len(words) - size + 1, 1)
+    hashes = word_hashes[:count].copy()
+    for offset in range(1, min(size, len(words))):
+        # uint64 taşması kasıtlı (mod 2^64 polinom özeti)
+        hashes = hashes * _MIX + word_hashes[offset:offset + count]
+    hashes = (hashes >> _SHIFT) ^ (hashes & _MAX_HASH)
+    return np.unique(hashes)
+
+def _permutations(num_perm: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(seed)
+    a = rng.randint(0, 1 << 64, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.randint(0, 1 << 64, size=num_perm, dtype=np.uint64)
+    return a[:, None], b[:, None]
+
+def minhash_signatures(texts: Sequence, num_perm: int = NUM_PERMUTATIONS,
+                       seed: int = MINHASH_SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her metin için num_perm uzunluğunda MinHash imzası: çarp-kaydır özetleri
+    ((a*x + b) mod 2^64) >> 32 altında en küçük shingle özeti. Metinler shingle sayısı
+    MINHASH_BATCH_SHINGLES'a ulaşana kadar toplanıp birlikte işlenir.
+    Dönüş: (imzalar [n, num_perm] uint32, shingle'ı olan metinlerin maskesi)
+    """
+    a, b = _permutations(num_perm, seed)
+    signatures = np.full((len(texts), num_perm), 0xFFFFFFFF, dtype=np.uint32)
+    has_shingles = np.zeros(len(texts), dtype=bool)
+    cache = {}
+
+    def flush(indices, parts):
+        shingles = np.concatenate(parts)
+        offsets = np.cumsum([0] + [len(part) for part in parts[:-1]])
+        # Mod almak yerine uint64 taşması ve üst 32 bit (mod asal işleminden ~5 kat hızlı)
+        values = a * shingles[None, :]
+        values += b
+        values >>= _SHIFT
+        signatures[indices] = np.minimum.reduceat(values, offsets, axis=1).T
+
+    indices, parts, pending = [], [], 0
+    for index, text in enumerate(texts):
+        hashes = shingle_hashes(text, cache)
+        if not len(hashes):
+            continue
+        has_shingles[index] = True
+        indices.append(index)
+        parts.append(hashes)
+        pending += len(hashes)
+        if pending >= MINHASH_BATCH_SHINGLES:
+            flush(indices, parts)
+            indices, parts, pending = [], [], 0
+    if parts:
+        flush(indices, parts)
+    return signatures, has_shingles
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERMUTATIONS) -> Tuple[int, int]:
+    """
+    Eşiğe göre (bant sayısı, bant başına satır): bands * rows <= num_perm olan
+    seçenekler arasından yanlış pozitif ve yanlış negatif olasılıklarının
+    (eşiğin altı/üstü boyunca integral) ağırlıklı toplamını en küçük yapan.
+    """
+    best, best_error = (1, num_perm), None
+    below = np.linspace(0.0, threshold, 101)
+    above = np.linspace(threshold, 1.0, 101)
+    for rows in range(1, num_perm + 1):
+        for bands in range(1, num_perm // rows + 1):
+            false_positive = np.mean(1 - (1 - below ** rows) ** bands) * threshold
+            false_negative = np.mean((1 - above ** rows) ** bands) * (1 - threshold)
+            error = (LSH_FALSE_POSITIVE_WEIGHT * false_positive
+                     + (1 - LSH_FALSE_POSITIVE_WEIGHT) * false_negative)
+            if best_error is None or error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+def _band_keys(block: np.ndarray) -> np.ndarray:
+    keys = np.zeros(len(block), dtype=np.uint64)
+    for column in block.T:
+        keys = keys * _MIX + column.astype(np.uint64)
+    return keys
+
+def _candidate_pairs(signatures: np.ndarray, valid: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """
+    Aynı banda düşen metin çiftleri: her kovadaki metinler kovanın en küçük
+    indeksli üyesiyle eşlenir (kova boyutuyla doğrusal). Dönüş: [m, 2] (temsilci, üye)
+    """
+    candidates = np.flatnonzero(valid)
+    pairs = []
+    if len(candidates) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    for band in range(bands):
+        keys = _band_keys(signatures[candidates, band * rows:(band + 1) * rows])
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        new_run = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        run_starts = np.flatnonzero(new_run)
+        run_ids = np.cumsum(new_run) - 1
+        representatives = order[run_starts][run_ids]
+        members = order != representatives
+        if members.any():
+            pairs.append(np.stack([candidates[representatives[members]], candidates[order[members]]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+def _clusters_from_pairs(pairs: np.ndarray, count: int) -> List[List[int]]:
+    parent = np.arange(count)
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for left, right in pairs:
+        left_root, right_root = find(left), find(right)
+        if left_root != right_root:
+            # Küçük indeksli kök kalır; kümenin ilk elemanı korunacak örnektir
+            parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    groups = {}
+    for node in np.unique(pairs):
+        groups.setdefault(find(node), []).append(int(node))
+    return sorted((sorted(group) for group in groups.values()), key=lambda group: (-len(group), group[0]))
+
+def find_near_duplicates(texts: Sequence, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                         num_perm: int = NUM_PERMUTATIONS) -> Tuple[List[List[int]], np.ndarray]:
+    """
+    Tahmini Jaccard benzerliği threshold ve üzeri olan metinleri kümeler.
+    LSH adayları imza benzerliğiyle doğrulanır, kümeler union-find ile birleştirilir.
+    Dönüş: (indeks kümeleri (büyükten küçüğe), imzalar)
+    """
+    signatures, valid = minhash_signatures(texts, num_perm)
+    bands, rows = lsh_params(threshold, num_perm)
+    pairs = _candidate_pairs(signatures, valid, bands, rows)
+    if len(pairs):
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[similarity >= threshold]
+    return _clusters_from_pairs(pairs, len(texts)), signatures
+
+def check_near_duplicates(base_path: str, name: str, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+    """Veri setinde yakın tekrar kümelerini raporlar"""
+    print(f"\n{'='*60}")
+    print(f"{name} - Yakın Tekrar (MinHash/LSH) Kontrolü")
+    print(f"{'='*60}")
+
+    if find_dataset(base_path) is None:
+        print(f"⚠ Dosya bulunamadı: {base_path}")
+        return None, None
+
+    df = load_dataset(base_path, columns=['text', 'label'])
+    if 'text' not in df.columns:
+        print(f"⚠ 'text' kolonu bulunamadı")
+        return df, None
+
+    bands, rows = lsh_params(threshold)
+    print(f"Eşik (Jaccard): {threshold} | Shingle: {SHINGLE_SIZE} kelime | "
+          f"İmza: {NUM_PERMUTATIONS} ({bands} bant x {rows} satır)")
+    clusters, signatures = find_near_duplicates(df['text'].tolist(), threshold)
+
+    duplicate_count = sum(len(cluster) - 1 for cluster in clusters)
+    print(f"Toplam veri sayısı: {len(df)}")
+    print(f"Yakın tekrar kümesi: {len(clusters)} ({sum(len(cluster) for cluster in clusters)} örnek)")
+    print(f"Silinecek yakın tekrar: {duplicate_count} (her kümeden ilk örnek korunur)")
+
+    if 'label' in df.columns and clusters:
+        labels = df['label'].tolist()
+        mixed = [cluster for cluster in clusters if len({labels[i] for i in cluster}) > 1]
+        print(f"Farklı etiketli (Human+AI) küme: {len(mixed)}")
+
+    if clusters:
+        print(f"\nEn büyük kümeler (ilk 3):")
+        for number, cluster in enumerate(clusters[:3], 1):
+            first, second = cluster[0], cluster[1]
+            similarity = (signatures[first] == signatures[second]).mean()
+            print(f"\n{number}. {len(cluster)} örnek, tahmini benzerlik: {similarity:.2f}")
+            for index in (first, second):
+                label = df['label'].iloc[index] if 'label' in df.columns else ''
+                print(f"   [{index}] ({label}) {str(df['text'].iloc[index])[:100]}...")
+    else:
+        print(f"✓ Yakın tekrar YOK")
+    return df, clusters
+
+def remove_near_duplicates(base_path: str, clusters: List[List[int]], output_path: str) -> List[str]:
+    """
+    Her kümenin ilk örneğini tutup diğerlerini çıkarır ve sonucu output_path'e kaydeder
+    (Parquet + DATASET_EXPORTS). Girdi dosyasına dokunulmaz.
+    """
+    removed = {index for cluster in clusters for index in cluster[1:]}
+    records = load_records(base_path)
+    kept = [record for index, record in enumerate(records) if index not in removed]
+    written = save_dataset(kept, output_path)
+    print(f"\n✓ {len(records) - len(kept)} yakın tekrar çıkarıldı, {len(kept)} örnek kaldı")
+    for path in written:
+        print(f"✓ Kaydedildi: {path}")
+    return written
+
+def near_duplicates_main(input_path: Optional[str] = None, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                         remove: bool = False, output_path: Optional[str] = None):
+    base_path = input_path or str(DATA_DIR / "combined_dataset")
+    # Uzantılı dosya verilirse o dosya okunur; çıktı adı uzantısız yoldan türetilir
+    stem, extension = os.path.splitext(base_path)
+    if not (extension and find_dataset(base_path) == base_path):
+        stem = base_path
+    df, clusters = check_near_duplicates(base_path, os.path.basename(base_path), threshold)
+    if remove and clusters:
+        remove_near_duplicates(base_path, clusters, output_path or f"{stem}_dedup")
+    elif clusters:
+        print("\n💡 Yakın tekrarları çıkarmak için:")
+        print("   python check_duplicates.py --near --remove")
+    print("="*60 + "\n")
+
 def main():
     print("\n" + "="*60)
     print("VERİ TEKRARI (DUPLICATE) KONTROLÜ")
@@ -154,6 +411,28 @@ def main():
     
     print("="*60 + "\n")
 
-if __name__ == "__main__":
-    main()
+def parse_args():
+    parser = argparse.ArgumentParser(description="TextHunter veri tekrarı kontrolü")
+    parser.add_argument('--near', action='store_true',
+                        help="Birebir tekrar yerine MinHash/LSH ile yakın tekrarları ara")
+    parser.add_argument('--threshold', type=float, default=NEAR_DUPLICATE_THRESHOLD,
+                        help=f"Yakın tekrar için Jaccard eşiği, 0-1 (varsayılan: {NEAR_DUPLICATE_THRESHOLD})")
+    parser.add_argument('--input', default=None,
+                        help="Kontrol edilecek veri seti (varsayılan: ../Data/raw/combined_dataset)")
+    parser.add_argument('--remove', action='store_true',
+                        help="Yakın tekrarları çıkarıp <girdi>_dedup olarak kaydet")
+    parser.add_argument('--output', default=None,
+                        help="--remove çıktısının uzantısız yolu (varsayılan: <girdi>_dedup)")
+    args = parser.parse_args()
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold 0 ile 1 arasında olmalı")
+    if (args.remove or args.input or args.output) and not args.near:
+        parser.error("--input/--remove/--output yalnızca --near ile kullanılabilir")
+    return args
 
+if __name__ == "__main__":
+    args = parse_args()
+    if args.near:
+        near_duplicates_main(args.input, args.threshold, args.remove, args.output)
+    else:
+        main()
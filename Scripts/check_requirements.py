@@ -79,6 +79,7 @@ def main():
         ("arxiv", "arxiv"),
         ("google-generativeai", "google.generativeai"),
         ("pandas", "pandas"),
+        ("pyarrow", "pyarrow"),
         ("numpy", "numpy"),
         ("tqdm", "tqdm"),
         ("scikit-learn", "sklearn"),
@@ -0,0 +1,158 @@
+"""
+Ekleme Odaklı (append-only) Checkpoint Günlüğü
+- Her kayıt JSON-lines dosyasına tek satır olarak eklenir (kayıt başına sabit maliyet)
+- fsync her JOURNAL_SYNC_EVERY kayıtta bir yapılır; arada süreç çökerse bile
+  satırlar işletim sistemine yazılmış olur
+- Yarım yazılmış son satır (çökme) okunurken atlanır ve dosyadan kesilir
+- Sıkıştırma (compaction) tüm listeyi geçici dosyaya yazıp os.replace ile yerine koyar
+"""
+
+import os
+import json
+from typing import Dict, Iterable, List, Optional
+
+# Bu kadar kayıt eklendikten sonra diske fsync yapılır
+JOURNAL_SYNC_EVERY = 10
+
+def _fsync_directory(directory: str):
+    # Yeniden adlandırmanın kalıcı olması için (Windows'ta dizin açılamaz, atlanır)
+    try:
+        fd = os.open(directory or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _scan_journal(path: str):
+    """
+    Günlükteki kayıtlar, geçerli son satırın bittiği bayt ofseti ve
+    okunamayan satır sayısı
+    """
+    records = []
+    valid_end = 0
+    dead_lines = 0
+    offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            offset += len(line)
+            if not line.endswith(b'\n'):
+                # Yarım yazılmış son satır: ofset ilerletilmez, dosyadan kesilecek
+                break
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    dead_lines += 1
+            valid_end = offset
+    return records, valid_end, dead_lines
+
+def read_journal(path: str) -> List[Dict]:
+    """
+    Günlüğü yalnızca okur (dosyayı değiştirmez); bozuk satırları atlar
+    """
+    if not os.path.exists(path):
+        return []
+    return _scan_journal(path)[0]
+
+class CheckpointJournal:
+    """
+    JSON-lines checkpoint günlüğü. legacy_path verilirse ve günlük yoksa, eski
+    tek parça JSON checkpoint ilk yüklemede günlüğe taşınır.
+    """
+
+    def __init__(self, path: str, sync_every: int = JOURNAL_SYNC_EVERY, legacy_path: Optional[str] = None):
+        self.path = path
+        self.sync_every = max(1, sync_every)
+        self.legacy_path = legacy_path
+        self._file = None
+        self._unsynced = 0
+
+    def load(self) -> List[Dict]:
+        """
+        Kayıtları yükler. Yarım son satır dosyadan kesilir; ortada okunamayan satır
+        varsa günlük sıkıştırılır.
+        """
+        self.close()
+        if not os.path.exists(self.path):
+            if self.legacy_path and os.path.exists(self.legacy_path):
+                with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+                self.compact(records)
+                os.remove(self.legacy_path)
+                print(f"✓ Eski checkpoint günlüğe taşındı: {self.path}")
+                return records
+            return []
+
+        records, valid_end, dead_lines = _scan_journal(self.path)
+        if dead_lines:
+            print(f"⚠ Checkpoint günlüğünde {dead_lines} bozuk satır atlandı, günlük sıkıştırılıyor")
+            self.compact(records)
+        elif valid_end < os.path.getsize(self.path):
+            # Çökme sırasında yarım kalan son satır; yeni kayıtlar ona eklenmesin
+            print(f"⚠ Checkpoint günlüğünün yarım kalan son satırı atıldı")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+        return records
+
+    def _open(self):
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8', newline='\n')
+        return self._file
+
+    def append(self, record: Dict):
+        """
+        Kaydı günlüğe ekler; her sync_every kayıtta bir fsync yapılır
+        """
+        f = self._open()
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def extend(self, records: Iterable[Dict]):
+        for record in records:
+            self.append(record)
+
+    def sync(self):
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self, records: Iterable[Dict]):
+        """
+        Günlüğü verilen kayıtlarla yeniden yazar (geçici dosya + os.replace).
+        Yarıda kesilirse eski günlük olduğu gibi kalır.
+        """
+        self.close()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_directory(directory)
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -2,20 +2,45 @@
 Veri Temizleme Scripti
 - Ham veriyi temizler ve normalize eder
 - Tokenizasyon ve ön işleme yapar
+- İsteğe bağlı olarak yakın tekrarları (MinHash/LSH) kaldırır (--near-dedup)
 - Temizlenmiş veriyi kaydeder
 """
 
 import os
 import json
+import hashlib
+import tempfile
+import argparse
 import pandas as pd
 import re
 import string
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Tuple, Optional
 from tqdm import tqdm
+from dataset_io import (dataset_exports, find_dataset, iter_dataset_records, parquet_available,
+                        update_column_kinds, arrow_schema, write_parquet)
+from check_duplicates import NEAR_DUPLICATE_THRESHOLD
 
 INPUT_DIR = "../Data/raw"
 OUTPUT_DIR = "../Data/cleaned"
 
+# Bir kez derlenen temizleme desenleri
+# URL: 'http\S+|www\S+|https\S+' ile aynı eşleşmeler ('https' zaten 'http' ile başlar)
+URL_PATTERN = re.compile(r'(?:http|www)\S+')
+# Email: '\S+@\S+' ile aynı eşleşmeler. Eşleşme her zaman boşlukla ayrılmış parçanın
+# başından başlar; desen yalnızca parça başlarında denenir, parça içinde tekrar taranmaz.
+EMAIL_PATTERN = re.compile(r'(?<!\S)\S+@\S+')
+
+MIN_TEXT_LENGTH = 50
+
+# Dengelenmiş çıktıdaki sınıf sırası
+CLASS_LABELS = ['Human', 'AI']
+# Süreç havuzuna gönderilen parça başına örnek sayısı
+CLEAN_CHUNK_SIZE = 10000
+# JSON dizisi akış halinde okunurken bir seferde okunan karakter sayısı
+READ_BUFFER_SIZE = 1024 * 1024
+
 def clean_text(text: str) -> str:
     """
     Metni temizler ve normalize eder
@@ -26,27 +51,35 @@ def clean_text(text: str) -> str:
     # Küçük harfe çevir
     text = text.lower()
     
-    # URL'leri kaldır
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    # URL'leri kaldır (metinde URL başlangıcı yoksa desen hiç çalıştırılmaz)
+    if 'http' in text or 'www' in text:
+        text = URL_PATTERN.sub('', text)
     
     # Email adreslerini kaldır
-    text = re.sub(r'\S+@\S+', '', text)
+    if '@' in text:
+        text = EMAIL_PATTERN.sub('', text)
     
     # Özel karakterleri ve sayıları koru ama fazla boşlukları temizle
     # Akademik metinlerde sayılar ve özel karakterler önemli olabilir
     
-    # Fazla boşlukları temizle
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Başta ve sonda boşlukları kaldır
-    text = text.strip()
+    # Fazla boşlukları temizle, başta ve sonda boşlukları kaldır
+    # (str.split() regex'teki \s ile aynı Unicode boşluk karakterlerinde böler;
+    # re.sub(r'\s+', ' ') + strip() ile aynı sonuç, birkaç kat hızlı)
+    text = ' '.join(text.split())
     
     # Çok kısa metinleri filtrele
-    if len(text) < 50:
+    if len(text) < MIN_TEXT_LENGTH:
         return ""
     
     return text
 
+def clean_texts(texts: Iterable) -> List[str]:
+    """
+    Metin kolonunu (liste, pandas Series vb.) toplu temizler.
+    Her metin için clean_text ile aynı sonucu döndürür.
+    """
+    return [clean_text(text) for text in texts]
+
 def remove_duplicates(data: List[Dict]) -> List[Dict]:
     """
     Tekrarlanan metinleri kaldırır
@@ -80,104 +113,323 @@ def balance_dataset(data: List[Dict]) -> List[Dict]:
     
     return balanced_data
 
-def validate_data(data: List[Dict]) -> List[Dict]:
+def is_valid_item(item: Dict) -> bool:
     """
-    Veriyi doğrular ve geçersiz örnekleri kaldırır
+    Tek bir örneğin doğrulama kurallarına uyup uymadığını döndürür
     """
-    valid_data = []
+    text = item.get('text', '')
+    label = item.get('label', '')
     
-    for item in tqdm(data, desc="Veri doğrulama"):
-        text = item.get('text', '')
-        label = item.get('label', '')
-        
-        # Gerekli alanlar kontrolü
-        if not text or not label:
-            continue
-        
-        # Metin uzunluğu kontrolü
-        if len(text) < 50 or len(text) > 5000:
-            continue
-        
-        # Label kontrolü
-        if label not in ['Human', 'AI']:
-            continue
-        
-        valid_data.append(item)
+    # Gerekli alanlar kontrolü
+    if not text or not label:
+        return False
+    
+    # Metin uzunluğu kontrolü
+    if len(text) < 50 or len(text) > 5000:
+        return False
     
-    return valid_data
+    # Label kontrolü
+    return label in ['Human', 'AI']
 
-def process_dataset(input_file: str, output_file: str):
+def validate_data(data: List[Dict]) -> List[Dict]:
     """
-    Veri setini işler ve temizler
+    Veriyi doğrular ve geçersiz örnekleri kaldırır
+    """
+    return [item for item in tqdm(data, desc="Veri doğrulama") if is_valid_item(item)]
+
+def iter_json_array(input_file: str, read_size: int = READ_BUFFER_SIZE) -> Iterator[Dict]:
+    """
+    JSON dizisini dosyanın tamamını belleğe almadan, eleman eleman okur
+    (json.JSONDecoder.raw_decode ile; bellekte yalnızca okuma tamponu tutulur)
+    """
+    decoder = json.JSONDecoder()
+    with open(input_file, 'r', encoding='utf-8') as f:
+        buffer = f.read(read_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"JSON dizisi bekleniyordu: {input_file}")
+        position = 1
+        eof = False
+        while True:
+            # Boşluk ve eleman ayracını atla
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                if position < len(buffer) or eof:
+                    break
+                buffer, position = f.read(read_size), 0
+                eof = not buffer
+            if position >= len(buffer) or buffer[position] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                item, end = None, len(buffer)
+            if end == len(buffer) and not eof:
+                # Eleman tampon sonunda kesilmiş olabilir; tamponu büyütüp tekrar dene
+                more = f.read(read_size)
+                eof = not more
+                buffer, position = buffer[position:] + more, 0
+                continue
+            yield item
+            position = end
+
+def iter_records(input_file: str, chunk_size: int = CLEAN_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Ham veri kayıtlarını akış halinde okur (Parquet, JSON dizisi, JSON-lines veya CSV)
     """
-    print(f"Veri yükleniyor: {input_file}")
-    
-    # JSON veya CSV dosyasını yükle
     if input_file.endswith('.json'):
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    elif input_file.endswith('.csv'):
-        df = pd.read_csv(input_file, encoding='utf-8')
-        data = df.to_dict('records')
+        yield from iter_json_array(input_file)
+    elif input_file.endswith(('.parquet', '.jsonl', '.csv')):
+        yield from iter_dataset_records(input_file, chunk_size)
     else:
-        raise ValueError("Desteklenmeyen dosya formatı. JSON veya CSV olmalı.")
-    
-    print(f"Yüklenen örnek sayısı: {len(data)}")
-    
-    # 1. Metinleri temizle
-    print("\nMetinler temizleniyor...")
-    for item in tqdm(data, desc="Temizleme"):
-        if 'text' in item:
-            item['text'] = clean_text(item['text'])
-    
-    # 2. Boş metinleri kaldır
-    data = [item for item in data if item.get('text', '').strip()]
-    print(f"Temizleme sonrası örnek sayısı: {len(data)}")
-    
-    # 3. Tekrarları kaldır
-    print("\nTekrarlar kaldırılıyor...")
-    data = remove_duplicates(data)
-    print(f"Tekrar kaldırma sonrası örnek sayısı: {len(data)}")
-    
-    # 4. Veri doğrulama
-    print("\nVeri doğrulanıyor...")
-    data = validate_data(data)
-    print(f"Doğrulama sonrası örnek sayısı: {len(data)}")
-    
-    # 5. Veri setini dengele
-    print("\nVeri seti dengeleniyor...")
-    data = balance_dataset(data)
-    
-    # 6. İstatistikler
-    human_count = sum(1 for item in data if item.get('label') == 'Human')
-    ai_count = sum(1 for item in data if item.get('label') == 'AI')
+        raise ValueError("Desteklenmeyen dosya formatı. Parquet, JSON, JSONL veya CSV olmalı.")
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def clean_chunk(items: List[Dict]) -> List[Tuple[bytes, Optional[str], str]]:
+    """
+    Bir parçayı temizler ve doğrular (süreç havuzunda çalışır). Boş kalan metinler atılır.
+    Dönüş: (metin özeti, sınıf etiketi - geçersizse None, JSON satırı) listesi.
+    Tekrar kontrolü özet üzerinden ana süreçte yapılır; doğrulama sonucu tekrar
+    kontrolünden sonra uygulanır (ilk görülen örnek geçersizse tekrarları da atılır).
+    """
+    items = [item for item in items if 'text' in item]
+    results = []
+    for item, text in zip(items, clean_texts(item['text'] for item in items)):
+        if not text:
+            continue
+        item['text'] = text
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        label = item['label'] if is_valid_item(item) else None
+        results.append((digest, label, json.dumps(item, ensure_ascii=False) + "\n"))
+    return results
+
+def iter_cleaned_chunks(chunks: Iterable[List[Dict]], workers: int) -> Iterator[List[Tuple[bytes, Optional[str], str]]]:
+    """
+    Parçaları süreç havuzunda temizler, sonuçları girdi sırasıyla döndürür.
+    Bekleyen parça sayısı sınırlı tutulur; böylece büyük dosyalar belleğe dolmaz.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield clean_chunk(chunk)
+        return
+
+    max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(clean_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def iter_spool(path: str, limit: int) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line, _ in zip(f, range(limit)):
+            yield json.loads(line)
+
+def _write_json_array(items: Iterable[Dict], path: str):
+    """
+    Örnekleri json.dump(data, f, ensure_ascii=False, indent=2) ile aynı biçimde,
+    listeyi bellekte tutmadan yazar
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        first = True
+        for item in items:
+            f.write("[\n  " if first else ",\n  ")
+            f.write(json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            first = False
+        f.write("[]" if first else "\n]")
+
+def _write_csv(chunks: Iterable[List[Dict]], columns: List[str], path: str):
+    """
+    Örnekleri pd.DataFrame(data).to_csv(index=False) ile aynı kolonlarla, parça parça yazar
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        header = True
+        for chunk in chunks:
+            pd.DataFrame(chunk, columns=columns).to_csv(f, index=False, header=header)
+            header = False
+        if header:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+
+class _SpooledTexts:
+    """
+    Geçici dosyadaki örneklerin metinleri; find_near_duplicates için uzunluğu bilinen,
+    belleğe alınmadan tekrar tekrar okunabilen dizi
+    """
+
+    def __init__(self, path: str, count: int):
+        self.path = path
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for item in iter_spool(self.path, self.count):
+            yield item.get('text', '')
+
+def remove_near_duplicates(spool_path: str, count: int, threshold: float) -> Tuple[set, int]:
+    """
+    Geçici dosyadaki örneklerde MinHash/LSH ile yakın tekrar kümelerini bulur
+    (bkz. check_duplicates.py --near). Her kümenin ilk örneği korunur.
+    Bellekte metinler değil, örnek başına MinHash imzası tutulur.
+    Dönüş: (çıkarılacak satır indeksleri, farklı etiketli küme sayısı)
+    """
+    from check_duplicates import find_near_duplicates
+
+    clusters, _ = find_near_duplicates(_SpooledTexts(spool_path, count), threshold)
+    removed = {index for cluster in clusters for index in cluster[1:]}
+    in_clusters = {index for cluster in clusters for index in cluster}
+    labels = {index: item.get('label') for index, item in enumerate(iter_spool(spool_path, count))
+              if index in in_clusters}
+    mixed = sum(1 for cluster in clusters if len({labels[index] for index in cluster}) > 1)
+    return removed, mixed
+
+def process_dataset(input_file: str, output_file: str, workers: int = 0, chunk_size: int = CLEAN_CHUNK_SIZE,
+                    near_dedup_threshold: Optional[float] = None):
+    """
+    Veri setini işler ve temizler.
+    Ham veri akış halinde okunur; parçalar (chunk_size örnek) süreç havuzunda
+    temizlenip doğrulanır. Ana süreçte yalnızca tekrar kontrolü için metin özetleri
+    ve sınıf sayaçları tutulur; geçerli örnekler sınıf başına geçici dosyalara
+    yazılır, dengeleme ve çıktılar bu dosyalardan akış halinde üretilir. Bellek
+    kullanımı veri seti boyutuyla değil parça boyutuyla sınırlıdır.
+    workers: süreç sayısı (0 = çekirdek sayısı kadar, 1 = tek süreç)
+    near_dedup_threshold: verilirse birebir tekrarlardan sonra Jaccard benzerliği bu
+        eşik ve üzeri olan yakın tekrarlar da (MinHash/LSH) dengelemeden önce kaldırılır
+    """
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    print(f"Veri yükleniyor: {input_file} ({workers} süreç, parça: {chunk_size} örnek)")
+    
+    loaded_count = cleaned_count = unique_count = 0
+    seen_digests = set()
+    class_counts = {label: 0 for label in CLASS_LABELS}
+    
+    with tempfile.TemporaryDirectory(prefix="texthunter_cleaning_") as spool_dir:
+        spool_paths = {label: os.path.join(spool_dir, f"{label}.jsonl") for label in CLASS_LABELS}
+        # Yakın tekrar kontrolünde örnekler önce girdi sırasıyla tek dosyaya yazılır
+        # (kümenin ilk örneği korunur), sınıf dosyalarına kontrolden sonra ayrılır
+        valid_path = os.path.join(spool_dir, "valid.jsonl")
+        if near_dedup_threshold is None:
+            spools = {label: open(path, 'w', encoding='utf-8') for label, path in spool_paths.items()}
+        else:
+            valid_spool = open(valid_path, 'w', encoding='utf-8')
+            spools = {label: valid_spool for label in CLASS_LABELS}
+        
+        # 1-4. Temizle, boşları at, tekrarları kaldır, doğrula (parça parça)
+        print("\nMetinler temizleniyor, tekrarlar kaldırılıyor ve doğrulanıyor...")
+        def counted(records):
+            nonlocal loaded_count
+            for record in records:
+                loaded_count += 1
+                yield record
+        
+        chunks = iter_chunks(counted(iter_records(input_file, chunk_size)), chunk_size)
+        with tqdm(desc="Temizleme", unit=" örnek") as progress:
+            for cleaned in iter_cleaned_chunks(chunks, workers):
+                cleaned_count += len(cleaned)
+                for digest, label, line in cleaned:
+                    # Tekrar kontrolü doğrulamadan önce yapılır (ilk görülen örnek kalır)
+                    if digest in seen_digests:
+                        continue
+                    seen_digests.add(digest)
+                    unique_count += 1
+                    if label:
+                        class_counts[label] += 1
+                        spools[label].write(line)
+                progress.update(loaded_count - progress.n)
+        for spool in set(spools.values()):
+            spool.close()
+        
+        print(f"Yüklenen örnek sayısı: {loaded_count}")
+        print(f"Temizleme sonrası örnek sayısı: {cleaned_count}")
+        print(f"Tekrar kaldırma sonrası örnek sayısı: {unique_count}")
+        print(f"Doğrulama sonrası örnek sayısı: {sum(class_counts.values())}")
+        
+        if near_dedup_threshold is not None:
+            print(f"\nYakın tekrarlar kaldırılıyor (MinHash/LSH, eşik: {near_dedup_threshold})...")
+            valid_count = sum(class_counts.values())
+            removed, mixed = remove_near_duplicates(valid_path, valid_count, near_dedup_threshold)
+            class_counts = {label: 0 for label in CLASS_LABELS}
+            spools = {label: open(path, 'w', encoding='utf-8') for label, path in spool_paths.items()}
+            for index, item in enumerate(iter_spool(valid_path, valid_count)):
+                if index not in removed:
+                    class_counts[item['label']] += 1
+                    spools[item['label']].write(json.dumps(item, ensure_ascii=False) + "\n")
+            for spool in spools.values():
+                spool.close()
+            print(f"Yakın tekrar kaldırma sonrası örnek sayısı: {sum(class_counts.values())} "
+                  f"({len(removed)} çıkarıldı, farklı etiketli küme: {mixed})")
+        
+        # 5. Veri setini dengele (Human örnekleri, ardından AI örnekleri)
+        print("\nVeri seti dengeleniyor...")
+        print(f"Temizleme öncesi - Human: {class_counts['Human']}, AI: {class_counts['AI']}")
+        min_count = min(class_counts.values())
+        print(f"Temizleme sonrası - Human: {min_count}, AI: {min_count}, Toplam: {min_count * 2}")
+        
+        def balanced():
+            for label in CLASS_LABELS:
+                yield from iter_spool(spool_paths[label], min_count)
+        
+        # 6. Kaydet. İlk geçişte (JSON dışa aktarımı yazılırken) istatistikler ile
+        # kolonlar ve türleri toplanır: tüm anahtarlar, ilk görülme sırasıyla
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        base_path = os.path.join(OUTPUT_DIR, output_file)
+        exports = dataset_exports()
+        written = []
+        column_kinds = {}
+        total_length = 0
+        def balanced_with_stats():
+            nonlocal total_length
+            for item in balanced():
+                update_column_kinds(column_kinds, [item])
+                total_length += len(item.get('text', ''))
+                yield item
+        
+        # JSON formatında kaydet (dışa aktarım)
+        if 'json' in exports:
+            written.append(f"{base_path}.json")
+            _write_json_array(balanced_with_stats(), written[-1])
+        else:
+            deque(balanced_with_stats(), maxlen=0)
+        
+        # Parquet formatında kaydet (birincil format)
+        if parquet_available():
+            written.append(f"{base_path}.parquet")
+            write_parquet(iter_chunks(balanced(), chunk_size), written[-1], arrow_schema(column_kinds))
+        
+        # CSV formatında kaydet (dışa aktarım)
+        if 'csv' in exports:
+            written.append(f"{base_path}.csv")
+            _write_csv(iter_chunks(balanced(), chunk_size), list(column_kinds), written[-1])
     
+    # 7. İstatistikler
     print("\n" + "=" * 60)
     print("TEMİZLEME İSTATİSTİKLERİ")
     print("=" * 60)
-    print(f"Toplam örnek: {len(data)}")
-    print(f"Human: {human_count}")
-    print(f"AI: {ai_count}")
-    print(f"Ortalama metin uzunluğu: {sum(len(item.get('text', '')) for item in data) / len(data):.1f}")
-    
-    # 7. Kaydet
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # JSON formatında kaydet
-    json_path = os.path.join(OUTPUT_DIR, f"{output_file}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # CSV formatında kaydet
-    df = pd.DataFrame(data)
-    csv_path = os.path.join(OUTPUT_DIR, f"{output_file}.csv")
-    df.to_csv(csv_path, index=False, encoding='utf-8')
+    print(f"Toplam örnek: {min_count * 2}")
+    print(f"Human: {min_count}")
+    print(f"AI: {min_count}")
+    print(f"Ortalama metin uzunluğu: {total_length / (min_count * 2):.1f}")
     
     print(f"\nTemizlenmiş veri kaydedildi:")
-    print(f"  - {json_path}")
-    print(f"  - {csv_path}")
+    for path in written:
+        print(f"  - {path}")
 
-def main():
+def main(workers: int = 0, chunk_size: int = CLEAN_CHUNK_SIZE, near_dedup_threshold: Optional[float] = None):
     """
     Ana fonksiyon
     """
@@ -185,18 +437,31 @@ def main():
     print("VERİ TEMİZLEME BAŞLATILIYOR")
     print("=" * 60)
     
-    input_file = os.path.join(INPUT_DIR, "combined_dataset.json")
+    # Parquet, yoksa JSON, yoksa CSV
+    input_file = find_dataset(os.path.join(INPUT_DIR, "combined_dataset"))
     
-    if not os.path.exists(input_file):
-        # CSV dosyasını dene
-        input_file = os.path.join(INPUT_DIR, "combined_dataset.csv")
-        if not os.path.exists(input_file):
-            print(f"HATA: Veri dosyası bulunamadı: {input_file}")
-            print("Lütfen önce veri toplama scriptini çalıştırın.")
-            return
+    if input_file is None:
+        print(f"HATA: Veri dosyası bulunamadı: {os.path.join(INPUT_DIR, 'combined_dataset')}.(parquet|json|csv)")
+        print("Lütfen önce veri toplama scriptini çalıştırın.")
+        return
     
-    process_dataset(input_file, "cleaned_dataset")
+    process_dataset(input_file, "cleaned_dataset", workers, chunk_size, near_dedup_threshold)
 
-if __name__ == "__main__":
-    main()
+def parse_args():
+    parser = argparse.ArgumentParser(description="TextHunter veri temizleme scripti")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Temizleme süreç sayısı (0 = çekirdek sayısı kadar, 1 = tek süreç)")
+    parser.add_argument('--chunk-size', type=int, default=CLEAN_CHUNK_SIZE,
+                        help=f"Parça başına örnek sayısı; bellek kullanımını belirler (varsayılan: {CLEAN_CHUNK_SIZE})")
+    parser.add_argument('--near-dedup', type=float, nargs='?', const=NEAR_DUPLICATE_THRESHOLD, default=None,
+                        metavar='ESİK',
+                        help=f"Yakın tekrarları da (MinHash/LSH) kaldır; Jaccard eşiği, 0-1 "
+                             f"(değer verilmezse: {NEAR_DUPLICATE_THRESHOLD})")
+    args = parser.parse_args()
+    if args.near_dedup is not None and not 0 < args.near_dedup <= 1:
+        parser.error("--near-dedup eşiği 0 ile 1 arasında olmalı")
+    return args
 
+if __name__ == "__main__":
+    args = parse_args()
+    main(args.workers, args.chunk_size, args.near_dedup)
@@ -6,14 +6,13 @@ Veri Seti Toplama Scripti
 """
 
 import os
-import json
 import time
 import arxiv
-import pandas as pd
 from datetime import datetime
 from tqdm import tqdm
 import google.generativeai as genai
 from typing import List, Dict
+from dataset_io import save_dataset
 
 # Yapılandırma
 ARXIV_COUNT = 3000  # İnsan yazımı makale sayısı
@@ -198,22 +197,10 @@ def generate_ai_texts(count: int = 3000, api_key: str = "") -> List[Dict]:
 
 def save_data(data: List[Dict], filename: str):
     """
-    Veriyi JSON ve CSV formatında kaydeder
+    Veriyi Parquet formatında (ve DATASET_EXPORTS ile JSON/CSV olarak) kaydeder
     """
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # JSON formatında kaydet
-    json_path = os.path.join(OUTPUT_DIR, f"{filename}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # CSV formatında kaydet
-    df = pd.DataFrame(data)
-    csv_path = os.path.join(OUTPUT_DIR, f"{filename}.csv")
-    df.to_csv(csv_path, index=False, encoding='utf-8')
-    
-    print(f"Veri kaydedildi: {json_path}")
-    print(f"Veri kaydedildi: {csv_path}")
+    for path in save_dataset(data, os.path.join(OUTPUT_DIR, filename)):
+        print(f"Veri kaydedildi: {path}")
 
 def main():
     """
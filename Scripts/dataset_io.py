@@ -0,0 +1,250 @@
+"""
+Veri Seti Dosya Formatları
+- Birincil format: sıkıştırılmış, kolon bazlı Parquet (pyarrow)
+- JSON (indent=2) ve CSV isteğe bağlı dışa aktarımlardır (DATASET_EXPORTS, varsayılan: kapalı)
+- Okuyucular yalnızca gereken kolonları okuyabilir (örn. etiket sayımı için metin okunmaz)
+
+Veri setleri uzantısız temel yol ile adlandırılır: "../Data/raw/combined_dataset"
+-> combined_dataset.parquet (+ istenirse combined_dataset.json, combined_dataset.csv)
+"""
+
+import os
+import json
+import math
+import numbers
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Parquet'in yanında yazılan dışa aktarımlar (virgülle ayrılmış: json, csv; boş = yalnızca Parquet)
+DATASET_EXPORTS = os.getenv("DATASET_EXPORTS", "")
+PARQUET_COMPRESSION = "zstd"
+# Okuma sırası: önce Parquet, yoksa JSON, yoksa CSV
+DATASET_FORMATS = ['parquet', 'json', 'csv']
+# Parquet'ten akış halinde okunurken bir seferde okunan satır sayısı
+READ_BATCH_SIZE = 10000
+
+_warned_missing_pyarrow = False
+
+def parquet_available() -> bool:
+    return pq is not None
+
+def _warn_missing_pyarrow():
+    global _warned_missing_pyarrow
+    if not _warned_missing_pyarrow:
+        print("⚠ pyarrow kurulu değil; veri setleri Parquet yerine JSON/CSV olarak kaydedilir "
+              "(pip install pyarrow)")
+        _warned_missing_pyarrow = True
+
+def dataset_exports(exports: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Parquet'e ek olarak yazılacak formatlar. pyarrow yoksa JSON her zaman yazılır.
+    """
+    if exports is None:
+        exports = [name.strip().lower() for name in DATASET_EXPORTS.split(',')]
+    exports = [name for name in exports if name in ('json', 'csv')]
+    if not parquet_available() and 'json' not in exports:
+        exports.insert(0, 'json')
+    return exports
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _value_kind(value) -> str:
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, numbers.Integral):
+        return 'int'
+    if isinstance(value, numbers.Real):
+        return 'float'
+    if isinstance(value, str):
+        return 'str'
+    return 'other'
+
+def update_column_kinds(column_kinds: Dict[str, set], records: Iterable[Dict]) -> Dict[str, set]:
+    """
+    Kolon adı -> görülen değer türleri (ilk görülme sırasıyla). Parça parça yazılan
+    veri setlerinde şema tüm parçalar görülerek belirlenir.
+    """
+    for record in records:
+        for key, value in record.items():
+            kinds = column_kinds.setdefault(key, set())
+            if not _is_missing(value):
+                kinds.add(_value_kind(value))
+    return column_kinds
+
+def arrow_schema(column_kinds: Dict[str, set]):
+    """
+    Kolon türlerinden Arrow şeması: tamamen bool/int/float kolonlar sayısal kalır,
+    diğer her şey (karışık türler, liste/sözlük) metin olarak saklanır
+    """
+    fields = []
+    for name, kinds in column_kinds.items():
+        if kinds and kinds <= {'bool'}:
+            field_type = pa.bool_()
+        elif kinds and kinds <= {'int'}:
+            field_type = pa.int64()
+        elif kinds and kinds <= {'int', 'float'}:
+            field_type = pa.float64()
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+def _to_string(value) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+def records_to_table(records: List[Dict], schema):
+    arrays = []
+    for field in schema:
+        values = [record.get(field.name) for record in records]
+        values = [None if _is_missing(value) else value for value in values]
+        if pa.types.is_string(field.type):
+            values = [None if value is None else _to_string(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def write_parquet(chunks: Iterable[List[Dict]], path: str, schema):
+    """
+    Kayıt parçalarını tek Parquet dosyasına yazar (her parça bir satır grubu).
+    Dosya önce geçici adla yazılır, bitince yerine konur.
+    """
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, schema, compression=PARQUET_COMPRESSION) as writer:
+        for chunk in chunks:
+            if chunk:
+                writer.write_table(records_to_table(chunk, schema))
+    os.replace(tmp_path, path)
+
+def save_dataset(data: List[Dict], base_path: str, exports: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Veri setini Parquet (birincil) ve DATASET_EXPORTS içindeki formatlarda kaydeder.
+    Dışa aktarımlardaki hatalar kaydı durdurmaz.
+    Dönüş: yazılan dosya yolları
+    """
+    directory = os.path.dirname(base_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    written = []
+
+    if parquet_available():
+        path = f"{base_path}.parquet"
+        write_parquet([data], path, arrow_schema(update_column_kinds({}, data)))
+        written.append(path)
+    else:
+        _warn_missing_pyarrow()
+
+    for export in dataset_exports(exports):
+        path = f"{base_path}.{export}"
+        try:
+            if export == 'json':
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            else:
+                pd.DataFrame(data).to_csv(path, index=False, encoding='utf-8')
+            written.append(path)
+        except Exception as e:
+            print(f"⚠ {export.upper()} kaydı yapılamadı: {e}")
+    return written
+
+def find_dataset(base_path: str) -> Optional[str]:
+    """
+    Veri setinin okunacak dosyası (Parquet > JSON > CSV); yoksa None.
+    Uzantılı yol verilirse ve dosya varsa doğrudan o döner.
+    """
+    if os.path.splitext(base_path)[1].lstrip('.') in DATASET_FORMATS + ['jsonl'] and os.path.exists(base_path):
+        return base_path
+    for extension in DATASET_FORMATS:
+        if extension == 'parquet' and not parquet_available():
+            continue
+        path = f"{base_path}.{extension}"
+        if os.path.exists(path):
+            return path
+    return None
+
+def _require_dataset(base_path: str) -> str:
+    path = find_dataset(base_path)
+    if path is None:
+        raise FileNotFoundError(f"Veri seti bulunamadı: {base_path}.({'|'.join(DATASET_FORMATS)})")
+    return path
+
+def dataset_columns(base_path: str) -> List[str]:
+    """
+    Kolon adları (Parquet'te yalnızca dosya şeması okunur)
+    """
+    path = _require_dataset(base_path)
+    if path.endswith('.parquet'):
+        return pq.read_schema(path).names
+    if path.endswith('.csv'):
+        return list(pd.read_csv(path, nrows=0).columns)
+    return list(load_dataset(path).columns)
+
+def dataset_row_count(base_path: str) -> int:
+    """
+    Satır sayısı (Parquet'te yalnızca dosya üst verisi okunur)
+    """
+    path = _require_dataset(base_path)
+    if path.endswith('.parquet'):
+        return pq.ParquetFile(path).metadata.num_rows
+    if path.endswith('.csv'):
+        return len(pd.read_csv(path, encoding='utf-8', usecols=[0]))
+    return len(load_dataset(path, columns=[]))
+
+def load_dataset(base_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Veri setini DataFrame olarak yükler. columns verilirse yalnızca bu kolonlar
+    okunur (dosyada olmayanlar atlanır); Parquet ve CSV diğer kolonları hiç ayrıştırmaz.
+    """
+    path = _require_dataset(base_path)
+    if path.endswith('.parquet'):
+        if columns is not None:
+            columns = [name for name in columns if name in pq.read_schema(path).names]
+        return pq.read_table(path, columns=columns).to_pandas()
+    if path.endswith('.csv'):
+        usecols = None if columns is None else (lambda name: name in columns)
+        return pd.read_csv(path, encoding='utf-8', usecols=usecols)
+
+    df = pd.DataFrame(list(iter_dataset_records(path)))
+    if columns is not None:
+        df = df[[name for name in columns if name in df.columns]]
+    return df
+
+def iter_dataset_records(path: str, batch_size: int = READ_BATCH_SIZE) -> Iterator[Dict]:
+    """
+    Dosyadaki kayıtları sözlük olarak döndürür. Parquet satır grupları akış halinde
+    okunur; boş (null) alanlar kayda eklenmez, böylece JSON'daki kayıtlarla aynı kalır.
+    """
+    if path.endswith('.parquet'):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            for row in batch.to_pylist():
+                yield {key: value for key, value in row.items() if value is not None}
+    elif path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+    elif path.endswith('.csv'):
+        for df in pd.read_csv(path, encoding='utf-8', chunksize=batch_size):
+            yield from df.to_dict('records')
+    else:
+        raise ValueError(f"Desteklenmeyen dosya formatı: {path}")
+
+def load_records(base_path: str) -> List[Dict]:
+    """
+    Veri setini kayıt listesi olarak yükler (Parquet > JSON > CSV)
+    """
+    return list(iter_dataset_records(_require_dataset(base_path)))
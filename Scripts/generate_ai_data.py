@@ -1,6 +1,6 @@
 """
 Sadece AI Verilerini Üretme Scripti (Optimize Edilmiş Versiyon)
-- Mevcut human_abstracts.json dosyasını okur
+- Mevcut human_abstracts veri setini (Parquet/JSON/CSV) okur
 - Gemini AI ile 3000 AI yazımı metin üretir
 - Stabilite için worker sayısı düşürüldü ve bekleme süreleri optimize edildi
 """
@@ -13,6 +13,8 @@ from datetime import datetime
 from tqdm import tqdm
 import google.generativeai as genai
 from typing import List, Dict
+from dataset_io import save_dataset, find_dataset, load_records, load_dataset
+from checkpoint_journal import CheckpointJournal
 import threading
 import random
 import sys
@@ -37,16 +39,18 @@ AI_COUNT = 1000  # Mevcut AI verilerinin üzerine 1000 ek veri çekilecek
 # Ortam değişkeninden ayarlanabilir: $env:DAILY_BATCH_SIZE=50
 DAILY_BATCH_SIZE = int(os.getenv("DAILY_BATCH_SIZE", "50"))  # Günlük çekilecek veri sayısı
 OUTPUT_DIR = "../Data/raw"
-INPUT_FILE = os.path.join(OUTPUT_DIR, "human_abstracts.json")
+INPUT_FILE = os.path.join(OUTPUT_DIR, "human_abstracts")  # Uzantısız: Parquet > JSON > CSV
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.json")
+# Ekleme odaklı JSON-lines checkpoint günlüğü (eski tek parça .json ilk yüklemede taşınır)
+CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.jsonl")
+LEGACY_CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.json")
 DIVERSE_PROMPTS_FILE = os.path.join(OUTPUT_DIR, "diverse_prompts.csv")  # Çeşitli promptlar
 
 # OPTİMİZASYON AYARLARI
 # Hızlı veri toplama için optimize edilmiş
 MAX_WORKERS = 1  # 1 thread - quota korunması için (güvenli)
 # Not: 2 worker yaparsanız daha hızlı olur ama quota 2x hızla tükenir
-CHECKPOINT_INTERVAL = 10 # Veri kaybını önlemek için daha sık kayıt
+CHECKPOINT_INTERVAL = 10 # Her kayıt günlüğe hemen eklenir; bu kadar kayıtta bir fsync yapılır
 
 # HIZ AYARLARI (Optimize edilmiş - daha hızlı veri toplama)
 # Gemini API limitleri: ~15 istek/dakika (ücretsiz), ~60 istek/dakika (ücretli)
@@ -59,14 +63,16 @@ MIN_REQUEST_INTERVAL = 12.0  # 12 saniye (5 istek/dakika - hızlı ama güvenli)
 # Not: Script otomatik olarak quota hatası durumunda 5 dakika bekleyip tekrar deneyecek
 # Eğer quota hatası alırsanız, bu değeri 15.0 veya 20.0 yapabilirsiniz 
 
+checkpoint = CheckpointJournal(CHECKPOINT_FILE, sync_every=CHECKPOINT_INTERVAL, legacy_path=LEGACY_CHECKPOINT_FILE)
+
 def load_human_abstracts() -> List[Dict]:
-    if not os.path.exists(INPUT_FILE):
-        print(f"⚠ UYARI: {INPUT_FILE} dosyası bulunamadı!")
+    input_path = find_dataset(INPUT_FILE)
+    if input_path is None:
+        print(f"⚠ UYARI: {INPUT_FILE} veri seti bulunamadı!")
         return []
     
-    print(f"Mevcut human verileri yükleniyor: {INPUT_FILE}")
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        human_data = json.load(f)
+    print(f"Mevcut human verileri yükleniyor: {input_path}")
+    human_data = load_records(INPUT_FILE)
     print(f"✓ {len(human_data)} adet human verisi yüklendi")
     return human_data
 
@@ -351,7 +357,6 @@ def generate_ai_texts(count: int = 3000, api_key: str = "", max_workers: int = 2
     
     # BASİT DÖNGÜ YAKLAŞIMI
     new_added_count = 0
-    last_save_count = len(ai_texts)
     last_request_time = 0.0
     
     with tqdm(total=count, initial=0, desc="Yeni AI Üretimi") as pbar:
@@ -413,18 +418,14 @@ def generate_ai_texts(count: int = 3000, api_key: str = "", max_workers: int = 2
                                 "generated_date": datetime.now().isoformat()
                             }
                             ai_texts.append(result)
+                            # Kayıt başına sabit maliyet: yalnızca yeni satır eklenir
+                            checkpoint.append(result)
                             existing_texts.add(generated_text)
                             new_added_count += 1
                             pbar.update(1)
                             retry_count = 0  # Başarılı, retry sayacını sıfırla
                             
                             print(f"[DEBUG] ✓ Başarılı! ({len(generated_text)} karakter)")
-                            
-                            # Düzenli kayıt
-                            if len(ai_texts) - last_save_count >= CHECKPOINT_INTERVAL:
-                                save_checkpoint(ai_texts)
-                                last_save_count = len(ai_texts)
-                                print(f"[DEBUG] Checkpoint kaydedildi: {len(ai_texts)} adet")
                         else:
                             print(f"[DEBUG] ⚠ Duplicate bulundu, bir sonraki prompt'a geçiliyor...")
                             retry_count = 0  # Duplicate için retry yok, direkt geç
@@ -478,9 +479,8 @@ def generate_ai_texts(count: int = 3000, api_key: str = "", max_workers: int = 2
                     time.sleep(wait_time)
                     continue  # Aynı prompt'u tekrar dene
     
-    # Final kayıt
-    if len(ai_texts) > last_save_count:
-        save_checkpoint(ai_texts)
+    # Bekleyen kayıtları diske yaz (fsync)
+    checkpoint.close()
     
     print(f"\n✓ Mevcut AI verileri: {existing_count} adet")
     print(f"✓ Yeni eklenen AI verileri: {new_added_count} adet")
@@ -491,62 +491,46 @@ def generate_ai_texts(count: int = 3000, api_key: str = "", max_workers: int = 2
     return ai_texts
 
 def save_data(data: List[Dict], filename: str):
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # JSON
-    json_path = os.path.join(OUTPUT_DIR, f"{filename}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # CSV (Opsiyonel, hata verirse program durmasın)
-    try:
-        df = pd.DataFrame(data)
-        csv_path = os.path.join(OUTPUT_DIR, f"{filename}.csv")
-        df.to_csv(csv_path, index=False, encoding='utf-8')
-    except Exception as e:
-        print(f"CSV kaydı yapılamadı: {e}")
-        
+    # Parquet + DATASET_EXPORTS (JSON/CSV dışa aktarımlarındaki hatalar programı durdurmaz)
+    save_dataset(data, os.path.join(OUTPUT_DIR, filename))
     print(f"✓ {filename} başarıyla kaydedildi.")
 
 def load_checkpoint() -> List[Dict]:
     """
     Mevcut AI verilerini yükler. Öncelik sırası:
     1. Checkpoint dosyası
-    2. ai_abstracts.json
-    3. combined_dataset.csv'den AI verileri (eğer varsa)
+    2. ai_abstracts veri seti (Parquet/JSON/CSV)
+    3. combined_dataset'ten AI verileri (eğer varsa)
     """
-    # 1. Önce checkpoint dosyasını kontrol et
-    if os.path.exists(CHECKPOINT_FILE):
+    # 1. Önce checkpoint günlüğünü kontrol et
+    if os.path.exists(CHECKPOINT_FILE) or os.path.exists(LEGACY_CHECKPOINT_FILE):
         try:
-            with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data:
-                    print(f"✓ Checkpoint yüklendi: {len(data)} adet mevcut veri bulundu")
-                return data
+            data = checkpoint.load()
+            if data:
+                print(f"✓ Checkpoint yüklendi: {len(data)} adet mevcut veri bulundu")
+            return data
         except Exception as e:
             print(f"⚠ Checkpoint yüklenirken hata: {e}")
     
-    # 2. Checkpoint yoksa, mevcut ai_abstracts.json'dan yükle (eğer varsa)
-    ai_abstracts_file = os.path.join(OUTPUT_DIR, "ai_abstracts.json")
-    if os.path.exists(ai_abstracts_file):
+    # 2. Checkpoint yoksa, mevcut ai_abstracts veri setinden yükle (eğer varsa)
+    ai_abstracts_file = find_dataset(os.path.join(OUTPUT_DIR, "ai_abstracts"))
+    if ai_abstracts_file:
         try:
-            with open(ai_abstracts_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data:
-                    print(f"✓ Mevcut AI verileri yüklendi: {len(data)} adet (ai_abstracts.json'dan)")
-                    # Checkpoint dosyasını geri oluştur
-                    save_checkpoint(data)
-                    print(f"✓ Checkpoint dosyası geri oluşturuldu")
-                return data
+            data = load_records(ai_abstracts_file)
+            if data:
+                print(f"✓ Mevcut AI verileri yüklendi: {len(data)} adet ({os.path.basename(ai_abstracts_file)}'dan)")
+                # Checkpoint dosyasını geri oluştur
+                save_checkpoint(data)
+                print(f"✓ Checkpoint dosyası geri oluşturuldu")
+            return data
         except Exception as e:
             print(f"⚠ AI verileri yüklenirken hata: {e}")
     
-    # 3. JSON yoksa, combined_dataset.csv'den AI verilerini yükle
-    combined_csv = os.path.join(OUTPUT_DIR, "combined_dataset.csv")
-    if os.path.exists(combined_csv):
+    # 3. AI veri seti yoksa, combined_dataset'ten AI verilerini yükle
+    combined_base = os.path.join(OUTPUT_DIR, "combined_dataset")
+    if find_dataset(combined_base):
         try:
-            import pandas as pd
-            df = pd.read_csv(combined_csv)
+            df = load_dataset(combined_base)
             ai_data = df[df['label'] == 'AI'].to_dict(orient='records')
             if ai_data:
                 # CSV'den gelen verileri JSON formatına çevir
@@ -559,7 +543,7 @@ def load_checkpoint() -> List[Dict]:
                         "prompt": row.get('prompt', ''),
                         "generated_date": row.get('generated_date', '')
                     })
-                print(f"✓ Mevcut AI verileri yüklendi: {len(formatted_data)} adet (combined_dataset.csv'den)")
+                print(f"✓ Mevcut AI verileri yüklendi: {len(formatted_data)} adet (combined_dataset'ten)")
                 # Checkpoint dosyasını oluştur
                 save_checkpoint(formatted_data)
                 print(f"✓ Checkpoint dosyası oluşturuldu")
@@ -570,11 +554,13 @@ def load_checkpoint() -> List[Dict]:
     return []
 
 def save_checkpoint(data: List[Dict]):
+    """
+    Checkpoint günlüğünü verilen listeyle yeniden yazar (atomik; yarıda kalırsa eskisi korunur)
+    """
     try:
-        with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except:
-        pass
+        checkpoint.compact(data)
+    except OSError as e:
+        print(f"⚠ Checkpoint kaydedilemedi: {e}")
 
 def main():
     # 1. Human verilerini kontrol et
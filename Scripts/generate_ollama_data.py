@@ -6,14 +6,17 @@ from datetime import datetime
 from tqdm import tqdm
 import requests
 import concurrent.futures  # Hızın sırrı bu kütüphane
+from checkpoint_journal import CheckpointJournal
 
 # --- AYARLAR ---
 OUTPUT_DIR = "../Data/raw"
-CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.json")
+# Ekleme odaklı JSON-lines checkpoint günlüğü (eski tek parça .json ilk yüklemede taşınır)
+CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.jsonl")
+LEGACY_CHECKPOINT_FILE = os.path.join(OUTPUT_DIR, "ai_abstracts_checkpoint.json")
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
 OLLAMA_MODEL = "llama3.2:1b"  # Hızlı model
 TARGET_DATA_COUNT = 3620
-BATCH_SAVE_INTERVAL = 10
+BATCH_SAVE_INTERVAL = 10  # Her sonuç günlüğe hemen eklenir; bu kadar kayıtta bir fsync yapılır
 MAX_WORKERS = 4  # <-- BURASI ÖNEMLİ: Aynı anda 4 üretim yapacak
 
 # Konular (Senin listenin aynısı)
@@ -100,19 +103,14 @@ TOPICS = {
     ],
 }
 
-def load_checkpoint():
-    if os.path.exists(CHECKPOINT_FILE):
-        try:
-            with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+checkpoint = CheckpointJournal(CHECKPOINT_FILE, sync_every=BATCH_SAVE_INTERVAL, legacy_path=LEGACY_CHECKPOINT_FILE)
 
-def save_checkpoint(data):
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def load_checkpoint():
+    try:
+        return checkpoint.load()
+    except (OSError, ValueError) as e:
+        print(f"⚠ Checkpoint yüklenirken hata: {e}")
+        return []
 
 def generate_single_item(item_data):
     """Tek bir veriyi üretir (Paralel çalışacak fonksiyon)"""
@@ -177,14 +175,12 @@ def main():
                 result = future.result()
                 if result and result['text'] not in existing_texts:
                     ai_texts.append(result)
+                    checkpoint.append(result)
                     existing_texts.add(result['text'])
                     new_count += 1
                     pbar.update(1)
-                    
-                    if len(ai_texts) % BATCH_SAVE_INTERVAL == 0:
-                        save_checkpoint(ai_texts)
 
-    save_checkpoint(ai_texts)
+    checkpoint.close()
     print("Bitti!")
 
 if __name__ == "__main__":
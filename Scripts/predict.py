@@ -1,74 +1,1173 @@
 """
 Python Model Tahmin Scripti
 C# uygulamasından çağrılacak tahmin scripti
+
+Kullanım:
+    python predict.py "metin"            # Tek seferlik tahmin (JSON çıktı)
+    python predict.py --serve            # stdin/stdout JSON-lines sunucu modu
+    python predict.py --http 8765        # Yerel HTTP sunucu modu (POST /predict)
+    python predict.py --batch girdi.jsonl --output sonuc.jsonl   # Toplu tahmin (JSONL/CSV)
+    python predict.py --profile-startup  # Başlangıç süresi dökümü
 """
 
+import time
+
+# --profile-startup için: yorumlayıcının buraya kadar harcadığı CPU süresi ve import başlangıcı
+_PROCESS_CPU_AT_START = time.process_time()
+_IMPORT_START = time.perf_counter()
+
 import sys
 import json
 import os
-import joblib
+import csv
+import threading
+import hashlib
+import mmap
+from collections import deque, OrderedDict
+from functools import lru_cache
+import re
 import numpy as np
 
+# Ağır ve yalnızca belirli modlarda gereken modüller (argparse, http.server,
+# concurrent.futures, joblib, scipy, sklearn) kullanıldıkları fonksiyonda import edilir.
+_IMPORT_END = time.perf_counter()
+
 
 # Model dizini - Script'in bulunduğu dizinden yola çıkarak MLModels klasörünü bul
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)  # Scripts/ klasöründen bir üst dizin (proje root)
 MODEL_DIR = os.path.join(PROJECT_ROOT, "MLModels")
 
+# Servis edilen modeller
+# ensemble: tüm modellerin (Random Forest dahil) oyundan damıtılmış tek doğrusal model
+MODEL_NAMES = ['naive_bayes', 'logistic_regression', 'svm_model', 'ensemble']
+MODEL_FILES = {"svm_model": "svm_model.pkl", "logistic_regression": "logistic_regression.pkl", "naive_bayes": "naive_bayes.pkl",
+               "ensemble": "ensemble.pkl"}
+VECTORIZER_FILE = "tfidf_vectorizer.pkl"
+
+# Eğitim scripti sözlüğü vectorizer pickle'ının yanına sıralı terim dizisi
+# olarak yazar (örn. tfidf_vectorizer.vocab.npy); bu dosya mmap ile açılabilir
+VOCABULARY_SUFFIX = ".vocab.npy"
+
+# Numpy dizileri varsayılan olarak bellek eşlemeli açılır; eşzamanlı
+# tahmin süreçleri aynı sayfa önbelleğini paylaşır
+DEFAULT_MMAP_MODE = 'r'
+
+# Eğitim scriptinin yayımladığı tek parça model paketi: paylaşılan vectorizer, terim
+# dizisi ve tüm modeller tek dosyada; manifest sürümü ve paketin sha256 özetini tutar
+BUNDLE_FILE = "model_bundle.joblib"
+MANIFEST_FILE = "model_manifest.json"
+
+# Eğitim scriptinin dışa aktardığı pickle'sız kompakt model (bkz. train_models.py --export-compact)
+COMPACT_MODEL_FILE = "serving_model.npz"
+
+# Tahmin motoru: auto (kompakt model varsa onu kullan) | compact | sklearn
+PREDICT_ENGINE = os.getenv("PREDICT_ENGINE", "auto")
+
+# --profile-startup için varsayılan örnek metin
+PROFILE_SAMPLE_TEXT = ("This paper presents a novel approach to text classification "
+                       "using machine learning models trained on academic abstracts.")
+
+# Tahmin önbelleği: bellekteki LRU kapasitesi (0 = kapalı) ve isteğe bağlı,
+# süreçler arasında paylaşılan SQLite dosyası (boş = disk katmanı kapalı)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "1024"))
+PREDICTION_CACHE_DB = os.getenv("PREDICTION_CACHE_DB", "")
+
+# Sunucu modlarında MLModels/ dizininin kaç saniyede bir kontrol edileceği (0 = kapalı)
+MODEL_RELOAD_INTERVAL = float(os.getenv("MODEL_RELOAD_INTERVAL", "5"))
+
+# Toplu tahminde tek seferde vektörleştirilecek metin sayısı
+BATCH_CHUNK_SIZE = 1000
+
+# Uzun yaşayan süreçler (sunucu modları) için yüklenmiş modeller
+_loaded_models = None
+_load_lock = threading.Lock()
+_prediction_cache = None
+
+def _model_path(model_name):
+    return os.path.join(MODEL_DIR, MODEL_FILES.get(model_name, f"{model_name}.pkl"))
+
+
+class MmapVocabularyVectorizer:
+    """
+    Sözlüğü Python dict yerine sıralı (mmap'lenebilir) bir terim dizisi olarak
+    tutan vectorizer (UTF-8 baytları). Tokenizasyon ayarları ve idf ağırlıkları eğitimde kaydedilen
+    sklearn vectorizer'ından gelir; terim -> kolon eşlemesi tek bir vektörel
+    np.searchsorted ile yapılır. sklearn sözlüğü alfabetik sıraladığı için
+    terimin dizideki konumu kolon numarasıyla aynıdır.
+    """
+
+    def __init__(self, vectorizer, terms):
+        self.vectorizer = vectorizer
+        self.terms = terms
+        self._analyze = vectorizer.build_analyzer()
+
+    def transform(self, texts):
+        from scipy import sparse
+
+        tokens = []
+        row_lengths = []
+        for text in texts:
+            doc_tokens = self._analyze(text)
+            tokens.extend(doc_tokens)
+            row_lengths.append(len(doc_tokens))
+
+        n_terms = len(self.terms)
+        rows = np.repeat(np.arange(len(row_lengths)), row_lengths)
+        if tokens:
+            token_array = np.array([token.encode('utf-8') for token in tokens])
+            cols = np.minimum(np.searchsorted(self.terms, token_array), n_terms - 1)
+            known = self.terms[cols] == token_array
+            rows, cols = rows[known], cols[known]
+        else:
+            cols = rows
+
+        # Aynı (satır, kolon) çiftleri toplanarak terim sayıları elde edilir
+        counts = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                                   shape=(len(row_lengths), n_terms), dtype=np.float64)
+        counts.sum_duplicates()
+        return self._weight(counts)
+
+    def _weight(self, counts):
+        from sklearn.preprocessing import normalize
+
+        vectorizer = self.vectorizer
+        if vectorizer.binary:
+            counts.data.fill(1)
+        if not hasattr(vectorizer, 'norm'):
+            # CountVectorizer (BoW)
+            return counts.astype(vectorizer.dtype)
+        if vectorizer.sublinear_tf:
+            np.log(counts.data, counts.data)
+            counts.data += 1
+        if vectorizer.use_idf:
+            counts.data *= np.asarray(vectorizer.idf_)[counts.indices]
+        if vectorizer.norm:
+            counts = normalize(counts, norm=vectorizer.norm, copy=False)
+        return counts.astype(vectorizer.dtype, copy=False)
+
+
+def load_vectorizer(mmap_mode=DEFAULT_MMAP_MODE, vectorizer_path=None):
+    """
+    Vectorizer'ı yükler. Yanında sıralı terim dizisi (.vocab.npy) varsa
+    sözlük bu diziden mmap ile açılır.
+    """
+    import joblib
+
+    vectorizer_path = vectorizer_path or os.path.join(MODEL_DIR, VECTORIZER_FILE)
+    vectorizer = joblib.load(vectorizer_path, mmap_mode=mmap_mode)
+    vocabulary_path = os.path.splitext(vectorizer_path)[0] + VOCABULARY_SUFFIX
+    if os.path.exists(vocabulary_path):
+        return MmapVocabularyVectorizer(vectorizer, np.load(vocabulary_path, mmap_mode=mmap_mode))
+    return vectorizer
+
+
 def load_model(model_name):
-    mapping = {"svm_model": "svm_model.pkl", "logistic_regression": "logistic_regression.pkl", "naive_bayes": "naive_bayes.pkl"}
-    file_name = mapping.get(model_name, f"{model_name}.pkl")
-    model_path = os.path.join(MODEL_DIR, file_name)
-    vectorizer_path = os.path.join(MODEL_DIR, "tfidf_vectorizer.pkl")
-    
+    import joblib
+
+    model_path = _model_path(model_name)
     if not os.path.exists(model_path): return None, None
-    return joblib.load(model_path), joblib.load(vectorizer_path)
-  
-    
-   
+    return joblib.load(model_path, mmap_mode=DEFAULT_MMAP_MODE), load_vectorizer()
+
+
+def load_compact_model(path=None):
+    """
+    train_models.py --export-compact ile yazılan pickle'sız modeli yükler.
+    Dosya yalnızca numpy dizileri ve bir JSON yapılandırması içerir; yükleme
+    ve tahmin için sklearn/scipy/joblib import edilmez.
+    """
+    path = path or os.path.join(MODEL_DIR, COMPACT_MODEL_FILE)
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    config = json.loads(str(arrays['config']))
+    return {
+        'config': config,
+        'terms': arrays['terms'],
+        'idf': arrays['idf'],
+        'stop_words': frozenset(word.decode('utf-8') for word in arrays['stop_words']),
+        'token_pattern': re.compile(config['token_pattern']),
+        'weights': arrays['weights'],
+        'bias': arrays['bias'],
+        'models': {model['name']: model for model in config['models']},
+    }
+
+
+def file_sha256(path):
+    """
+    Dosyanın sha256 özeti (dosya bellek eşlemeli okunur)
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+    return digest.hexdigest()
+
+
+def load_manifest():
+    manifest_path = os.path.join(MODEL_DIR, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_bundle(mmap_mode=DEFAULT_MMAP_MODE, manifest=None):
+    """
+    train_models.py'nin yayımladığı model paketini tek okumada yükler.
+    Paket manifest'teki sha256 özetiyle doğrulanır; özet tutmazsa (yarım yazılmış
+    veya değiştirilmiş dosya) ValueError fırlatılır.
+    Dönüş: {'vectorizer': vectorizer, 'models': {model_adı: model}, 'manifest': manifest}
+    """
+    import joblib
+
+    manifest = manifest or load_manifest()
+    bundle_path = os.path.join(MODEL_DIR, manifest['bundle']['file'])
+    digest = file_sha256(bundle_path)
+    if digest != manifest['bundle']['sha256']:
+        raise ValueError(f"Model paketi bütünlük kontrolünden geçemedi: {bundle_path} "
+                         f"(beklenen {manifest['bundle']['sha256'][:12]}, bulunan {digest[:12]})")
+    bundle = joblib.load(bundle_path, mmap_mode=mmap_mode)
+    vectorizer = bundle['vectorizer']
+    if bundle.get('terms') is not None:
+        vectorizer = MmapVocabularyVectorizer(vectorizer, bundle['terms'])
+    return {'vectorizer': vectorizer, 'models': bundle['models'], 'manifest': manifest}
+
+
+def _use_compact_engine():
+    if PREDICT_ENGINE == 'compact':
+        return True
+    return PREDICT_ENGINE == 'auto' and os.path.exists(os.path.join(MODEL_DIR, COMPACT_MODEL_FILE))
+
+
+def _load_sklearn_models(mmap_mode):
+    """
+    Model paketi (manifest) varsa onu, yoksa ayrı model dosyalarını yükler
+    """
+    import joblib
+
+    manifest = load_manifest()
+    if manifest is not None:
+        bundle = load_bundle(mmap_mode, manifest)
+        models = {name: bundle['models'][name] for name in MODEL_NAMES if name in bundle['models']}
+        return {'vectorizer': bundle['vectorizer'], 'models': models, 'manifest': manifest}
+
+    models = {}
+    for model_name in MODEL_NAMES:
+        model_path = _model_path(model_name)
+        if os.path.exists(model_path):
+            models[model_name] = joblib.load(model_path, mmap_mode=mmap_mode)
+    # Vectorizer tüm modellerce paylaşılır, diskten yalnızca bir kez okunur
+    vectorizer = load_vectorizer(mmap_mode) if models else None
+    return {'vectorizer': vectorizer, 'models': models}
+
+
+def _load_model_set(mmap_mode=DEFAULT_MMAP_MODE):
+    """
+    Seçili motorun modellerini diskten yükler (önbelleğe almadan)
+    """
+    # Sürüm yüklemeden önce okunur; yükleme sırasında dosya değişirse
+    # sonraki sürüm kontrolü yine farklı görür
+    version = artifact_version()
+    if _use_compact_engine():
+        compact = load_compact_model()
+        loaded = {'compact': compact, 'models': compact['models']}
+    else:
+        loaded = _load_sklearn_models(mmap_mode)
+    loaded['version'] = version
+    return loaded
+
+
+def load_models(mmap_mode=DEFAULT_MMAP_MODE):
+    """
+    Ortak TF-IDF vectorizer'ı ve tüm modelleri bir kez yükler, süreç boyunca saklar.
+    Kompakt model (serving_model.npz) varsa pickle'lar yerine o kullanılır.
+    mmap_mode='r' (varsayılan) ile numpy dizileri kopyalanmak yerine dosyadan
+    bellek eşlemeli açılır; aynı dosyayı açan süreçler tek sayfa önbelleğini paylaşır.
+    Çağıranlar dönen sözlüğü istek boyunca tutmalıdır; sıcak yeniden yükleme
+    (start_model_watcher) yeni bir sözlüğü yerine koyar, eskisini değiştirmez.
+    Dönüş: {'vectorizer': vectorizer, 'models': {model_adı: model}, 'version': sürüm}
+           veya {'compact': kompakt_model, 'models': {model_adı: model_bilgisi}, 'version': sürüm}
+    """
+    global _loaded_models
+    with _load_lock:
+        if _loaded_models is None:
+            _loaded_models = _load_model_set(mmap_mode)
+    return _loaded_models
+
+
+def reload_models_if_changed(mmap_mode=DEFAULT_MMAP_MODE):
+    """
+    Model dosyalarının sürümü yüklü sürümden farklıysa yeni seti arka planda
+    (kilit dışında) yükler, tamamen yüklendikten sonra tek atamayla yerine koyar.
+    Süren istekler eski seti kullanarak tamamlanır.
+    Dönüş: yeni set yüklendiyse True
+    """
+    global _loaded_models
+    current = _loaded_models
+    if current is None or artifact_version() == current['version']:
+        return False
+    loaded = _load_model_set(mmap_mode)
+    if artifact_version() != loaded['version'] or not loaded['models']:
+        # Yükleme sırasında dosyalar yine değişti (eğitim sürüyor) veya set eksik; sonraki turda tekrar dene
+        return False
+    with _load_lock:
+        _loaded_models = loaded
+    return True
+
+
+def start_model_watcher(interval=MODEL_RELOAD_INTERVAL, mmap_mode=DEFAULT_MMAP_MODE):
+    """
+    Uzun yaşayan süreçlerde (sunucu modları) MLModels/ dizinini izleyen arka plan
+    iş parçacığını başlatır. Sürüm iki ardışık kontrolde aynı kalınca (dosyalar
+    yazılıp bitince) yeni modeller yüklenir. interval <= 0 ise izleme kapalıdır.
+    """
+    if interval <= 0:
+        return None
+
+    def watch():
+        pending_version = None
+        while True:
+            time.sleep(interval)
+            try:
+                version = artifact_version()
+                current = _loaded_models
+                if current is None or version == current['version']:
+                    pending_version = None
+                    continue
+                if version != pending_version:
+                    # Değişiklik ilk kez görüldü; yazım bitsin diye bir tur bekle
+                    pending_version = version
+                    continue
+                previous = current['version']
+                start = time.perf_counter()
+                if reload_models_if_changed(mmap_mode):
+                    print(f"Yeni modeller yüklendi: {previous} -> {_loaded_models['version']} "
+                          f"({time.perf_counter() - start:.2f} sn)", file=sys.stderr, flush=True)
+                pending_version = None
+            except Exception as e:
+                # Hatalı/yarım dosyada eski modellerle hizmete devam edilir
+                print(f"Model yeniden yükleme hatası: {e}", file=sys.stderr, flush=True)
+
+    watcher = threading.Thread(target=watch, name="model-watcher", daemon=True)
+    watcher.start()
+    return watcher
+
+
+def _artifact_paths():
+    """
+    Seçili motorun okuduğu model dosyaları
+    """
+    if _use_compact_engine():
+        return [os.path.join(MODEL_DIR, COMPACT_MODEL_FILE)]
+    manifest_path = os.path.join(MODEL_DIR, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        # Manifest en son yazılır; paketle birlikte sürümü belirler
+        return [manifest_path, os.path.join(MODEL_DIR, BUNDLE_FILE)]
+    vectorizer_path = os.path.join(MODEL_DIR, VECTORIZER_FILE)
+    return ([_model_path(name) for name in MODEL_NAMES]
+            + [vectorizer_path, os.path.splitext(vectorizer_path)[0] + VOCABULARY_SUFFIX])
+
+
+def artifact_version():
+    """
+    Model dosyalarının (ad, boyut, değiştirilme zamanı) özetinden kısa bir sürüm
+    kimliği üretir. Modelleri yüklemeden yalnızca stat ile hesaplanır.
+    """
+    digest = hashlib.sha256(('compact' if _use_compact_engine() else 'sklearn').encode('utf-8'))
+    for path in _artifact_paths():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def normalize_text(text):
+    """
+    Önbellek anahtarı için metni normalleştirir: baş/son boşluklar atılır, ardışık
+    boşluklar tek boşluğa indirilir. Tokenizasyon boşlukları ayraç olarak
+    kullandığından tahmin sonucu değişmez.
+    """
+    return ' '.join(text.split())
+
+
+class PredictionCache:
+    """
+    İçerik adresli tahmin önbelleği.
+    Anahtar: sha256(model sürümü + normalleştirilmiş metin). Model dosyaları
+    değişince sürüm de değişir, eski kayıtlar kendiliğinden geçersiz olur.
+    Bellekte LRU (capacity kayıt), isteğe bağlı olarak süreçler arası paylaşılan
+    bir SQLite dosyası. Sonuçlar JSON metni olarak saklanır; her isabette
+    çağırana yeni bir sözlük döner.
+    """
+
+    def __init__(self, capacity=PREDICTION_CACHE_SIZE, db_path=PREDICTION_CACHE_DB):
+        self.capacity = max(0, capacity)
+        self.db_path = db_path or None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+    @staticmethod
+    def make_key(text, version):
+        return hashlib.sha256(f"{version}\0{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+    def _connection(self):
+        if self._db is None:
+            import sqlite3
+
+            self._db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS predictions (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+            self._db.commit()
+        return self._db
+
+    def _remember(self, key, payload):
+        if not self.capacity:
+            return
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(payload)
+            if self.db_path:
+                row = self._connection().execute(
+                    "SELECT result FROM predictions WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        payload = json.dumps(result)
+        with self._lock:
+            self._remember(key, payload)
+            if self.db_path:
+                db = self._connection()
+                db.execute("INSERT OR REPLACE INTO predictions (key, result) VALUES (?, ?)", (key, payload))
+                db.commit()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'capacity': self.capacity,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'disk': self.db_path,
+            }
+
+
+def get_prediction_cache():
+    """
+    Süreç genelindeki tahmin önbelleğini döndürür (ilk çağrıda oluşturulur)
+    """
+    global _prediction_cache
+    with _load_lock:
+        if _prediction_cache is None:
+            _prediction_cache = PredictionCache()
+    return _prediction_cache
+
+
+def _cache_enabled():
+    return PREDICTION_CACHE_SIZE > 0 or bool(PREDICTION_CACHE_DB)
+
+
+def _compact_features(texts, compact):
+    """
+    Metinleri eğitimdeki TfidfVectorizer ile aynı şekilde tokenize edip
+    ağırlıklandırır. Dönüş: (satırlar, kolonlar, değerler) seyrek üçlüsü
+    """
+    config = compact['config']
+    pattern = compact['token_pattern']
+    stop_words = compact['stop_words']
+    terms = compact['terms']
+
+    tokens = []
+    row_lengths = []
+    for text in texts:
+        if config['lowercase']:
+            text = text.lower()
+        doc_tokens = [token for token in pattern.findall(text) if token not in stop_words]
+        tokens.extend(token.encode('utf-8') for token in doc_tokens)
+        row_lengths.append(len(doc_tokens))
+
+    rows = np.repeat(np.arange(len(row_lengths)), row_lengths)
+    if not tokens:
+        return rows, rows, np.zeros(0)
+
+    if config.get('feature_space') == 'hashing':
+        n_features = config['n_features']
+        cols = np.fromiter((_hash_bucket(token, n_features) for token in tokens),
+                           dtype=np.int64, count=len(tokens))
+    else:
+        n_features = len(terms)
+        token_array = np.array(tokens)
+        cols = np.minimum(np.searchsorted(terms, token_array), n_features - 1)
+        known = terms[cols] == token_array
+        rows, cols = rows[known], cols[known]
+    # Aynı (satır, kolon) çiftleri sayılarak terim frekansları bulunur
+    keys, counts = np.unique(rows * n_features + cols, return_counts=True)
+    rows, cols = keys // n_features, keys % n_features
+    values = np.ones(len(keys)) if config['binary'] else counts.astype(np.float64)
+
+    if config['sublinear_tf']:
+        values = np.log(values) + 1
+    if config['use_idf']:
+        values *= compact['idf'][cols]
+    if config['norm'] == 'l2':
+        values /= np.sqrt(np.bincount(rows, values * values))[rows]
+    elif config['norm'] == 'l1':
+        values /= np.bincount(rows, np.abs(values))[rows]
+    return rows, cols, values
+
+
+def murmurhash3_32(data, seed=0):
+    """
+    MurmurHash3 (x86, 32 bit, işaretli) - sklearn.utils.murmurhash3_32 ile aynı sonuç.
+    Hashing uzayındaki kompakt model sklearn import etmeden tokenları kovalara böler.
+    """
+    c1, c2, mask = 0xcc9e2d51, 0x1b873593, 0xffffffff
+    length = len(data)
+    h = seed & mask
+    rounded = length & ~3
+    for i in range(0, rounded, 4):
+        k = data[i] | (data[i + 1] << 8) | (data[i + 2] << 16) | (data[i + 3] << 24)
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+        h = ((h << 13) | (h >> 19)) & mask
+        h = (h * 5 + 0xe6546b64) & mask
+
+    tail = length & 3
+    if tail:
+        k = 0
+        if tail == 3:
+            k ^= data[rounded + 2] << 16
+        if tail >= 2:
+            k ^= data[rounded + 1] << 8
+        k ^= data[rounded]
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+
+    h ^= length
+    h ^= h >> 16
+    h = (h * 0x85ebca6b) & mask
+    h ^= h >> 13
+    h = (h * 0xc2b2ae35) & mask
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash_bucket(token, n_features):
+    # HashingVectorizer(alternate_sign=False) kolon numarası
+    return abs(murmurhash3_32(token)) % n_features
+
+
+def _compact_scores(texts, compact):
+    """
+    Tüm modellerin ham skorları: X @ W + b (W tüm modellerin yığılmış ağırlıkları)
+    """
+    rows, cols, values = _compact_features(texts, compact)
+    return _compact_dot(rows, cols, values, len(texts), compact)
+
+
+def _compact_dot(rows, cols, values, n_rows, compact):
+    # Seyrek satırlar (satır sıralı üçlüler) ile yoğun ağırlık matrisinin çarpımı
+    scores = np.tile(compact['bias'], (n_rows, 1))
+    if len(values):
+        contributions = compact['weights'][cols] * values[:, None]
+        row_starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        scores[rows[row_starts]] += np.add.reduceat(contributions, row_starts, axis=0)
+    return scores
+
+
+def _svc_platt_probabilities(decision, a, b, min_prob=1e-7, max_iter=100):
+    """
+    libsvm'in ikili SVC olasılığı: Platt sigmoidi ve ardından libsvm'in
+    multiclass_probability yinelemesi (k=2, eps=0.0025). sklearn predict_proba ile aynı sonuç.
+    """
+    # libsvm karar değeri sklearn'inkinin ters işaretlisidir; r = P(sınıf 0)
+    r = np.clip(1.0 / (1.0 + np.exp(-a * decision + b)), min_prob, 1 - min_prob)
+    s = 1 - r
+    q = ((s * s, -r * s), (-r * s, r * r))
+    p = [np.full_like(r, 0.5), np.full_like(r, 0.5)]
+    active = np.ones(len(r), dtype=bool)
+    for _ in range(max_iter):
+        qp = [q[t][0] * p[0] + q[t][1] * p[1] for t in range(2)]
+        pqp = p[0] * qp[0] + p[1] * qp[1]
+        # Her satır kendi durma koşuluna ulaşınca dondurulur (libsvm'de satır başına döngü)
+        active &= np.maximum(np.abs(qp[0] - pqp), np.abs(qp[1] - pqp)) >= 0.005 / 2
+        if not active.any():
+            break
+        for t in range(2):
+            diff = np.where(active, (pqp - qp[t]) / q[t][t], 0.0)
+            p[t] = p[t] + diff
+            pqp = (pqp + diff * (diff * q[t][t] + 2 * qp[t])) / (1 + diff) / (1 + diff)
+            qp = [(qp[j] + diff * q[t][j]) / (1 + diff) for j in range(2)]
+            p = [p[j] / (1 + diff) for j in range(2)]
+    return np.column_stack(p)
+
+
+def _compact_model_results(model, scores):
+    start, end = model['columns']
+    block = scores[:, start:end]
+    classes = model['classes']
+    kind = model['kind']
+
+    with np.errstate(over='ignore'):
+        if kind == 'multinomial_nb':
+            # Eklem log-olabilirlikten softmax
+            probs = np.exp(block - block.max(axis=1, keepdims=True))
+            probs /= probs.sum(axis=1, keepdims=True)
+        elif kind == 'logistic':
+            positive = 1.0 / (1.0 + np.exp(-block[:, 0]))
+            probs = np.column_stack([1 - positive, positive])
+        elif kind == 'sigmoid_calibrated':
+            # CalibratedClassifierCV: her alt modelin Platt olasılıklarının ortalaması
+            a = np.asarray(model['calibration_a'])
+            b = np.asarray(model['calibration_b'])
+            positive = (1.0 / (1.0 + np.exp(a * block + b))).mean(axis=1)
+            probs = np.column_stack([1 - positive, positive])
+        elif kind == 'modified_huber':
+            # SGDClassifier(loss='modified_huber'): (clip(karar, -1, 1) + 1) / 2
+            positive = (np.clip(block[:, 0], -1, 1) + 1) / 2
+            probs = np.column_stack([1 - positive, positive])
+        elif kind == 'linear_decision':
+            probs = None
+        elif kind == 'svc_linear':
+            # SVC(kernel='linear'): olasılık yalnızca probability=True ile eğitildiyse
+            probs = _svc_platt_probabilities(block[:, 0], model['platt_a'], model['platt_b']) \
+                if 'platt_a' in model else None
+        else:
+            raise ValueError(f"Bilinmeyen kompakt model türü: {kind}")
+
+    if probs is None or kind == 'svc_linear':
+        # libsvm tahmini olasılıktan değil karar fonksiyonunun işaretinden gelir
+        predicted = (block[:, 0] > 0).astype(int)
+    else:
+        predicted = probs.argmax(axis=1)
+
+    results = []
+    for i, class_index in enumerate(predicted):
+        prediction = str(classes[class_index])
+        if probs is not None:
+            prob_dict = {str(cls): float(p) for cls, p in zip(classes, probs[i])}
+        else:
+            prob_dict = {prediction: 1.0}
+        results.append({'prediction': prediction, 'probabilities': prob_dict})
+    return results
+
+
+def _predict_matrix(model, text_vecs):
+    """
+    Seyrek matristeki tüm satırlar için tek bir predict/predict_proba çağrısı yapar
+    """
+    predictions = model.predict(text_vecs)
+
+    try:
+        probs = model.predict_proba(text_vecs)
+    except:
+        probs = None
+
+    results = []
+    for i, prediction in enumerate(predictions):
+        prediction = str(prediction.item() if hasattr(prediction, "item") else prediction)
+        if probs is not None:
+            # Ham rakamları (0 ve 1) anahtar olarak gönderiyoruz, C# bunları eşleştirecek
+            prob_dict = {str(cls): float(p) for cls, p in zip(model.classes_, probs[i])}
+        else:
+            prob_dict = {prediction: 1.0}
+        results.append({'prediction': prediction, 'probabilities': prob_dict})
+    return results
+
+
+def _predict_vector(model, text_vec):
+    return _predict_matrix(model, text_vec)[0]
+
+
 def predict_text(text, model_name):
     model, vectorizer = load_model(model_name)
     if not model: return None
-    
-    text_vec = vectorizer.transform([text])
-    prediction = model.predict(text_vec)[0]
-    prediction = str(prediction.item() if hasattr(prediction, "item") else prediction)
-    
+    return _predict_vector(model, vectorizer.transform([text]))
+
+
+def predict_multiple_models(text, use_cache=True):
+    """
+    Birden fazla model ile tahmin yapar (Servis edilen tüm modeller)
+    Metin bir kez vektörleştirilir, aynı seyrek satır tüm modellere verilir.
+    Aynı metin (aynı model sürümüyle) daha önce skorlandıysa sonuç önbellekten
+    döner; disk katmanında isabet olursa modeller hiç yüklenmez.
+    """
+    if not (use_cache and _cache_enabled()):
+        loaded = load_models()
+        return _predict_chunk([text], loaded, list(loaded['models']))[0]
+
+    cache = get_prediction_cache()
+    # Uzun yaşayan süreçte yüklü modellerin sürümü, tek seferlik çağrıda dosya sürümü
+    version = _loaded_models['version'] if _loaded_models is not None else artifact_version()
+    result = cache.get(cache.make_key(text, version))
+    if result is not None:
+        return result
+
+    loaded = load_models()
+    result = _predict_chunk([text], loaded, list(loaded['models']))[0]
+    cache.put(cache.make_key(text, loaded['version']), result)
+    return result
+
+
+def _select_models(loaded, models=None):
+    return [m for m in (models or loaded['models']) if m in loaded['models']]
+
+
+def _predict_chunk(texts, loaded, model_names):
+    """
+    Bir metin parçasını tek seyrek matris olarak vektörleştirir ve
+    her modeli parça başına bir kez çağırır. Kompakt motorda tüm modellerin
+    skorları tek bir matris çarpımıyla hesaplanır.
+    """
+    chunk_results = [{} for _ in texts]
+    if not model_names or not texts:
+        return chunk_results
+
+    if 'compact' in loaded:
+        scores = _compact_scores(texts, loaded['compact'])
+        per_model = {m: _compact_model_results(loaded['models'][m], scores) for m in model_names}
+    else:
+        text_vecs = loaded['vectorizer'].transform(texts)
+        per_model = {m: _predict_matrix(loaded['models'][m], text_vecs) for m in model_names}
+
+    for model_name, predictions in per_model.items():
+        for row, prediction in zip(chunk_results, predictions):
+            row[model_name] = prediction
+    return chunk_results
+
+
+def iter_chunks(items, chunk_size):
+    """
+    Herhangi bir iterable'ı sabit boyutlu listelere böler (bellekte en fazla bir parça tutulur)
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def predict_batch(texts, models=None, chunk_size=BATCH_CHUNK_SIZE, workers=1):
+    """
+    Çok sayıda metni toplu tahmin eder.
+    Her parça tek bir seyrek matris olarak vektörleştirilir ve her model
+    parça başına bir kez çağrılır. workers > 1 ise parçalar süreç havuzuna
+    dağıtılır. Dönüş: metin sırasıyla predict_multiple_models çıktısı
+    biçiminde sonuç listesi.
+    """
+    results = []
+    for _, chunk_results in iter_scored_chunks(enumerate(texts), models, chunk_size, workers):
+        results.extend(chunk_results)
+    return results
+
+
+def iter_jsonl_records(input_stream):
+    """
+    JSON-lines girdiyi satır satır okur. Her satır {"id": ..., "text": "..."}
+    nesnesi veya doğrudan bir JSON metni ("...") olabilir. Kimliksiz satırlara
+    satır numarası verilir. Dönüş: (id, metin) üreteci
+    """
+    for line_no, line in enumerate(input_stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, str):
+            yield line_no, record
+        else:
+            yield record.get('id', line_no), record.get('text') or ''
+
+
+def iter_csv_records(input_stream, text_column='text', id_column='id'):
+    """
+    CSV girdiyi satır satır okur. Dönüş: (id, metin) üreteci
+    """
+    csv.field_size_limit(min(sys.maxsize, 2**31 - 1))  # Uzun özetler için
+    for row_no, row in enumerate(csv.DictReader(input_stream), 1):
+        yield row.get(id_column) or row_no, row.get(text_column) or ''
+
+
+def iter_scored_chunks(records, models=None, chunk_size=BATCH_CHUNK_SIZE, workers=1):
+    """
+    Akış hattı: (id, metin) kayıtları -> parçalar -> (parça, sonuçlar)
+    Girdi boyutundan bağımsız olarak bellekte yalnızca bir parça
+    (paralel modda en fazla işçi sayısının iki katı kadar parça) bulunur.
+    """
+    if workers > 1:
+        yield from _iter_scored_chunks_parallel(records, models, chunk_size, workers)
+        return
+
+    loaded = load_models()
+    model_names = _select_models(loaded, models)
+    for chunk in iter_chunks(records, chunk_size):
+        yield chunk, _predict_chunk([text for _, text in chunk], loaded, model_names)
+
+
+def _init_worker():
+    # Her işçi modelleri bir kez, bellek eşlemeli olarak yükler
+    load_models()
+
+
+def _score_chunk_in_worker(texts, models):
+    loaded = load_models()
+    return _predict_chunk(texts, loaded, _select_models(loaded, models))
+
+
+def _iter_scored_chunks_parallel(records, models, chunk_size, workers):
+    """
+    Parçaları süreç havuzuna dağıtır, sonuçları girdi sırasıyla döndürür.
+    Bekleyen parça sayısı sınırlı tutulur; böylece büyük dosyalar belleğe dolmaz.
+    """
+    max_pending = workers * 2
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for chunk in iter_chunks(records, chunk_size):
+            pending.append((chunk, executor.submit(_score_chunk_in_worker, [text for _, text in chunk], models)))
+            if len(pending) >= max_pending:
+                done_chunk, future = pending.popleft()
+                yield done_chunk, future.result()
+        while pending:
+            done_chunk, future = pending.popleft()
+            yield done_chunk, future.result()
+
+
+def _jsonl_result_writer(output_stream):
+    def write(chunk, results):
+        for (record_id, _), result in zip(chunk, results):
+            output_stream.write(json.dumps({'id': record_id, 'results': result}, ensure_ascii=False) + "\n")
+    return write
+
+
+def _csv_result_writer(output_stream):
+    """
+    Sonuçları düz CSV kolonlarına yazar: id, <model>_prediction, <model>_prob_<sınıf>
+    Kolonlar ilk parçanın sonuçlarından belirlenir.
+    """
+    writer = csv.writer(output_stream)
+    columns = []
+
+    def write(chunk, results):
+        if not columns and results:
+            for model_name, result in results[0].items():
+                columns.append((model_name, None))
+                columns.extend((model_name, cls) for cls in result['probabilities'])
+            writer.writerow(['id'] + [f"{m}_prediction" if cls is None else f"{m}_prob_{cls}" for m, cls in columns])
+        for (record_id, _), result in zip(chunk, results):
+            row = [record_id]
+            for model_name, cls in columns:
+                model_result = result.get(model_name, {})
+                if cls is None:
+                    row.append(model_result.get('prediction', ''))
+                else:
+                    row.append(model_result.get('probabilities', {}).get(cls, ''))
+            writer.writerow(row)
+
+    return write
+
+
+def _detect_format(path, explicit=None):
+    if explicit:
+        return explicit
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def run_batch(input_stream, output_stream, models=None, chunk_size=BATCH_CHUNK_SIZE,
+              input_format='jsonl', output_format='jsonl', text_column='text', report_stream=sys.stderr,
+              workers=1):
+    """
+    Girdiyi parça parça okuyup tahmin eder, sonuçları üretildikçe çıktıya yazar
+    ve işlem hızını (satır/sn) raporlar. Dönüş: {'rows', 'seconds', 'rows_per_sec'}
+    """
+    if input_format == 'csv':
+        records = iter_csv_records(input_stream, text_column)
+    else:
+        records = iter_jsonl_records(input_stream)
+    write = _csv_result_writer(output_stream) if output_format == 'csv' else _jsonl_result_writer(output_stream)
+
+    if workers <= 1:
+        load_models()  # Model yükleme süresi hız ölçümüne dahil edilmez
+    rows = 0
+    start_time = time.perf_counter()
+    for chunk, results in iter_scored_chunks(records, models, chunk_size, workers):
+        write(chunk, results)
+        output_stream.flush()
+        rows += len(chunk)
+        if report_stream:
+            elapsed = time.perf_counter() - start_time
+            print(f"{rows} satır işlendi ({rows / elapsed:.0f} satır/sn)", file=report_stream, flush=True)
+
+    elapsed = time.perf_counter() - start_time
+    stats = {'rows': rows, 'seconds': elapsed, 'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0}
+    if report_stream:
+        print(f"Toplam: {rows} satır, {elapsed:.2f} sn, {stats['rows_per_sec']:.0f} satır/sn",
+              file=report_stream, flush=True)
+    return stats
+
+
+def _handle_request(request):
+    """
+    Sunucu modlarında tek bir isteği işler.
+    İstek: {"text": "..."} -> Yanıt: predict_multiple_models çıktısı
+    """
+    text = request.get('text') if isinstance(request, dict) else None
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("'text' alanı boş olmayan bir metin olmalı")
+    return predict_multiple_models(text)
+
+
+def serve_json_lines(input_stream=sys.stdin, output_stream=sys.stdout, reload_interval=0):
+    """
+    stdin/stdout JSON-lines sunucu modu.
+    Her satır bir istek: {"id": 1, "text": "..."}
+    Her satıra bir yanıt: {"id": 1, "results": {...}} veya {"id": 1, "error": "..."}
+    Önbellek sayaçları: {"id": 2, "command": "stats"} -> {"id": 2, "stats": {...}}
+    reload_interval > 0 ise model dosyaları değişince yeniden yüklenir.
+    """
+    load_models()
+    start_model_watcher(reload_interval)
+    for line in input_stream:
+        line = line.strip()
+        if not line:
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            if isinstance(request, dict):
+                request_id = request.get('id')
+            if isinstance(request, dict) and request.get('command') == 'stats':
+                response = {'id': request_id, 'stats': get_prediction_cache().stats()}
+            else:
+                response = {'id': request_id, 'results': _handle_request(request)}
+        except Exception as e:
+            response = {'id': request_id, 'error': str(e)}
+        output_stream.write(json.dumps(response) + "\n")
+        output_stream.flush()
+
+
+def _make_request_handler():
+    """
+    HTTP istek işleyici sınıfını oluşturur; http.server yalnızca HTTP modunda import edilir.
+    """
+    from http.server import BaseHTTPRequestHandler
+
+    class PredictionRequestHandler(BaseHTTPRequestHandler):
+        """
+        HTTP sunucu modu istek işleyicisi
+        GET /health  -> {"status": "ok", "models": [...], "version": "...", "bundle_version": "..."}
+        GET /stats   -> tahmin önbelleği sayaçları
+        POST /predict {"text": "..."} -> tek seferlik CLI ile aynı JSON çıktı
+        """
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                loaded = load_models()
+                health = {'status': 'ok', 'models': list(loaded['models'].keys()), 'version': loaded['version']}
+                if loaded.get('manifest'):
+                    health['bundle_version'] = loaded['manifest']['version']
+                self._send_json(200, health)
+            elif self.path == '/stats':
+                self._send_json(200, {'cache': get_prediction_cache().stats()})
+            else:
+                self._send_json(404, {'error': 'Bulunamadı'})
+
+        def do_POST(self):
+            if self.path != '/predict':
+                self._send_json(404, {'error': 'Bulunamadı'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length).decode('utf-8'))
+                self._send_json(200, _handle_request(request))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+
+        def log_message(self, format, *args):
+            # stdout'u kirletmemek için erişim loglarını stderr'e yaz
+            sys.stderr.write("%s - %s\n" % (self.address_string(), format % args))
+
+    return PredictionRequestHandler
+
+
+def serve_http(host='127.0.0.1', port=8765, reload_interval=0):
+    """
+    Yerel HTTP sunucu modu. Modeller başlangıçta bir kez yüklenir;
+    reload_interval > 0 ise model dosyaları değişince yeniden yüklenir.
+    """
+    from http.server import ThreadingHTTPServer
+
+    load_models()
+    start_model_watcher(reload_interval)
+    server = ThreadingHTTPServer((host, port), _make_request_handler())
+    print(f"Tahmin sunucusu dinleniyor: http://{host}:{port}", file=sys.stderr, flush=True)
     try:
-        probs = model.predict_proba(text_vec)[0]
-        # Ham rakamları (0 ve 1) anahtar olarak gönderiyoruz, C# bunları eşleştirecek
-        prob_dict = {str(cls): float(p) for cls, p in zip(model.classes_, probs)}
-    except:
-        prob_dict = {prediction: 1.0}
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
-    return {'prediction': prediction, 'probabilities': prob_dict}
-   
 
-def predict_multiple_models(text):
+def profile_startup(text=PROFILE_SAMPLE_TEXT, budget_ms=None, output_stream=sys.stdout):
     """
-    Birden fazla model ile tahmin yapar (Tüm 6 model)
+    Tek seferlik CLI çağrısının (python predict.py "metin") başlangıç süresini
+    aşamalara ayırarak yazdırır. Daha ayrıntılı import dökümü için:
+        python -X importtime predict.py "metin"
+    Dönüş: çıkış kodu (bütçe aşıldıysa 1)
     """
-    # Kullanılacak tüm modeller (6 model) 
-    models = [
-        'naive_bayes',
-        'logistic_regression',
-        'svm_model'
+    stages = [
+        ("Yorumlayıcı başlangıcı (CPU)", _PROCESS_CPU_AT_START),
+        ("predict.py importları (numpy)", _IMPORT_END - _IMPORT_START),
     ]
-    
-    results = {}
-    
-    for model_name in models:
-        result = predict_text(text, model_name)
-        if result:
-            results[model_name] = result
-    
-    return results
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2: sys.exit(1)
-    results = {}
-    for m in ['naive_bayes', 'logistic_regression', 'svm_model']:
-        res = predict_text(sys.argv[1], m)
-        if res: results[m] = res
-    print(json.dumps(results))
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        stages.append((label, time.perf_counter() - start))
+        return result
 
+    compact = _use_compact_engine()
+    if not compact:
+        timed("import joblib", lambda: __import__('joblib'))
+        timed("import sklearn", lambda: __import__('sklearn'))
+    loaded = timed("Model yükleme (" + ("kompakt .npz" if compact else "joblib/pickle") + ")", load_models)
+    timed("İlk tahmin", lambda: predict_multiple_models(text, use_cache=False))
+    warm_start = time.perf_counter()
+    predict_multiple_models(text, use_cache=False)
+    warm = time.perf_counter() - warm_start
+
+    total = sum(seconds for _, seconds in stages)
+    print(f"Başlangıç profili (motor: {'compact' if compact else 'sklearn'}, "
+          f"modeller: {', '.join(loaded['models']) or '-'})", file=output_stream)
+    for label, seconds in stages:
+        print(f"  {label:<40s} {seconds * 1000:8.1f} ms", file=output_stream)
+    print(f"  {'Toplam':<40s} {total * 1000:8.1f} ms", file=output_stream)
+    print(f"  {'(Sıcak tahmin, karşılaştırma için)':<40s} {warm * 1000:8.1f} ms", file=output_stream)
+
+    if budget_ms is not None and total * 1000 > budget_ms:
+        print(f"UYARI: Başlangıç süresi bütçeyi aşıyor ({total * 1000:.1f} ms > {budget_ms:.1f} ms)",
+              file=output_stream)
+        return 1
+    return 0
+
+
+def build_arg_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="TextHunter model tahmin scripti")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--serve', action='store_true',
+                      help="stdin/stdout JSON-lines sunucu modu")
+    mode.add_argument('--http', type=int, metavar='PORT',
+                      help="Yerel HTTP sunucu modu (POST /predict)")
+    mode.add_argument('--batch', metavar='GIRDI',
+                      help="JSON-lines veya CSV dosyasından toplu tahmin ('-' = stdin)")
+    mode.add_argument('--profile-startup', nargs='?', const=PROFILE_SAMPLE_TEXT, metavar='METIN',
+                      help="Tek seferlik tahminin başlangıç süresini aşamalara göre raporla")
+    parser.add_argument('--budget-ms', type=float,
+                        help="--profile-startup ile: toplam süre bu bütçeyi aşarsa çıkış kodu 1")
+    parser.add_argument('--reload-interval', type=float, default=MODEL_RELOAD_INTERVAL,
+                        help="Sunucu modlarında model dosyalarını kontrol aralığı, sn "
+                             f"(0 = kapalı, varsayılan: {MODEL_RELOAD_INTERVAL:g})")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="HTTP sunucu adresi (varsayılan: 127.0.0.1)")
+    parser.add_argument('--output', default='-',
+                        help="Toplu tahmin çıktı dosyası ('-' = stdout)")
+    parser.add_argument('--models',
+                        help="Virgülle ayrılmış model listesi (varsayılan: tümü)")
+    parser.add_argument('--input-format', choices=['jsonl', 'csv'],
+                        help="Girdi biçimi (varsayılan: dosya uzantısından)")
+    parser.add_argument('--output-format', choices=['jsonl', 'csv'],
+                        help="Çıktı biçimi (varsayılan: dosya uzantısından)")
+    parser.add_argument('--text-column', default='text',
+                        help="CSV girdide metin kolonu (varsayılan: text)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Toplu tahminde paralel süreç sayısı (varsayılan: 1)")
+    parser.add_argument('--chunk-size', type=int, default=BATCH_CHUNK_SIZE,
+                        help=f"Parça başına metin sayısı (varsayılan: {BATCH_CHUNK_SIZE})")
+    return parser
+
+
+def _is_option_mode(argv):
+    """
+    İlk argüman bilinen bir seçenekse seçenek modunu, değilse
+    eski tek metin modunu (python predict.py "metin") kullanırız.
+    """
+    if not argv or not argv[0].startswith('-'):
+        # Hızlı yol: argparse import edilmez
+        return False
+    options = {opt for action in build_arg_parser()._actions for opt in action.option_strings}
+    return argv[0].split('=')[0] in options
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not _is_option_mode(argv):
+        if len(argv) < 1: sys.exit(1)
+        print(json.dumps(predict_multiple_models(argv[0])))
+        return
+
+    args = build_arg_parser().parse_args(argv)
+    if args.profile_startup is not None:
+        sys.exit(profile_startup(args.profile_startup, args.budget_ms))
+    elif args.serve:
+        serve_json_lines(reload_interval=args.reload_interval)
+    elif args.batch:
+        models = args.models.split(',') if args.models else None
+        input_format = _detect_format(args.batch, args.input_format)
+        output_format = _detect_format(args.output, args.output_format)
+        input_stream = sys.stdin if args.batch == '-' else open(args.batch, 'r', encoding='utf-8', newline='')
+        output_stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+        try:
+            run_batch(input_stream, output_stream, models, args.chunk_size,
+                      input_format, output_format, args.text_column, workers=args.workers)
+        finally:
+            if input_stream is not sys.stdin: input_stream.close()
+            if output_stream is not sys.stdout: output_stream.close()
+    else:
+        serve_http(args.host, args.http, args.reload_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-import pandas as pd
 import sys
+from dataset_io import load_dataset
 
 try:
-    h = pd.read_csv('../Data/raw/human_abstracts.csv')
-    a = pd.read_csv('../Data/raw/ai_abstracts.csv')
+    # Yalnızca label kolonu okunur (Parquet > JSON > CSV)
+    h = load_dataset('../Data/raw/human_abstracts', columns=['label'])
+    a = load_dataset('../Data/raw/ai_abstracts', columns=['label'])
     
     print('=== KESIN VERI SAYILARI ===')
     print(f'Human abstracts: {len(h)} adet')
@@ -10,6 +10,8 @@ import sys
 import json
 import pandas as pd
 from pathlib import Path
+from dataset_io import find_dataset, load_dataset, load_records
+from checkpoint_journal import read_journal
 
 # Yolları ayarla
 SCRIPT_DIR = Path(__file__).parent
@@ -23,36 +25,38 @@ def check_current_status():
     print("=" * 60)
     
     # 1. Checkpoint kontrolü
-    checkpoint_file = DATA_DIR / "ai_abstracts_checkpoint.json"
+    checkpoint_file = DATA_DIR / "ai_abstracts_checkpoint.jsonl"
+    legacy_checkpoint_file = DATA_DIR / "ai_abstracts_checkpoint.json"
+    checkpoint_data = None
     if checkpoint_file.exists():
-        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+        checkpoint_data = read_journal(str(checkpoint_file))
+    elif legacy_checkpoint_file.exists():
+        with open(legacy_checkpoint_file, 'r', encoding='utf-8') as f:
             checkpoint_data = json.load(f)
-            print(f"✓ Checkpoint dosyası: {len(checkpoint_data)} adet")
+    if checkpoint_data is not None:
+        print(f"✓ Checkpoint dosyası: {len(checkpoint_data)} adet")
     
-    # 2. ai_abstracts.json kontrolü
-    ai_json = DATA_DIR / "ai_abstracts.json"
-    if ai_json.exists():
-        with open(ai_json, 'r', encoding='utf-8') as f:
-            ai_data = json.load(f)
-            print(f"✓ ai_abstracts.json: {len(ai_data)} adet")
+    # 2. ai_abstracts kontrolü (Parquet > JSON > CSV)
+    ai_json = find_dataset(str(DATA_DIR / "ai_abstracts"))
+    if ai_json:
+        ai_data = load_dataset(ai_json, columns=['label'])
+        print(f"✓ {os.path.basename(ai_json)}: {len(ai_data)} adet")
     
-    # 3. combined_dataset.csv kontrolü
-    combined_csv = DATA_DIR / "combined_dataset.csv"
-    if combined_csv.exists():
-        df = pd.read_csv(combined_csv)
+    # 3. combined_dataset kontrolü (yalnızca label kolonu okunur)
+    combined_csv = find_dataset(str(DATA_DIR / "combined_dataset"))
+    if combined_csv:
+        df = load_dataset(combined_csv, columns=['label'])
         ai_count = len(df[df['label'] == 'AI'])
-        print(f"✓ combined_dataset.csv: {ai_count} adet AI verisi")
+        print(f"✓ {os.path.basename(combined_csv)}: {ai_count} adet AI verisi")
     
     # Toplam hesapla
     all_sources = []
-    if checkpoint_file.exists():
-        with open(checkpoint_file, 'r', encoding='utf-8') as f:
-            all_sources.extend(json.load(f))
-    elif ai_json.exists():
-        with open(ai_json, 'r', encoding='utf-8') as f:
-            all_sources.extend(json.load(f))
-    elif combined_csv.exists():
-        df = pd.read_csv(combined_csv)
+    if checkpoint_data is not None:
+        all_sources.extend(checkpoint_data)
+    elif ai_json:
+        all_sources.extend(load_records(ai_json))
+    elif combined_csv:
+        df = load_dataset(combined_csv, columns=['label'])
         ai_data = df[df['label'] == 'AI'].to_dict('records')
         all_sources = ai_data
     
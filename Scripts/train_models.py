@@ -6,19 +6,40 @@ ML Model Eğitim Scripti
 """
 
 import os
+import io
+import sys
+import copy
 import json
+import time
+import argparse
+import shutil
+import hashlib
+import tempfile
+import threading
+import contextlib
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import joblib
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, TfidfTransformer, HashingVectorizer
+from sklearn.pipeline import Pipeline
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.svm import SVC
+from sklearn.svm import SVC, LinearSVC
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.calibration import CalibratedClassifierCV
+from threadpoolctl import threadpool_limits
+from dataset_io import find_dataset, load_dataset, iter_dataset_records
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     confusion_matrix, classification_report
 )
+try:
+    import psutil  # İsteğe bağlı: eğitim sırasında bellek örneklemesi için
+except ImportError:
+    psutil = None
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
@@ -38,6 +59,77 @@ except LookupError:
 INPUT_DIR = "../Data/cleaned"
 OUTPUT_DIR = "../MLModels"
 
+# Özellik uzayı: 'vocabulary' (max_features=5000 sözlük) veya 'hashing' (sözlüksüz, sabit kova sayısı)
+FEATURE_SPACES = ['vocabulary', 'hashing']
+VOCABULARY_SIZE = 5000
+HASH_BUCKETS = 2 ** 17
+# Hashing uzayında idf hesaplanırken bir seferde işlenen metin sayısı
+HASHING_CHUNK_SIZE = 5000
+
+# Eğitim/test ayrımı
+TEST_SIZE = 0.2
+SPLIT_RANDOM_STATE = 42
+
+# Özellik önbelleği: model dosyalarından (OUTPUT_DIR) ayrı, temizlenmiş verinin yanında
+# (git'e eklenmez, bkz. .gitignore); veri seti içeriği + özellik ayarları + ayrım
+# parametrelerinden türetilen anahtarla. build_features çıktısı değişirse biçim sürümü artırılır.
+FEATURE_CACHE_DIR = "../Data/feature_cache"
+FEATURE_CACHE_FORMAT = 1
+# Saklanan en yeni önbellek kaydı sayısı (eskileri silinir)
+FEATURE_CACHE_KEEP = 3
+
+# Hiperparametre araması (--search): her algoritma için model ızgarası; vectorizer
+# ızgarası (sözlük boyutu, BoW/TF-IDF) hepsiyle çaprazlanır
+SEARCH_GRIDS = {
+    'naive_bayes': {'model__alpha': [0.03, 0.1, 0.3, 1.0, 3.0]},
+    'random_forest': {'model__n_estimators': [100, 200, 400], 'model__max_features': ['sqrt', 'log2']},
+    'svm': {'model__C': [0.03, 0.1, 0.3, 1.0, 3.0]},
+}
+SEARCH_VECTORIZER_GRID = {'vectorizer__max_features': [2000, 5000, 10000, 20000]}
+# BoW: ağırlıksız sayımlar, TF-IDF: idf + l2 normalizasyon
+SEARCH_WEIGHTINGS = {
+    'bow': {'tfidf__use_idf': [False], 'tfidf__norm': [None]},
+    'tfidf': {'tfidf__use_idf': [True], 'tfidf__norm': ['l2']},
+}
+SEARCH_RESULTS_FILE = "search_results.json"
+# Arama sonucundan normal eğitime aktarılan parametreler (ızgara adı -> eğitimci parametresi)
+SEARCH_TRAINER_PARAMS = {
+    'naive_bayes': {'model__alpha': 'alpha'},
+    'random_forest': {'model__n_estimators': 'n_estimators', 'model__max_features': 'max_features'},
+    'svm': {'model__C': 'C'},
+}
+
+# predict.py'nin servis ettiği modeller: servis adı -> (eğitimci, özellik tipi).
+# Hepsi aynı TF-IDF vectorizer'ı paylaşır ve tek pakette yayımlanır.
+SERVED_MODELS = {
+    'naive_bayes': ('naive_bayes', 'tfidf'),
+    'logistic_regression': ('logistic_regression', 'tfidf'),
+    'svm_model': ('svm', 'tfidf'),
+    'ensemble': ('ensemble_distilled', 'tfidf'),
+}
+BUNDLE_FORMAT_VERSION = 1
+
+# Topluluk damıtma: aynı özellik tipindeki tüm modellerin (Random Forest dahil) ortalama
+# olasılıkları tek bir doğrusal öğrenci modele (Logistic Regression) öğretilir
+DISTILLATION_FEATURES = 'tfidf'
+DISTILLATION_C = 10.0
+
+# Çıkarım ölçümü: tek satır gecikmesi için ölçülen örnek sayısı
+BENCHMARK_SINGLE_ROWS = 200
+
+# Servis edilen modellerin sınıf kodları (predict.py ve web uygulaması: 0 = AI, 1 = Human)
+LABEL_MAP = {'AI': 0, 'Human': 1}
+
+# Artımlı eğitim durumu MLModels/ altında bu klasörde tutulur
+INCREMENTAL_DIR_NAME = "incremental"
+INCREMENTAL_STATE_FILE = "state.joblib"
+INCREMENTAL_LOG_FILE = "incremental_log.jsonl"
+INCREMENTAL_CHUNK_SIZE = 2000
+# İlk (sıfırdan) artımlı eğitimde doğrusal modeller için veri üzerinden geçiş sayısı
+INCREMENTAL_BOOTSTRAP_EPOCHS = 5
+# Artımlı "ensemble" öğrencisinin öğretmenleri (her parçada güncellenmiş halleriyle)
+INCREMENTAL_TEACHERS = ['naive_bayes', 'logistic_regression', 'svm_model']
+
 # Türkçe ve İngilizce stopwords
 try:
     stop_words_en = set(stopwords.words('english'))
@@ -46,26 +138,590 @@ try:
 except:
     stop_words = set(stopwords.words('english'))
 
-def load_data():
+def vocabulary_terms(vectorizer):
     """
-    Temizlenmiş veri setini yükler
+    Sözlüğü kolon sırasına göre dizilmiş sabit genişlikli UTF-8 terim dizisine çevirir.
+    UTF-8 bayt sırası kod noktası sırasıyla aynı olduğundan dizi sıralı kalır.
     """
-    json_path = os.path.join(INPUT_DIR, "cleaned_dataset.json")
-    csv_path = os.path.join(INPUT_DIR, "cleaned_dataset.csv")
-    
-    if os.path.exists(json_path):
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    elif os.path.exists(csv_path):
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        data = df.to_dict('records')
+    if hasattr(vectorizer, 'terms'):
+        # predict.py'nin mmap sözlüklü vectorizer'ı
+        return np.asarray(vectorizer.terms)
+    encoded = {term.encode('utf-8'): index for term, index in vectorizer.vocabulary_.items()}
+    terms = np.empty(len(encoded), dtype=f"S{max(map(len, encoded), default=1)}")
+    for term, index in encoded.items():
+        terms[index] = term
+    return terms
+
+def _write_atomically(path, write):
+    """
+    Dosyayı önce geçici dosyaya yazar, sonra os.replace ile yerine taşır.
+    Çalışan predict.py süreçleri yarım yazılmış dosya görmez; eski dosyayı
+    mmap ile açmış olanlar eski içeriği okumaya devam eder.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+def save_model_artifact(model, path):
+    """
+    Modeli sıkıştırmadan kaydeder; numpy dizileri predict.py tarafından
+    joblib.load(mmap_mode='r') ile bellek eşlemeli açılabilir.
+    """
+    _write_atomically(path, lambda f: joblib.dump(model, f, compress=0))
+
+def split_vectorizer(vectorizer):
+    """
+    Vectorizer'ı sözlüksüz sklearn nesnesi ve sıralı terim dizisi olarak ayırır.
+    Pickle'dan büyük Python dict'i (vocabulary_) ve yalnızca inceleme amaçlı
+    stop_words_ kümesi çıkarılır; idf_ dizisi sıkıştırılmadan kalır.
+    Dönüş: (vectorizer, terimler) - hashing uzayında terimler None
+    """
+    if hasattr(vectorizer, 'terms'):
+        # predict.py'nin mmap sözlüklü vectorizer'ı
+        return vectorizer.vectorizer, np.asarray(vectorizer.terms)
+    if not hasattr(vectorizer, 'vocabulary_'):
+        # Hashing uzayı: sözlük yok, yalnızca sabit boyutlu idf dizisi
+        return vectorizer, None
+
+    slim_vectorizer = copy.copy(vectorizer)
+    for attr in ('vocabulary_', 'stop_words_'):
+        if attr in slim_vectorizer.__dict__:
+            delattr(slim_vectorizer, attr)
+    return slim_vectorizer, vocabulary_terms(vectorizer)
+
+def save_vectorizer_artifact(vectorizer, path):
+    """
+    Vectorizer'ı mmap'lenebilir biçimde kaydeder: sözlük, kolon sırasına göre
+    dizilmiş sabit genişlikli UTF-8 terim dizisi olarak <ad>.vocab.npy dosyasına
+    yazılır (sklearn sözlüğü alfabetik sıralar), pickle sözlüksüz kalır.
+    """
+    slim_vectorizer, terms = split_vectorizer(vectorizer)
+    if terms is not None:
+        _write_atomically(os.path.splitext(path)[0] + ".vocab.npy", lambda f: np.save(f, terms))
+    _write_atomically(path, lambda f: joblib.dump(slim_vectorizer, f, compress=0))
+
+def _linear_decision_parts(estimator):
+    """
+    decision_function = X @ coef_.T + intercept_ olan ikili doğrusal modelin ağırlıkları
+    """
+    coef = estimator.coef_
+    # Seyrek veriyle eğitilen SVC'de coef_ seyrek matristir
+    coef = np.asarray(coef.toarray() if hasattr(coef, 'toarray') else coef, dtype=np.float64)
+    if coef.shape[0] != 1 or len(estimator.classes_) != 2:
+        raise ValueError(f"{type(estimator).__name__}: kompakt format yalnızca ikili sınıflandırmayı destekler")
+    return coef.T, np.asarray(estimator.intercept_, dtype=np.float64).reshape(1)
+
+def _compact_model_parts(model):
+    """
+    Bir modeli kompakt formata çevirir.
+    Dönüş: (ağırlıklar [n_özellik x k], bias [k], model bilgisi)
+    """
+    classes = [cls.item() if hasattr(cls, 'item') else cls for cls in model.classes_]
+    info = {'classes': classes}
+
+    if type(model) is MultinomialNB:
+        info['kind'] = 'multinomial_nb'
+        return np.asarray(model.feature_log_prob_, dtype=np.float64).T, np.asarray(model.class_log_prior_, dtype=np.float64), info
+
+    if isinstance(model, SGDClassifier) and model.loss == 'modified_huber':
+        info['kind'] = 'modified_huber'
+        weights, bias = _linear_decision_parts(model)
+        return weights, bias, info
+
+    if isinstance(model, LogisticRegression) or (isinstance(model, SGDClassifier) and model.loss == 'log_loss'):
+        info['kind'] = 'logistic'
+        weights, bias = _linear_decision_parts(model)
+        return weights, bias, info
+
+    if isinstance(model, CalibratedClassifierCV):
+        if model.method != 'sigmoid' or len(classes) != 2:
+            raise ValueError("CalibratedClassifierCV: yalnızca ikili sınıflandırma ve sigmoid kalibrasyon desteklenir")
+        info.update(kind='sigmoid_calibrated', calibration_a=[], calibration_b=[])
+        weights, bias = [], []
+        for calibrated in model.calibrated_classifiers_:
+            member_weights, member_bias = _linear_decision_parts(calibrated.estimator)
+            weights.append(member_weights)
+            bias.append(member_bias)
+            info['calibration_a'].append(float(calibrated.calibrators[0].a_))
+            info['calibration_b'].append(float(calibrated.calibrators[0].b_))
+        return np.hstack(weights), np.concatenate(bias), info
+
+    if isinstance(model, (LinearSVC, SGDClassifier)):
+        info['kind'] = 'linear_decision'
+        weights, bias = _linear_decision_parts(model)
+        return weights, bias, info
+
+    if isinstance(model, SVC):
+        if model.kernel != 'linear':
+            raise ValueError(f"SVC kompakt formata çevrilemez (doğrusal olmayan çekirdek: {model.kernel})")
+        # libsvm: tahmin karar fonksiyonunun işaretinden, olasılık Platt parametrelerinden
+        info['kind'] = 'svc_linear'
+        if len(getattr(model, 'probA_', ())):
+            # probability=True ile eğitildi (sklearn 1.9+'da probability varsayılanı 'deprecated' dizgesi)
+            info['platt_a'] = float(model.probA_[0])
+            info['platt_b'] = float(model.probB_[0])
+        weights, bias = _linear_decision_parts(model)
+        return weights, bias, info
+
+    raise ValueError(f"{type(model).__name__} kompakt formata çevrilemez (doğrusal değil)")
+
+# Kompakt tokenizasyonun (sözlük/hashing) sklearn ile aynı olduğunu doğrulamak için örnek metinler
+COMPACT_PROBE_TEXTS = [
+    "This paper presents a novel approach to text classification using machine learning.",
+    "We measured 42 samples; results suggest the model's accuracy improves (p < 0.05).",
+    "Çalışmada öğrenci başarısı ve yapay zekâ destekli değerlendirme ilişkisi incelenmiştir.",
+    "",
+]
+
+def _verify_compact_model(path, models, n_features, vectorizer=None):
+    """
+    Dışa aktarılan kompakt modelin sklearn modelleriyle aynı sonucu verdiğini
+    rastgele seyrek örnekler üzerinde doğrular. vectorizer verilirse örnek
+    metinlerin özellikleri de sklearn vectorizer'ıyla karşılaştırılır.
+    """
+    from scipy import sparse
+    from sklearn.preprocessing import normalize
+    import predict
+
+    compact = predict.load_compact_model(path)
+    probe = normalize(sparse.random(50, n_features, density=0.02, format='csr', random_state=42))
+    rows = np.repeat(np.arange(probe.shape[0]), np.diff(probe.indptr))
+    scores = predict._compact_dot(rows, probe.indices, probe.data, probe.shape[0], compact)
+
+    if vectorizer is not None:
+        expected = vectorizer.transform(COMPACT_PROBE_TEXTS).toarray()
+        rows, cols, values = predict._compact_features(COMPACT_PROBE_TEXTS, compact)
+        actual = np.zeros_like(expected)
+        np.add.at(actual, (rows, cols), values)
+        if not np.allclose(expected, actual, atol=1e-9):
+            raise ValueError("Kompakt tokenizasyon sklearn vectorizer çıktısıyla uyuşmuyor")
+
+    for model_name, model in models.items():
+        expected = predict._predict_matrix(model, probe)
+        actual = predict._compact_model_results(compact['models'][model_name], scores)
+        for exp, act in zip(expected, actual):
+            same_probs = all(abs(exp['probabilities'][k] - act['probabilities'].get(k, -1)) < 1e-6
+                             for k in exp['probabilities'])
+            if exp['prediction'] != act['prediction'] or not same_probs:
+                raise ValueError(f"{model_name}: kompakt model sklearn çıktısıyla uyuşmuyor")
+
+def export_compact_model(vectorizer, models, path):
+    """
+    Servis edilen doğrusal modelleri pickle'sız kompakt formata (.npz) aktarır:
+    - terms: sıralı UTF-8 sözlük, idf: idf vektörü, stop_words: durak kelimeler
+    - weights/bias: tüm modellerin yığılmış ağırlık matrisi ve bias vektörü
+      (NB için sınıf log-olasılıkları, doğrusal modeller için karar fonksiyonu)
+    - config: tokenizasyon ayarları ve her modelin kolon aralığı/kalibrasyonu (JSON)
+    predict.py bu dosyayla tüm modelleri tek bir seyrek çarpımla skorlar.
+    """
+    source_vectorizer = vectorizer
+    tfidf = None
+    if isinstance(vectorizer, Pipeline):
+        # Hashing TF-IDF hattı: HashingVectorizer + TfidfTransformer
+        vectorizer, tfidf = vectorizer.steps[0][1], vectorizer.steps[-1][1]
+    is_hashing = isinstance(vectorizer, HashingVectorizer)
+    if is_hashing:
+        if vectorizer.alternate_sign or (tfidf is not None and vectorizer.norm is not None):
+            raise ValueError("Kompakt format yalnızca alternate_sign=False (ve TF-IDF öncesi norm=None) hashing'i destekler")
+        terms = np.zeros(0, dtype='S1')
+        n_features = vectorizer.n_features
     else:
+        terms = vocabulary_terms(vectorizer)
+        vectorizer = getattr(vectorizer, 'vectorizer', vectorizer)
+        n_features = len(terms)
+    if (vectorizer.analyzer != 'word' or vectorizer.tokenizer is not None or vectorizer.preprocessor is not None
+            or vectorizer.strip_accents is not None or tuple(vectorizer.ngram_range) != (1, 1)):
+        raise ValueError("Kompakt format yalnızca varsayılan kelime (unigram) analizini destekler")
+
+    # TF-IDF ayarlarını taşıyan nesne: TfidfVectorizer'ın kendisi veya hattaki TfidfTransformer
+    weighting = tfidf if tfidf is not None else vectorizer
+    is_tfidf = isinstance(weighting, (TfidfVectorizer, TfidfTransformer))
+    use_idf = is_tfidf and weighting.use_idf
+    config = {
+        'format_version': 1,
+        'feature_space': 'hashing' if is_hashing else 'vocabulary',
+        'n_features': n_features,
+        'token_pattern': vectorizer.token_pattern,
+        'lowercase': bool(vectorizer.lowercase),
+        'binary': bool(vectorizer.binary),
+        'sublinear_tf': bool(is_tfidf and weighting.sublinear_tf),
+        'use_idf': bool(use_idf),
+        'norm': weighting.norm if is_tfidf or is_hashing else None,
+        'models': [],
+    }
+
+    weights, bias, column = [], [], 0
+    for model_name, model in models.items():
+        model_weights, model_bias, info = _compact_model_parts(model)
+        info['name'] = model_name
+        info['columns'] = [column, column + len(model_bias)]
+        column += len(model_bias)
+        weights.append(model_weights)
+        bias.append(model_bias)
+        config['models'].append(info)
+
+    stop_words = sorted(word.encode('utf-8') for word in (vectorizer.get_stop_words() or ()))
+    arrays = {
+        'terms': terms,
+        'idf': np.asarray(weighting.idf_, dtype=np.float64) if use_idf else np.zeros(0),
+        'stop_words': np.array(stop_words, dtype=f"S{max(map(len, stop_words), default=1)}"),
+        'weights': np.ascontiguousarray(np.hstack(weights)),
+        'bias': np.concatenate(bias),
+        'config': np.array(json.dumps(config)),
+    }
+
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz, sonra taşı
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    _verify_compact_model(tmp_path, models, n_features, source_vectorizer)
+    os.replace(tmp_path, path)
+    return path
+
+def export_serving_compact_model():
+    """
+    MLModels/ altındaki servis edilen modelleri (predict.py'nin yüklediği set)
+    serving_model.npz kompakt modeline dönüştürür.
+    """
+    import predict
+
+    loaded = predict._load_sklearn_models(predict.DEFAULT_MMAP_MODE)
+    if not loaded['models']:
+        raise FileNotFoundError(f"Servis edilen model bulunamadı: {predict.MODEL_DIR}")
+    path = os.path.join(predict.MODEL_DIR, predict.COMPACT_MODEL_FILE)
+    export_compact_model(loaded['vectorizer'], loaded['models'], path)
+    print(f"Kompakt model kaydedildi: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+    return path
+
+def dataset_path():
+    """
+    Temizlenmiş veri setinin yolu (Parquet öncelikli, yoksa JSON, yoksa CSV)
+    """
+    path = find_dataset(os.path.join(INPUT_DIR, "cleaned_dataset"))
+    if path is None:
         raise FileNotFoundError("Temizlenmiş veri seti bulunamadı. Önce veri temizleme scriptini çalıştırın.")
+    return path
+
+def load_data():
+    """
+    Temizlenmiş veri setini yükler (yalnızca text ve label kolonları)
+    """
+    df = load_dataset(dataset_path(), columns=['text', 'label'])
+    return df['text'].to_numpy(), df['label'].to_numpy()
+
+def feature_cache_key(path, feature_space='vocabulary', n_buckets=HASH_BUCKETS):
+    """
+    Önbellek anahtarı: veri seti dosyasının sha256 özeti + özellik çıkarımı ayarları
+    (özellik uzayı, sözlük/kova boyutu, stop words, sklearn sürümü) + ayrım parametreleri.
+    Temizlenmiş veri değişince özet, dolayısıyla anahtar da değişir.
+    """
+    import predict
+    import sklearn
+
+    config = {
+        'format': FEATURE_CACHE_FORMAT,
+        'dataset_sha256': predict.file_sha256(path),
+        'feature_space': feature_space,
+        'size': n_buckets if feature_space == 'hashing' else VOCABULARY_SIZE,
+        'stop_words': sorted(stop_words),
+        'label_map': LABEL_MAP,
+        'test_size': TEST_SIZE,
+        'random_state': SPLIT_RANDOM_STATE,
+        'sklearn': sklearn.__version__,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:20]
+
+def save_feature_cache(key, features, X_test, y_train, y_test):
+    """
+    Eğitilmiş vectorizer'ları ve CSR eğitim/test matrislerini (scipy .npz) diske yazar.
+    Kayıt önce geçici klasöre yazılıp tek bir yeniden adlandırmayla yerine konur;
+    yarım kalan yazım önbellekte görünmez. Eski kayıtlardan yalnızca en yeni
+    FEATURE_CACHE_KEEP tanesi tutulur.
+    """
+    from scipy import sparse
+
+    cache_dir = FEATURE_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    entry_dir = os.path.join(cache_dir, key)
+    if os.path.isdir(entry_dir):
+        return entry_dir
+
+    tmp_dir = tempfile.mkdtemp(dir=cache_dir, prefix=f".{key}.")
+    try:
+        for vectorizer_type, data in features.items():
+            for split in ('X_train', 'X_test'):
+                sparse.save_npz(os.path.join(tmp_dir, f"{vectorizer_type}_{split}.npz"), data[split].tocsr(),
+                                compressed=False)
+        joblib.dump({
+            'vectorizers': {vectorizer_type: data['vectorizer'] for vectorizer_type, data in features.items()},
+            'seconds': {vectorizer_type: data['seconds'] for vectorizer_type, data in features.items()},
+            'X_test': list(X_test),
+            'y_train': np.asarray(y_train),
+            'y_test': np.asarray(y_test),
+        }, os.path.join(tmp_dir, "meta.joblib"))
+        os.replace(tmp_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.isdir(entry_dir):
+            raise
+
+    entries = sorted((os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if not name.startswith('.')),
+                     key=os.path.getmtime, reverse=True)
+    for old_entry in entries[FEATURE_CACHE_KEEP:]:
+        shutil.rmtree(old_entry, ignore_errors=True)
+    return entry_dir
+
+def load_feature_cache(key):
+    """
+    Önbellekteki özellikleri yükler; kayıt yoksa None.
+    Dönüş: (build_features çıktısıyla aynı yapıda özellikler, X_test, y_train, y_test)
+    """
+    from scipy import sparse
+
+    entry_dir = os.path.join(FEATURE_CACHE_DIR, key)
+    if not os.path.isdir(entry_dir):
+        return None
+    meta = joblib.load(os.path.join(entry_dir, "meta.joblib"))
+    features = {
+        vectorizer_type: {
+            'vectorizer': vectorizer,
+            'X_train': sparse.load_npz(os.path.join(entry_dir, f"{vectorizer_type}_X_train.npz")),
+            'X_test': sparse.load_npz(os.path.join(entry_dir, f"{vectorizer_type}_X_test.npz")),
+            'seconds': meta['seconds'][vectorizer_type],
+        }
+        for vectorizer_type, vectorizer in meta['vectorizers'].items()
+    }
+    # Kullanım zamanı: budama en son kullanılan kayıtları tutar
+    os.utime(entry_dir)
+    return features, np.array(meta['X_test'], dtype=object), meta['y_train'], meta['y_test']
+
+def prepare_features(feature_space='vocabulary', n_buckets=HASH_BUCKETS, use_cache=True):
+    """
+    Veriyi yükler, eğitim/test olarak ayırır ve özellikleri çıkarır.
+    use_cache=True ise veri seti ve ayarlar değişmediğinde özellikler diskteki
+    önbellekten okunur; veri seti yeniden ayrıştırılmaz ve tokenize edilmez.
+    Dönüş: (özellikler, X_test, y_train, y_test)
+    """
+    key = feature_cache_key(dataset_path(), feature_space, n_buckets) if use_cache else None
+    if key:
+        start = time.perf_counter()
+        cached = load_feature_cache(key)
+        if cached:
+            features, X_test, y_train, y_test = cached
+            load_seconds = time.perf_counter() - start
+            # Raporlanan vektörleştirme süresi bu çalıştırmadaki yükleme süresidir
+            for data in features.values():
+                data['seconds'] = load_seconds
+                data['cached'] = True
+            print(f"\nÖzellik önbelleği kullanıldı: {key} ({load_seconds:.2f} sn)")
+            print(f"Eğitim seti: {len(y_train)} örnek")
+            print(f"Test seti: {len(y_test)} örnek")
+            return cached
+
+    # Veriyi yükle
+    X, y = load_data()
+    print(f"\nYüklenen veri sayısı: {len(X)}")
+    print(f"Sınıf dağılımı: {pd.Series(y).value_counts().to_dict()}")
+    # Modeller servis edilen sınıf kodlarıyla eğitilir (0 = AI, 1 = Human)
+    y = np.array([LABEL_MAP[label] for label in y])
     
-    df = pd.DataFrame(data)
-    return df['text'].values, df['label'].values
+    # Train-test split
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=SPLIT_RANDOM_STATE, stratify=y
+    )
+    print(f"\nEğitim seti: {len(X_train)} örnek")
+    print(f"Test seti: {len(X_test)} örnek")
+    
+    # Özellikler tüm modeller için bir kez çıkarılır
+    features = build_features(X_train, X_test, feature_space, n_buckets)
+    if key:
+        save_feature_cache(key, features, X_test, y_train, y_test)
+        print(f"Özellikler önbelleğe yazıldı: {key}")
+    return features, X_test, y_train, y_test
+
+def _current_rss():
+    return psutil.Process().memory_info().rss if psutil else None
+
+def _process_peak_rss():
+    """
+    Sürecin ömrü boyunca ulaştığı en yüksek RSS (bayt); psutil yoksa kullanılır
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows: resource modülü yok
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+@contextlib.contextmanager
+def track_resources(interval=0.01):
+    """
+    Bloğun süresini ve blok boyunca en yüksek RSS'i ölçer.
+    psutil varsa RSS arka planda örneklenir; yoksa sürecin en yüksek RSS'i raporlanır.
+    Çıkışta doldurulan sözlük: {'seconds', 'peak_rss_mb'}
+    """
+    stats = {}
+    peak = [_current_rss() or 0]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(interval):
+            peak[0] = max(peak[0], _current_rss())
+
+    sampler = threading.Thread(target=sample, daemon=True) if psutil else None
+    if sampler:
+        sampler.start()
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats['seconds'] = time.perf_counter() - start
+        if sampler:
+            stop.set()
+            sampler.join()
+            peak[0] = max(peak[0], _current_rss())
+            peak_bytes = peak[0]
+        else:
+            peak_bytes = _process_peak_rss()
+        stats['peak_rss_mb'] = round(peak_bytes / 2 ** 20, 1) if peak_bytes else None
+
+def benchmark_inference(model, vectorizer, texts, single_rows=BENCHMARK_SINGLE_ROWS):
+    """
+    Ham metinden (vektörleştirme dahil) servis edildiği gibi tahmin maliyetini ölçer:
+    tek satır gecikmesi p50/p99 (ms) ve toplu işlem hızı (satır/sn).
+    """
+    predict_fn = model.predict_proba if hasattr(model, 'predict_proba') else model.predict
+    texts = list(texts)
+
+    latencies = []
+    for text in texts[:single_rows]:
+        start = time.perf_counter()
+        predict_fn(vectorizer.transform([text]))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    predict_fn(vectorizer.transform(texts))
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        'latency_p50_ms': round(float(np.percentile(latencies, 50)), 3) if latencies else None,
+        'latency_p99_ms': round(float(np.percentile(latencies, 99)), 3) if latencies else None,
+        'batch_rows_per_sec': round(len(texts) / batch_seconds, 1) if batch_seconds > 0 else None,
+    }
+
+def _artifact_benchmark(fit_stats, features, model_path, vectorizer_path):
+    """
+    Eğitim sırasında ölçülen maliyetler ve kaydedilen dosya boyutları
+    """
+    vectorizer_size = sum(os.path.getsize(path) for path in
+                          (vectorizer_path, os.path.splitext(vectorizer_path)[0] + ".vocab.npy")
+                          if os.path.exists(path))
+    return {
+        'fit_seconds': round(fit_stats['seconds'], 3),
+        'vectorization_seconds': round(features.get('seconds', 0.0), 3),
+        'features_cached': features.get('cached', False),
+        'peak_rss_mb': fit_stats['peak_rss_mb'],
+        'model_size_kb': round(os.path.getsize(model_path) / 1024, 1),
+        'vectorizer_size_kb': round(vectorizer_size / 1024, 1),
+    }
+
+def build_features(X_train, X_test, feature_space='vocabulary', n_buckets=HASH_BUCKETS):
+    """
+    Ortak özellik çıkarımı: korpus yalnızca bir kez tokenize edilir.
+    Tek bir sayım matrisi çıkarılır; BoW bu matristir, TF-IDF ise aynı matrisin
+    TfidfTransformer ile ağırlıklandırılmış halidir.
+    feature_space='vocabulary': CountVectorizer(max_features=5000)
+        (TfidfVectorizer(max_features=5000) ile aynı sözlük ve değerler)
+    feature_space='hashing': HashingVectorizer(n_buckets), bkz. build_hashing_features
+    Dönüş: {'bow' | 'tfidf': {'vectorizer', 'X_train', 'X_test', 'seconds' (vektörleştirme süresi)}}
+    """
+    if feature_space == 'hashing':
+        return build_hashing_features(X_train, X_test, n_buckets)
+
+    print("\nÖzellikler çıkarılıyor (BoW + TF-IDF, tek tokenizasyon)...")
+    start = time.perf_counter()
+    count_vectorizer = CountVectorizer(max_features=VOCABULARY_SIZE, stop_words=list(stop_words))
+    X_train_counts = count_vectorizer.fit_transform(X_train)
+    X_test_counts = count_vectorizer.transform(X_test)
+    count_seconds = time.perf_counter() - start
+
+    tfidf_transformer = TfidfTransformer()
+    X_train_tfidf = tfidf_transformer.fit_transform(X_train_counts)
+    X_test_tfidf = tfidf_transformer.transform(X_test_counts)
+    tfidf_seconds = time.perf_counter() - start
+
+    # Kaydedilen/servis edilen TF-IDF vectorizer ham metinden aynı matrisi üretebilmeli
+    tfidf_vectorizer = TfidfVectorizer(max_features=VOCABULARY_SIZE, stop_words=list(stop_words))
+    tfidf_vectorizer.vocabulary_ = count_vectorizer.vocabulary_
+    tfidf_vectorizer.idf_ = tfidf_transformer.idf_
+
+    print(f"Sözlük boyutu: {len(count_vectorizer.vocabulary_)} ({tfidf_seconds:.2f} sn)")
+    return {
+        'bow': {'vectorizer': count_vectorizer, 'X_train': X_train_counts, 'X_test': X_test_counts,
+                'seconds': count_seconds},
+        'tfidf': {'vectorizer': tfidf_vectorizer, 'X_train': X_train_tfidf, 'X_test': X_test_tfidf,
+                  'seconds': tfidf_seconds},
+    }
+
+def hash_counts(vectorizer, texts, chunk_size=HASHING_CHUNK_SIZE):
+    """
+    Metinleri parça parça hashing uzayına sayar ve aynı geçişte belge frekanslarını
+    (her kovanın geçtiği belge sayısı) toplar. Parçalar birbirinden bağımsızdır;
+    belge frekansları toplanarak birleştirilebilir.
+    Dönüş: (sayım matrisi, belge frekansları)
+    """
+    from scipy import sparse
+
+    document_frequency = np.zeros(vectorizer.n_features, dtype=np.int64)
+    chunks = []
+    for start in range(0, len(texts), chunk_size):
+        counts = vectorizer.transform(texts[start:start + chunk_size])
+        document_frequency += np.bincount(counts.indices, minlength=vectorizer.n_features)
+        chunks.append(counts)
+    return sparse.vstack(chunks, format='csr'), document_frequency
+
+def idf_transformer(document_frequency, n_documents):
+    """
+    Akış halinde toplanan belge frekanslarından TfidfTransformer kurar
+    (TfidfTransformer(smooth_idf=True).fit ile aynı idf)
+    """
+    transformer = TfidfTransformer()
+    transformer.idf_ = np.log((1 + n_documents) / (1 + document_frequency)) + 1
+    transformer.n_features_in_ = len(document_frequency)
+    return transformer
+
+def build_hashing_features(X_train, X_test, n_buckets=HASH_BUCKETS):
+    """
+    Sözlüksüz özellik çıkarımı: tokenlar n_buckets kovaya hash'lenir, sözlük
+    oluşturmak için ayrı bir geçiş veya bellekte büyük bir dict gerekmez.
+    TF-IDF vectorizer'ı HashingVectorizer + TfidfTransformer hattıdır; kaydedilen
+    tek durum sabit boyutlu idf dizisidir.
+    """
+    print(f"\nÖzellikler çıkarılıyor (hashing, {n_buckets} kova)...")
+    start = time.perf_counter()
+    hashing_vectorizer = HashingVectorizer(n_features=n_buckets, alternate_sign=False, norm=None,
+                                           stop_words=list(stop_words))
+    X_train_counts, document_frequency = hash_counts(hashing_vectorizer, X_train)
+    X_test_counts, _ = hash_counts(hashing_vectorizer, X_test)
+    count_seconds = time.perf_counter() - start
 
-def train_naive_bayes(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
+    tfidf_transformer = idf_transformer(document_frequency, len(X_train))
+    tfidf_vectorizer = Pipeline([('hashing', hashing_vectorizer), ('tfidf', tfidf_transformer)])
+    X_train_tfidf = tfidf_transformer.transform(X_train_counts)
+    X_test_tfidf = tfidf_transformer.transform(X_test_counts)
+    tfidf_seconds = time.perf_counter() - start
+
+    print(f"Dolu kova sayısı: {np.count_nonzero(document_frequency)} ({tfidf_seconds:.2f} sn)")
+    return {
+        'bow': {'vectorizer': hashing_vectorizer, 'X_train': X_train_counts, 'X_test': X_test_counts,
+                'seconds': count_seconds},
+        'tfidf': {'vectorizer': tfidf_vectorizer, 'X_train': X_train_tfidf, 'X_test': X_test_tfidf,
+                  'seconds': tfidf_seconds},
+    }
+
+def train_naive_bayes(features, y_train, y_test, vectorizer_type='bow', alpha=1.0):
     """
     Naive Bayes modeli eğitir
     """
@@ -73,19 +729,15 @@ def train_naive_bayes(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
     print(f"Naive Bayes ({vectorizer_type.upper()}) Eğitiliyor...")
     print(f"{'='*60}")
     
-    # Vectorizer seçimi
-    if vectorizer_type == 'bow':
-        vectorizer = CountVectorizer(max_features=5000, stop_words=list(stop_words))
-    else:  # tfidf
-        vectorizer = TfidfVectorizer(max_features=5000, stop_words=list(stop_words))
-    
-    # Özellik çıkarımı
-    X_train_vec = vectorizer.fit_transform(X_train)
-    X_test_vec = vectorizer.transform(X_test)
+    # Önceden çıkarılmış özellikler (bkz. build_features)
+    vectorizer = features['vectorizer']
+    X_train_vec = features['X_train']
+    X_test_vec = features['X_test']
     
     # Model eğitimi
-    model = MultinomialNB(alpha=1.0)
-    model.fit(X_train_vec, y_train)
+    model = MultinomialNB(alpha=alpha)
+    with track_resources() as fit_stats:
+        model.fit(X_train_vec, y_train)
     
     # Tahmin ve metrikler
     y_pred = model.predict(X_test_vec)
@@ -105,8 +757,10 @@ def train_naive_bayes(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
     model_name = f"naive_bayes_{vectorizer_type}"
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    joblib.dump(model, os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl"))
-    joblib.dump(vectorizer, os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl"))
+    model_path = os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl")
+    vectorizer_path = os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl")
+    save_model_artifact(model, model_path)
+    save_vectorizer_artifact(vectorizer, vectorizer_path)
     
     return {
         'model_name': model_name,
@@ -116,30 +770,83 @@ def train_naive_bayes(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
         'precision': precision,
         'recall': recall,
         'f1_score': f1,
-        'confusion_matrix': cm.tolist()
+        'confusion_matrix': cm.tolist(),
+        'benchmark': _artifact_benchmark(fit_stats, features, model_path, vectorizer_path)
     }
 
-def train_random_forest(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
+def train_logistic_regression(features, y_train, y_test, vectorizer_type='bow', C=1.0):
+    """
+    Logistic Regression modeli eğitir
+    """
+    print(f"\n{'='*60}")
+    print(f"Logistic Regression ({vectorizer_type.upper()}) Eğitiliyor...")
+    print(f"{'='*60}")
+    
+    # Önceden çıkarılmış özellikler (bkz. build_features)
+    vectorizer = features['vectorizer']
+    X_train_vec = features['X_train']
+    X_test_vec = features['X_test']
+    
+    # Model eğitimi
+    model = LogisticRegression(C=C, max_iter=1000, random_state=42)
+    with track_resources() as fit_stats:
+        model.fit(X_train_vec, y_train)
+    
+    # Tahmin ve metrikler
+    y_pred = model.predict(X_test_vec)
+    accuracy = accuracy_score(y_test, y_pred)
+    precision = precision_score(y_test, y_pred, average='weighted')
+    recall = recall_score(y_test, y_pred, average='weighted')
+    f1 = f1_score(y_test, y_pred, average='weighted')
+    cm = confusion_matrix(y_test, y_pred)
+    
+    print(f"Accuracy: {accuracy:.4f}")
+    print(f"Precision: {precision:.4f}")
+    print(f"Recall: {recall:.4f}")
+    print(f"F1-Score: {f1:.4f}")
+    print(f"\nConfusion Matrix:\n{cm}")
+    
+    # Model ve vectorizer'ı kaydet
+    model_name = f"logistic_regression_{vectorizer_type}"
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    model_path = os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl")
+    vectorizer_path = os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl")
+    save_model_artifact(model, model_path)
+    save_vectorizer_artifact(vectorizer, vectorizer_path)
+    
+    return {
+        'model_name': model_name,
+        'model': model,
+        'vectorizer': vectorizer,
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+        'confusion_matrix': cm.tolist(),
+        'benchmark': _artifact_benchmark(fit_stats, features, model_path, vectorizer_path)
+    }
+
+def train_random_forest(features, y_train, y_test, vectorizer_type='bow', n_jobs=-1, n_estimators=100,
+                        max_features='sqrt'):
     """
     Random Forest modeli eğitir
+    n_jobs: ağaç eğitiminde kullanılacak çekirdek sayısı (-1 = tümü)
     """
     print(f"\n{'='*60}")
     print(f"Random Forest ({vectorizer_type.upper()}) Eğitiliyor...")
     print(f"{'='*60}")
     
-    # Vectorizer seçimi
-    if vectorizer_type == 'bow':
-        vectorizer = CountVectorizer(max_features=5000, stop_words=list(stop_words))
-    else:  # tfidf
-        vectorizer = TfidfVectorizer(max_features=5000, stop_words=list(stop_words))
-    
-    # Özellik çıkarımı
-    X_train_vec = vectorizer.fit_transform(X_train)
-    X_test_vec = vectorizer.transform(X_test)
+    # Önceden çıkarılmış özellikler (bkz. build_features)
+    vectorizer = features['vectorizer']
+    X_train_vec = features['X_train']
+    X_test_vec = features['X_test']
     
     # Model eğitimi
-    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-    model.fit(X_train_vec, y_train)
+    model = RandomForestClassifier(n_estimators=n_estimators, max_features=max_features,
+                                   random_state=42, n_jobs=n_jobs)
+    with track_resources() as fit_stats:
+        model.fit(X_train_vec, y_train)
     
     # Tahmin ve metrikler
     y_pred = model.predict(X_test_vec)
@@ -159,8 +866,10 @@ def train_random_forest(X_train, X_test, y_train, y_test, vectorizer_type='bow')
     model_name = f"random_forest_{vectorizer_type}"
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    joblib.dump(model, os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl"))
-    joblib.dump(vectorizer, os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl"))
+    model_path = os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl")
+    vectorizer_path = os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl")
+    save_model_artifact(model, model_path)
+    save_vectorizer_artifact(vectorizer, vectorizer_path)
     
     return {
         'model_name': model_name,
@@ -170,30 +879,71 @@ def train_random_forest(X_train, X_test, y_train, y_test, vectorizer_type='bow')
         'precision': precision,
         'recall': recall,
         'f1_score': f1,
-        'confusion_matrix': cm.tolist()
+        'confusion_matrix': cm.tolist(),
+        'benchmark': _artifact_benchmark(fit_stats, features, model_path, vectorizer_path)
     }
 
-def train_svm(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
+# SVM çözücüleri: libsvm-calibrated (SVC + ayrı sigmoid kalibrasyon), libsvm (SVC'nin iç 5 katlı
+# Platt kalibrasyonu, probability=True; yalnızca açıkça seçilirse), liblinear (LinearSVC),
+# sgd (SGDClassifier). libsvm örnek sayısında süper-doğrusal büyür.
+SVM_SOLVERS = ['auto', 'libsvm-calibrated', 'libsvm', 'liblinear', 'sgd']
+
+# 'auto' iken bu eğitim örneği sayısına kadar libsvm-calibrated, üstünde liblinear kullanılır
+SVM_LIBSVM_MAX_SAMPLES = 10000
+
+def resolve_svm_solver(solver='auto', n_samples=0):
+    if solver == 'auto':
+        return 'libsvm-calibrated' if n_samples <= SVM_LIBSVM_MAX_SAMPLES else 'liblinear'
+    return solver
+
+def svm_estimator(solver, C=1.0):
+    """
+    Çözücünün kalibrasyonsuz doğrusal SVM'i. C'nin ölçeği kayba bağlıdır
+    (libsvm: hinge, liblinear: squared hinge); arama da bu modelle yapılır.
+    """
+    if solver in ('libsvm', 'libsvm-calibrated'):
+        return SVC(kernel='linear', C=C, random_state=42)
+    if solver == 'liblinear':
+        return LinearSVC(C=C, dual='auto', random_state=42)
+    if solver == 'sgd':
+        return SGDClassifier(loss='hinge', alpha=1e-4, max_iter=50, tol=1e-3, random_state=42)
+    raise ValueError(f"Bilinmeyen SVM çözücüsü: {solver}")
+
+def build_svm_model(solver='auto', n_samples=0, C=1.0):
+    """
+    Seçilen çözücüye göre olasılık veren (predict_proba) doğrusal SVM kurar.
+    libsvm-calibrated/liblinear/sgd: doğrusal çözücü + ayrı, tek bir 3 katlı sigmoid
+    kalibrasyon (ensemble=False: çapraz tahminlerle kalibre edilir, son model tüm
+    veriyle bir kez eğitilir).
+    libsvm: SVC(kernel='linear', probability=True), içinde 5 katlı Platt kalibrasyonu
+    (sklearn'ün kullanımdan kaldırdığı yol; yalnızca açıkça seçilirse).
+    Dönüş: (kullanılan çözücü, model)
+    """
+    solver = resolve_svm_solver(solver, n_samples)
+    estimator = svm_estimator(solver, C)
+    if solver == 'libsvm':
+        return solver, estimator.set_params(probability=True)
+    return solver, CalibratedClassifierCV(estimator, method='sigmoid', cv=3, ensemble=False)
+
+def train_svm(features, y_train, y_test, vectorizer_type='bow', solver='auto', C=1.0):
     """
     SVM modeli eğitir
+    solver: 'auto' | 'libsvm-calibrated' | 'libsvm' | 'liblinear' | 'sgd' (bkz. build_svm_model)
     """
     print(f"\n{'='*60}")
     print(f"SVM ({vectorizer_type.upper()}) Eğitiliyor...")
     print(f"{'='*60}")
     
-    # Vectorizer seçimi
-    if vectorizer_type == 'bow':
-        vectorizer = CountVectorizer(max_features=5000, stop_words=list(stop_words))
-    else:  # tfidf
-        vectorizer = TfidfVectorizer(max_features=5000, stop_words=list(stop_words))
+    # Önceden çıkarılmış özellikler (bkz. build_features)
+    vectorizer = features['vectorizer']
+    X_train_vec = features['X_train']
+    X_test_vec = features['X_test']
     
-    # Özellik çıkarımı
-    X_train_vec = vectorizer.fit_transform(X_train)
-    X_test_vec = vectorizer.transform(X_test)
-    
-    # Model eğitimi (SVM için daha küçük örneklem kullanılabilir)
-    model = SVC(kernel='linear', probability=True, random_state=42)
-    model.fit(X_train_vec, y_train)
+    # Model eğitimi (büyük korpusta doğrusal çözücü + ayrı kalibrasyon)
+    solver, model = build_svm_model(solver, X_train_vec.shape[0], C)
+    print(f"Çözücü: {solver}")
+    with track_resources() as fit_stats:
+        model.fit(X_train_vec, y_train)
     
     # Tahmin ve metrikler
     y_pred = model.predict(X_test_vec)
@@ -213,8 +963,10 @@ def train_svm(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
     model_name = f"svm_{vectorizer_type}"
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    joblib.dump(model, os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl"))
-    joblib.dump(vectorizer, os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl"))
+    model_path = os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl")
+    vectorizer_path = os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl")
+    save_model_artifact(model, model_path)
+    save_vectorizer_artifact(vectorizer, vectorizer_path)
     
     return {
         'model_name': model_name,
@@ -224,61 +976,316 @@ def train_svm(X_train, X_test, y_train, y_test, vectorizer_type='bow'):
         'precision': precision,
         'recall': recall,
         'f1_score': f1,
-        'confusion_matrix': cm.tolist()
+        'confusion_matrix': cm.tolist(),
+        'benchmark': _artifact_benchmark(fit_stats, features, model_path, vectorizer_path)
     }
 
-def main():
+def distill_ensemble(results, features, y_train, y_test, vectorizer_type=DISTILLATION_FEATURES, C=DISTILLATION_C):
     """
-    Ana fonksiyon - Tüm modelleri eğitir
+    Eğitilmiş modellerin topluluğunu tek bir doğrusal modele damıtır.
+    Öğretmenler: vectorizer_type ile eğitilmiş tüm modeller (Random Forest dahil).
+    Hedef: öğretmenlerin eğitim setindeki ortalama olasılıkları (yumuşak oy). Logistic
+    Regression yumuşak etiketi doğrudan almadığı için her satır her sınıf için bir kez,
+    o sınıfın olasılığı ağırlığıyla eklenir (ağırlıklı log-loss yumuşak etiketli
+    çapraz entropiye eşittir). Öğrenci tek bir seyrek çarpımla tahmin eder ve kompakt
+    formata aktarılabilir.
     """
-    print("=" * 60)
-    print("ML MODEL EĞİTİMİ BAŞLATILIYOR")
-    print("=" * 60)
+    from scipy import sparse
+
+    print(f"\n{'='*60}")
+    print(f"Topluluk Damıtma ({vectorizer_type.upper()}) Eğitiliyor...")
+    print(f"{'='*60}")
     
-    # Veriyi yükle
-    X, y = load_data()
-    print(f"\nYüklenen veri sayısı: {len(X)}")
-    print(f"Sınıf dağılımı: {pd.Series(y).value_counts().to_dict()}")
+    teachers = [result for result in results if result['model_name'].endswith(f"_{vectorizer_type}")]
+    print(f"Öğretmenler: {', '.join(result['model_name'] for result in teachers)}")
     
-    # Train-test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
-    print(f"\nEğitim seti: {len(X_train)} örnek")
-    print(f"Test seti: {len(X_test)} örnek")
+    vectorizer = features['vectorizer']
+    X_train_vec = features['X_train']
+    X_test_vec = features['X_test']
+    classes = teachers[0]['model'].classes_
     
-    # Model sonuçlarını sakla
-    results = []
+    def ensemble_proba(X):
+        return np.mean([result['model'].predict_proba(X) for result in teachers], axis=0)
     
-    # 1. Naive Bayes (BoW)
-    results.append(train_naive_bayes(X_train, X_test, y_train, y_test, 'bow'))
+    # Model eğitimi: her sınıf için bir kopya, ağırlık = topluluğun o sınıfa verdiği olasılık
+    with track_resources() as fit_stats:
+        soft_labels = ensemble_proba(X_train_vec)
+        X_stacked = sparse.vstack([X_train_vec] * len(classes)).tocsr()
+        y_stacked = np.repeat(classes, X_train_vec.shape[0])
+        model = LogisticRegression(C=C, max_iter=1000, random_state=42)
+        model.fit(X_stacked, y_stacked, sample_weight=soft_labels.T.ravel())
     
-    # 2. Naive Bayes (TF-IDF)
-    results.append(train_naive_bayes(X_train, X_test, y_train, y_test, 'tfidf'))
+    # Tahmin ve metrikler (etiketlere ve topluluk oyuna göre)
+    y_pred = model.predict(X_test_vec)
+    ensemble_pred = classes[ensemble_proba(X_test_vec).argmax(axis=1)]
+    accuracy = accuracy_score(y_test, y_pred)
+    precision = precision_score(y_test, y_pred, average='weighted')
+    recall = recall_score(y_test, y_pred, average='weighted')
+    f1 = f1_score(y_test, y_pred, average='weighted')
+    cm = confusion_matrix(y_test, y_pred)
+    agreement = accuracy_score(ensemble_pred, y_pred)
     
-    # 3. Random Forest (BoW)
-    results.append(train_random_forest(X_train, X_test, y_train, y_test, 'bow'))
+    print(f"Accuracy: {accuracy:.4f} (topluluk: {accuracy_score(y_test, ensemble_pred):.4f})")
+    print(f"Precision: {precision:.4f}")
+    print(f"Recall: {recall:.4f}")
+    print(f"F1-Score: {f1:.4f}")
+    print(f"Topluluk oyuyla uyum: {agreement:.4f}")
+    print(f"\nConfusion Matrix:\n{cm}")
     
-    # 4. Random Forest (TF-IDF)
-    results.append(train_random_forest(X_train, X_test, y_train, y_test, 'tfidf'))
+    # Model ve vectorizer'ı kaydet
+    model_name = f"ensemble_distilled_{vectorizer_type}"
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # 5. SVM (BoW)
-    results.append(train_svm(X_train, X_test, y_train, y_test, 'bow'))
+    model_path = os.path.join(OUTPUT_DIR, f"{model_name}_model.pkl")
+    vectorizer_path = os.path.join(OUTPUT_DIR, f"{model_name}_vectorizer.pkl")
+    save_model_artifact(model, model_path)
+    save_vectorizer_artifact(vectorizer, vectorizer_path)
     
-    # 6. SVM (TF-IDF)
-    results.append(train_svm(X_train, X_test, y_train, y_test, 'tfidf'))
+    return {
+        'model_name': model_name,
+        'model': model,
+        'vectorizer': vectorizer,
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+        'confusion_matrix': cm.tolist(),
+        'teachers': [result['model_name'] for result in teachers],
+        'ensemble_agreement': agreement,
+        'benchmark': _artifact_benchmark(fit_stats, features, model_path, vectorizer_path)
+    }
+
+# Eğitim işleri: (model, özellik tipi). Liste sırası training_results.json sırasıdır.
+TRAINING_JOBS = [
+    ('naive_bayes', 'bow'),
+    ('naive_bayes', 'tfidf'),
+    ('logistic_regression', 'bow'),
+    ('logistic_regression', 'tfidf'),
+    ('random_forest', 'bow'),
+    ('random_forest', 'tfidf'),
+    ('svm', 'bow'),
+    ('svm', 'tfidf'),
+]
+
+TRAINERS = {
+    'naive_bayes': train_naive_bayes,
+    'logistic_regression': train_logistic_regression,
+    'random_forest': train_random_forest,
+    'svm': train_svm,
+}
+
+# Kendi içinde paralel çalışan (n_jobs alan) eğitimciler
+THREADED_TRAINERS = {'random_forest'}
+
+# Paralel eğitimde uzun sürenler önce başlatılır (toplam süre en yavaş modele yaklaşır)
+TRAINING_COST_ORDER = ['svm', 'random_forest', 'logistic_regression', 'naive_bayes']
+
+def _run_training_job(trainer_name, vectorizer_type, features_path, y_train, y_test, n_threads, options=None):
+    """
+    Süreç havuzunda tek bir model eğitir.
+    Özellik matrisleri diskten bellek eşlemeli açılır (kopyalanmaz); BLAS/OpenMP
+    iş parçacıkları n_threads ile sınırlanır, böylece eşzamanlı işler çekirdekleri aşırı paylaşmaz.
+    Dönüş: (sonuç, süre, çıktı logu)
+    """
+    features = joblib.load(features_path, mmap_mode='r')
+    kwargs = dict(options or {})
+    if trainer_name in THREADED_TRAINERS:
+        kwargs['n_jobs'] = n_threads
+    log = io.StringIO()
+    start = time.perf_counter()
+    with threadpool_limits(limits=n_threads), contextlib.redirect_stdout(log):
+        result = TRAINERS[trainer_name](features, y_train, y_test, vectorizer_type, **kwargs)
+    return result, time.perf_counter() - start, log.getvalue()
+
+def train_all(features, y_train, y_test, jobs=1, trainer_options=None):
+    """
+    TRAINING_JOBS listesindeki tüm modelleri eğitir.
+    trainer_options: eğitimciye özel ek parametreler, örn. {'svm': {'solver': 'liblinear'}}
+    jobs > 1 ise (0 = çekirdek sayısı kadar) bağımsız modeller süreç havuzunda eşzamanlı eğitilir; her işe
+    os.cpu_count() // jobs iş parçacığı düşer. Özellik matrisleri her işe pickle
+    ile gönderilmek yerine bir kez geçici dosyaya yazılır ve mmap ile paylaşılır.
+    Dönüş: TRAINING_JOBS sırasıyla sonuç listesi
+    """
+    trainer_options = trainer_options or {}
+    jobs = min(jobs if jobs > 0 else (os.cpu_count() or 1), len(TRAINING_JOBS))
+    if jobs == 1:
+        return [TRAINERS[name](features[vectorizer_type], y_train, y_test, vectorizer_type,
+                               **trainer_options.get(name, {}))
+                for name, vectorizer_type in TRAINING_JOBS]
+
+    n_threads = max(1, (os.cpu_count() or 1) // jobs)
+    print(f"\n{len(TRAINING_JOBS)} model {jobs} süreçte eğitiliyor (iş başına {n_threads} iş parçacığı)...")
+    order = sorted(range(len(TRAINING_JOBS)), key=lambda i: TRAINING_COST_ORDER.index(TRAINING_JOBS[i][0]))
+    results = [None] * len(TRAINING_JOBS)
+
+    with tempfile.TemporaryDirectory(prefix="texthunter_features_") as tmp_dir:
+        feature_paths = {}
+        for vectorizer_type, feature_set in features.items():
+            feature_paths[vectorizer_type] = os.path.join(tmp_dir, f"{vectorizer_type}.joblib")
+            joblib.dump(feature_set, feature_paths[vectorizer_type], compress=0)
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            for index in order:
+                name, vectorizer_type = TRAINING_JOBS[index]
+                future = executor.submit(_run_training_job, name, vectorizer_type,
+                                         feature_paths[vectorizer_type], y_train, y_test, n_threads,
+                                         trainer_options.get(name))
+                futures[future] = index
+            for future in as_completed(futures):
+                result, seconds, log = future.result()
+                print(log, end='')
+                print(f"({result['model_name']} {seconds:.1f} sn'de tamamlandı)")
+                results[futures[future]] = result
+    return results
+
+def _feature_config(vectorizer):
+    """
+    Manifest için özellik çıkarımı ayarları
+    """
+    slim_vectorizer, terms = split_vectorizer(vectorizer)
+    steps = dict(slim_vectorizer.steps) if isinstance(slim_vectorizer, Pipeline) else {}
+    tokenizer = steps.get('hashing', slim_vectorizer)
+    weighting = steps.get('tfidf', slim_vectorizer)
+    config = {
+        'feature_space': 'vocabulary' if terms is not None else 'hashing',
+        'n_features': int(len(terms)) if terms is not None else int(tokenizer.n_features),
+        'vectorizer': type(slim_vectorizer).__name__,
+        'lowercase': bool(tokenizer.lowercase),
+        'token_pattern': tokenizer.token_pattern,
+        'ngram_range': list(tokenizer.ngram_range),
+        'stop_words': len(tokenizer.get_stop_words() or ()),
+    }
+    for attr in ('use_idf', 'smooth_idf', 'sublinear_tf', 'norm'):
+        if hasattr(weighting, attr):
+            config[attr] = getattr(weighting, attr)
+    return config
+
+def publish_bundle(vectorizer, models, metrics=None, source='train_models'):
+    """
+    Servis edilen modelleri tek, sürümlü pakette yayımlar:
+    - MLModels/model_bundle.joblib: paylaşılan vectorizer (sözlüksüz), sıralı terim
+      dizisi, tüm modeller ve etiket eşlemesi; sıkıştırmasız, mmap ile açılabilir
+    - MLModels/model_manifest.json: sürüm, paketin sha256 özeti ve boyutu, özellik
+      ayarları ve model bilgileri
+    Önce paket, en son manifest atomik olarak yazılır; predict.py manifest'teki
+    özetle paketi doğrulayıp tek dosyadan yükler. Kompakt model varsa paketten önce
+    yeniden dışa aktarılır; aktarılamazsa ValueError fırlatılır ve hiçbir dosya
+    değişmez (önceki tutarlı model seti servis edilmeye devam eder).
+    """
+    import predict
+
+    # Web arayüzü SERVED_MODELS'teki tüm modelleri listeler; eksik paket yayımlanmaz
+    missing = [name for name in SERVED_MODELS if name not in models]
+    if missing:
+        raise ValueError(f"Model paketinde servis edilen model(ler) eksik: {', '.join(missing)}")
+
+    compact_path = os.path.join(predict.MODEL_DIR, predict.COMPACT_MODEL_FILE)
+    staged_compact = None
+    if os.path.exists(compact_path):
+        staged_compact = compact_path + ".new"
+        try:
+            export_compact_model(vectorizer, models, staged_compact)
+        except ValueError as e:
+            for path in (staged_compact, staged_compact + ".tmp"):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise ValueError(f"Kompakt model dışa aktarılamadı ({e}); model paketi yayımlanmadı, "
+                             f"önceki model seti korunuyor") from e
+
+    slim_vectorizer, terms = split_vectorizer(vectorizer)
+    bundle = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'vectorizer': slim_vectorizer,
+        'terms': terms,
+        'models': dict(models),
+        'label_map': LABEL_MAP,
+    }
+    os.makedirs(predict.MODEL_DIR, exist_ok=True)
+    bundle_path = os.path.join(predict.MODEL_DIR, predict.BUNDLE_FILE)
+    _write_atomically(bundle_path, lambda f: joblib.dump(bundle, f, compress=0))
+
+    digest = predict.file_sha256(bundle_path)
+    created_at = datetime.now()
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'version': f"{created_at:%Y%m%d%H%M%S}-{digest[:8]}",
+        'created_at': created_at.isoformat(timespec='seconds'),
+        'source': source,
+        'bundle': {'file': predict.BUNDLE_FILE, 'sha256': digest, 'size': os.path.getsize(bundle_path)},
+        'feature_config': _feature_config(vectorizer),
+        'label_map': LABEL_MAP,
+        'models': {
+            name: {
+                'type': type(model).__name__,
+                'classes': [cls.item() if hasattr(cls, 'item') else cls for cls in model.classes_],
+                **((metrics or {}).get(name) or {}),
+            }
+            for name, model in models.items()
+        },
+    }
+    manifest_path = os.path.join(predict.MODEL_DIR, predict.MANIFEST_FILE)
+    _write_atomically(manifest_path, lambda f: f.write(json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')))
+    print(f"\nModel paketi yayımlandı: {bundle_path} (sürüm {manifest['version']}, "
+          f"{manifest['bundle']['size'] / 1024:.0f} KB)")
+
+    if staged_compact:
+        os.replace(staged_compact, compact_path)
+        print(f"Kompakt model güncellendi: {compact_path}")
+    return manifest
+
+def main(jobs=0, svm_solver='auto', feature_space='vocabulary', n_buckets=HASH_BUCKETS, use_search_results=False,
+         use_feature_cache=True):
+    """
+    Ana fonksiyon - Tüm modelleri eğitir
+    """
+    print("=" * 60)
+    print("ML MODEL EĞİTİMİ BAŞLATILIYOR")
+    print("=" * 60)
+    
+    # Veri ve özellikler (değişmediyse önbellekten)
+    features, X_test, y_train, y_test = prepare_features(feature_space, n_buckets, use_feature_cache)
+    
+    # Modelleri eğit (jobs > 1 ise paralel)
+    trainer_options = load_search_trainer_options() if use_search_results else {}
+    svm_options = trainer_options.setdefault('svm', {})
+    searched_solver = svm_options.get('solver')
+    if searched_solver and svm_solver != 'auto' and (
+            type(svm_estimator(svm_solver)) is not type(svm_estimator(searched_solver))):
+        # C'nin ölçeği çözücünün kaybına bağlı; başka çözücüye aktarılmaz
+        print(f"UYARI: SVM C değeri {searched_solver} ile arandı, --svm-solver {svm_solver} "
+              f"ile kullanılmıyor")
+        svm_options.pop('C', None)
+        searched_solver = None
+    svm_options['solver'] = searched_solver or svm_solver
+    if use_search_results:
+        print(f"\nArama sonucundan parametreler: {trainer_options}")
+    results = train_all(features, y_train, y_test, jobs, trainer_options)
+    
+    # Topluluğu tek, hızlı bir modele damıt (servis edilen "ensemble" modeli)
+    results.append(distill_ensemble(results, features[DISTILLATION_FEATURES], y_train, y_test))
+    
+    # Çıkarım maliyeti (eğitim işleri bittikten sonra, birbirini etkilemeden ölçülür)
+    print("\nÇıkarım süreleri ölçülüyor...")
+    for result in results:
+        result['benchmark'].update(benchmark_inference(result['model'], result['vectorizer'], X_test))
     
     # Sonuçları kaydet
     results_summary = []
     for result in results:
-        results_summary.append({
+        summary = {
             'model_name': result['model_name'],
             'accuracy': float(result['accuracy']),
             'precision': float(result['precision']),
             'recall': float(result['recall']),
             'f1_score': float(result['f1_score']),
-            'confusion_matrix': result['confusion_matrix']
-        })
+            'confusion_matrix': result['confusion_matrix'],
+            'benchmark': result['benchmark']
+        }
+        if 'teachers' in result:
+            summary['teachers'] = result['teachers']
+            summary['ensemble_agreement'] = float(result['ensemble_agreement'])
+        results_summary.append(summary)
     
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     with open(os.path.join(OUTPUT_DIR, "training_results.json"), 'w', encoding='utf-8') as f:
@@ -291,8 +1298,498 @@ def main():
     for result in results_summary:
         print(f"{result['model_name']:30s} - Accuracy: {result['accuracy']:.4f}, F1: {result['f1_score']:.4f}")
     
+    print(f"\n{'Model':30s} {'Fit (sn)':>9s} {'p50 (ms)':>9s} {'p99 (ms)':>9s} {'Satır/sn':>10s} {'RSS (MB)':>9s} {'Boyut (KB)':>11s}")
+    for result in results_summary:
+        bench = result['benchmark']
+        print(f"{result['model_name']:30s} {bench['fit_seconds']:9.2f} {bench['latency_p50_ms'] or 0:9.3f} "
+              f"{bench['latency_p99_ms'] or 0:9.3f} {bench['batch_rows_per_sec'] or 0:10.0f} "
+              f"{bench['peak_rss_mb'] or 0:9.1f} {bench['model_size_kb']:11.1f}")
+    
     print(f"\nModeller kaydedildi: {OUTPUT_DIR}")
+    
+    # Servis edilen modelleri tek pakette yayımla (predict.py bunu yükler)
+    by_name = {result['model_name']: result for result in results}
+    served = {name: by_name[f"{trainer}_{vectorizer_type}"] for name, (trainer, vectorizer_type) in SERVED_MODELS.items()}
+    publish_bundle(
+        served['naive_bayes']['vectorizer'],
+        {name: result['model'] for name, result in served.items()},
+        {name: {'source': result['model_name'], 'accuracy': float(result['accuracy']),
+                'f1_score': float(result['f1_score'])} for name, result in served.items()},
+    )
+
+def _search_estimator(algorithm, n_jobs, svm_solver='liblinear'):
+    if algorithm == 'naive_bayes':
+        return MultinomialNB()
+    if algorithm == 'random_forest':
+        return RandomForestClassifier(random_state=42, n_jobs=n_jobs)
+    # C, eğitimde kullanılacak çözücünün kaybıyla aranır (kalibrasyon kararı değiştirmez)
+    return svm_estimator(svm_solver)
+
+def _search_param_grid(algorithm):
+    """
+    Model ızgarasını vectorizer ızgarası ve her ağırlıklandırma (BoW/TF-IDF) ile birleştirir
+    """
+    return [dict(SEARCH_VECTORIZER_GRID, **SEARCH_GRIDS[algorithm], **weighting)
+            for weighting in SEARCH_WEIGHTINGS.values()]
+
+def run_search(jobs=0, cv=3, factor=3, algorithms=None):
+    """
+    Hiperparametre araması: her algoritma için HalvingGridSearchCV (successive halving).
+    Adaylar önce küçük örneklemle değerlendirilir, her turda en iyi 1/factor kadarı
+    daha fazla veriyle devam eder. Çapraz doğrulama katları paralel çalışır (jobs).
+    Pipeline(memory=...) sayesinde her kat için vectorizer ve TF-IDF adımlarının
+    fit_transform çıktısı diskte önbelleğe alınır; aynı sözlük ayarını paylaşan
+    model parametreleri metni yeniden tokenize etmez.
+    SVM, eğitimin aynı veriyle seçeceği çözücüyle (bkz. build_svm_model) aranır;
+    çözücü sonuçlara C ile birlikte yazılır.
+    Sonuçlar MLModels/search_results.json dosyasına yazılır.
+    """
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingGridSearchCV
+
+    print("=" * 60)
+    print("HİPERPARAMETRE ARAMASI")
+    print("=" * 60)
+
+    X, y = load_data()
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=SPLIT_RANDOM_STATE, stratify=y
+    )
+    n_jobs = jobs if jobs > 0 else -1
+    svm_solver = resolve_svm_solver('auto', len(X_train))
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="texthunter_search_") as cache_dir:
+        memory = joblib.Memory(location=cache_dir, verbose=0)
+        for algorithm in algorithms or SEARCH_GRIDS:
+            grid = _search_param_grid(algorithm)
+            pipeline = Pipeline([
+                ('vectorizer', CountVectorizer(stop_words=list(stop_words))),
+                ('tfidf', TfidfTransformer()),
+                # RF kendi içinde paralel değil; paralellik çapraz doğrulama katlarından gelir
+                ('model', _search_estimator(algorithm, n_jobs=1, svm_solver=svm_solver)),
+            ], memory=memory)
+            search = HalvingGridSearchCV(pipeline, grid, factor=factor, cv=cv, scoring='f1_weighted',
+                                         n_jobs=n_jobs, random_state=42, refit=True)
+
+            print(f"\n{algorithm}: {sum(np.prod([len(v) for v in g.values()]) for g in grid)} aday aranıyor...")
+            start = time.perf_counter()
+            search.fit(X_train, y_train)
+            seconds = time.perf_counter() - start
+
+            y_pred = search.best_estimator_.predict(X_test)
+            best_params = {key: (value.item() if hasattr(value, 'item') else value)
+                           for key, value in search.best_params_.items()}
+            results[algorithm] = {
+                'best_params': best_params,
+                'features': 'tfidf' if best_params.get('tfidf__use_idf') else 'bow',
+                'cv_f1_score': float(search.best_score_),
+                'test_accuracy': float(accuracy_score(y_test, y_pred)),
+                'test_f1_score': float(f1_score(y_test, y_pred, average='weighted')),
+                'candidates_per_iteration': [int(n) for n in search.n_candidates_],
+                'samples_per_iteration': [int(n) for n in search.n_resources_],
+                'seconds': round(seconds, 2),
+            }
+            if algorithm == 'svm':
+                results[algorithm]['solver'] = svm_solver
+            print(f"En iyi: {best_params}")
+            print(f"CV F1: {search.best_score_:.4f}, Test F1: {results[algorithm]['test_f1_score']:.4f} ({seconds:.1f} sn)")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(OUTPUT_DIR, SEARCH_RESULTS_FILE)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nArama sonuçları kaydedildi: {path}")
+    print("En iyi model parametreleriyle eğitmek için: python train_models.py --use-search-results")
+    return results
+
+def load_search_trainer_options(path=None):
+    """
+    search_results.json dosyasındaki en iyi model parametrelerini eğitimci
+    parametrelerine çevirir (train_all trainer_options biçiminde).
+    Sözlük boyutu tüm modellerce paylaşıldığından burada uygulanmaz. SVM'in C'si
+    aramadaki çözücüyle birlikte döner (çözücü yazılmamış eski sonuçlar LinearSVC ile
+    arandığından liblinear).
+    """
+    path = path or os.path.join(OUTPUT_DIR, SEARCH_RESULTS_FILE)
+    with open(path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+    options = {}
+    for algorithm, mapping in SEARCH_TRAINER_PARAMS.items():
+        best_params = results.get(algorithm, {}).get('best_params', {})
+        options[algorithm] = {param: best_params[key] for key, param in mapping.items() if key in best_params}
+    if 'C' in options.get('svm', {}):
+        options['svm']['solver'] = results['svm'].get('solver', 'liblinear')
+    return options
+
+def _incremental_dir():
+    import predict
+    return os.path.join(predict.MODEL_DIR, INCREMENTAL_DIR_NAME)
+
+def row_fingerprint(text, label):
+    """
+    Tüketilen satırların kaydı için (etiket, temiz metin) özeti
+    """
+    return hashlib.sha256(f"{label}\0{text}".encode('utf-8')).hexdigest()[:32]
+
+def read_records(path):
+    """
+    Parquet, JSON dizi, JSON-lines veya CSV dosyasından {'text', 'label'} kayıtlarını okur
+    (generate_*_data.py çıktıları ve temizlenmiş veri seti)
+    """
+    return list(iter_dataset_records(path))
+
+def load_new_rows(paths, consumed):
+    """
+    Kaynak dosyalardaki kayıtları data_cleaning.py kurallarıyla temizler ve doğrular,
+    daha önce tüketilmiş (veya aynı çalıştırmada tekrar eden) satırları atlar.
+    Dönüş: (metinler, etiket kodları, parmak izleri, atlanan satır sayısı)
+    """
+    from data_cleaning import clean_texts, validate_data
+
+    records = []
+    for path in paths:
+        items = read_records(path)
+        for item, text in zip(items, clean_texts(item.get('text', '') for item in items)):
+            if text:
+                records.append({'text': text, 'label': item.get('label', '')})
+    records = validate_data(records)
+
+    texts, labels, fingerprints = [], [], []
+    seen = set(consumed)
+    for item in records:
+        fingerprint = row_fingerprint(item['text'], item['label'])
+        if fingerprint in seen:
+            continue
+        seen.add(fingerprint)
+        texts.append(item['text'])
+        labels.append(LABEL_MAP[item['label']])
+        fingerprints.append(fingerprint)
+    return texts, np.array(labels, dtype=np.int64), fingerprints, len(records) - len(texts)
+
+def new_incremental_models():
+    """
+    partial_fit destekleyen, servis edilen modellerin artımlı karşılıkları.
+    logistic_regression -> SGD (log_loss), svm_model -> SGD (modified_huber: hinge benzeri,
+    predict_proba verir), ensemble -> öğretmenlerden damıtılan SGD (log_loss).
+    Sınıf kodları LABEL_MAP ile aynıdır.
+    """
+    return {
+        'naive_bayes': MultinomialNB(alpha=1.0),
+        'logistic_regression': SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42),
+        'svm_model': SGDClassifier(loss='modified_huber', alpha=1e-4, random_state=42),
+        'ensemble': new_incremental_ensemble(),
+    }
+
+def new_incremental_ensemble():
+    return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+
+def load_incremental_state():
+    """
+    MLModels/incremental/ altındaki durumu yükler. Durum yoksa None döner.
+    Durum: {'models', 'consumed' (tüketilen satır parmak izleri), 'rows', 'updated_at',
+            'bundle_version' (durumun en son yayımladığı paket sürümü)}
+    Vectorizer aynı klasörde dondurulmuş olarak tutulur.
+    """
+    import predict
+
+    state_path = os.path.join(_incremental_dir(), INCREMENTAL_STATE_FILE)
+    if not os.path.exists(state_path):
+        return None, None
+    state = joblib.load(state_path)
+    vectorizer = predict.load_vectorizer(vectorizer_path=os.path.join(_incremental_dir(), predict.VECTORIZER_FILE))
+    return state, vectorizer
+
+def _incremental_state_is_current(state, manifest):
+    """
+    Durum, şu an yayımlanmış paketin üzerine kurulduysa True. Paket durumdan sonra
+    toplu eğitimle (train_models.py) yeniden yayımlandıysa durumun modelleri ve
+    dondurulmuş vectorizer'ı eskidir; üzerine yayımlanmamalıdır.
+    """
+    if manifest is None:
+        return True
+    if 'bundle_version' in state:
+        return state['bundle_version'] == manifest['version']
+    # Sürüm kaydı eklenmeden önce oluşturulmuş durum
+    return manifest.get('source') == 'incremental'
+
+def _bootstrap_vectorizer(texts):
+    """
+    İlk artımlı eğitimde sözlük dondurulur: servis edilen TF-IDF vectorizer varsa
+    o alınır, yoksa mevcut veriyle bir kez eğitilir.
+    """
+    import predict
+
+    state_dir = _incremental_dir()
+    state_path = os.path.join(state_dir, predict.VECTORIZER_FILE)
+    os.makedirs(state_dir, exist_ok=True)
+
+    # Servis edilen vectorizer (model paketi veya ayrı dosyalar)
+    vectorizer = predict._load_sklearn_models(predict.DEFAULT_MMAP_MODE)['vectorizer']
+    if vectorizer is None:
+        vectorizer = TfidfVectorizer(max_features=5000, stop_words=list(stop_words)).fit(texts)
+    save_vectorizer_artifact(vectorizer, state_path)
+    return predict.load_vectorizer(vectorizer_path=state_path)
+
+def _partial_fit_ensemble(models, X):
+    """
+    Artımlı damıtma: öğrenci, öğretmenlerin ortalama olasılıklarını yumuşak etiket
+    olarak alır (distill_ensemble ile aynı yöntem: her sınıf için bir kopya, ağırlık =
+    o sınıfın olasılığı). Etiket gerekmez.
+    """
+    from scipy import sparse
+
+    classes = np.array(sorted(LABEL_MAP.values()))
+    soft_labels = np.mean([models[name].predict_proba(X) for name in INCREMENTAL_TEACHERS], axis=0)
+    models['ensemble'].partial_fit(sparse.vstack([X] * len(classes)).tocsr(), np.repeat(classes, X.shape[0]),
+                                   classes=classes, sample_weight=soft_labels.T.ravel())
+
+def _partial_fit_models(models, vectorizer, texts, labels, epochs, fit=None):
+    """
+    Yeni satırları parça parça vektörleştirip modellere partial_fit ile ekler.
+    Naive Bayes sayım tabanlıdır, yalnızca ilk geçişte beslenir; SGD modelleri
+    her geçişte satırları karışık sırayla görür. "ensemble" her parçada
+    öğretmenler güncellendikten sonra onlardan damıtılır.
+    fit: güncellenecek model adları (varsayılan: hepsi)
+    """
+    fit = set(models) if fit is None else set(fit)
+    classes = np.array(sorted(LABEL_MAP.values()))
+    chunks = [(start, min(start + INCREMENTAL_CHUNK_SIZE, len(texts)))
+              for start in range(0, len(texts), INCREMENTAL_CHUNK_SIZE)]
+    matrices = [vectorizer.transform(texts[start:end]) for start, end in chunks]
+    rng = np.random.default_rng(42)
+
+    for epoch in range(epochs):
+        for chunk_index in rng.permutation(len(chunks)):
+            start, end = chunks[chunk_index]
+            X, y = matrices[chunk_index], labels[start:end]
+            order = rng.permutation(len(y))
+            for model_name, model in models.items():
+                if model_name == 'ensemble' or model_name not in fit:
+                    continue
+                if isinstance(model, MultinomialNB) and epoch > 0:
+                    continue
+                model.partial_fit(X[order], y[order], classes=classes)
+            if 'ensemble' in fit:
+                _partial_fit_ensemble(models, X[order])
+
+def _missing_classes(models, labels):
+    """
+    Ne yeni satırlarda ne de modellerin daha önce gördüğü verilerde bulunan sınıflar
+    (Naive Bayes sınıf sayaçlarından)
+    """
+    seen = set(np.unique(labels).tolist())
+    naive_bayes = models.get('naive_bayes')
+    if hasattr(naive_bayes, 'class_count_'):
+        seen |= {int(cls) for cls, count in zip(naive_bayes.classes_, naive_bayes.class_count_) if count > 0}
+    return [label for label, code in LABEL_MAP.items() if code not in seen]
+
+def _prequential_scores(models, vectorizer, texts, labels):
+    """
+    Güncellemeden önce mevcut modellerin yeni satırlardaki doğruluğu (önce test, sonra eğit)
+    """
+    X = vectorizer.transform(texts)
+    return {name: float(accuracy_score(labels, model.predict(X))) for name, model in models.items()}
+
+def _incremental_publish_set(state_models, served_models, manifest, replace_batch_models=False):
+    """
+    Yayımlanacak modeller. Artımlı model; servis edilen modelle aynı algoritmaysa
+    (Naive Bayes), servis edilen model zaten artımlıysa veya replace_batch_models
+    verildiyse yayımlanır. Aksi halde toplu eğitilmiş model (LogisticRegression, SVC,
+    damıtılmış ensemble) ve manifest bilgileri olduğu gibi korunur.
+    Dönüş: (modeller, manifest metrikleri, korunan model adları)
+    """
+    served_info = (manifest or {}).get('models', {})
+    models, metrics, kept = {}, {}, []
+    for name, model in state_models.items():
+        current = served_models.get(name)
+        if (replace_batch_models or current is None or type(current) is type(model)
+                or served_info.get(name, {}).get('source') == 'incremental'):
+            models[name] = model
+            continue
+        models[name] = current
+        metrics[name] = {key: value for key, value in served_info.get(name, {}).items()
+                         if key not in ('type', 'classes')}
+        kept.append(name)
+    return models, metrics, kept
+
+def _accuracy_changes(served, vectorizer, models, texts, labels):
+    """
+    Yayımda yerine başkası geçen her servis edilen model için eski ve yeni modelin
+    verilen satırlardaki doğruluğu: {model_adı: {'before', 'after'}}
+    served: predict._load_sklearn_models çıktısı ({'vectorizer', 'models'})
+    """
+    changed = [name for name, model in models.items() if name in served['models'] and served['models'][name] is not model]
+    if not changed:
+        return {}
+    X_served = served['vectorizer'].transform(texts)
+    X_new = vectorizer.transform(texts)
+    return {
+        name: {'before': float(accuracy_score(labels, served['models'][name].predict(X_served))),
+               'after': float(accuracy_score(labels, models[name].predict(X_new)))}
+        for name in changed
+    }
+
+def train_incremental(paths=None, replace_batch_models=False):
+    """
+    Artımlı eğitim: yalnızca daha önce tüketilmemiş satırlarla Naive Bayes ve doğrusal
+    modelleri partial_fit ile günceller, durumu MLModels/incremental/ altına kaydeder
+    ve servis edilen modelleri yayımlar. Sözlük ilk çalıştırmada dondurulur.
+    Model paketi durumdan sonra toplu eğitimle yeniden yayımlandıysa durum atılır
+    ve yeni paketten yeniden başlatılır.
+    Toplu eğitilmiş logistic_regression/svm_model/ensemble, farklı algoritmalı SGD
+    karşılıklarıyla yalnızca replace_batch_models=True ise değiştirilir; yerine
+    başkası geçen modellerin doğruluk değişimi yazdırılır ve günlüğe eklenir.
+    İlk çalıştırmada modeller önce temizlenmiş veri setiyle başlatılır, verilen
+    dosyalar üzerine eklenir. Bir sınıf hiç görülmediyse ValueError fırlatılır
+    ve hiçbir şey kaydedilmez/yayımlanmaz.
+    paths: kaynak dosyalar (varsayılan: temizlenmiş veri seti)
+    """
+    import predict
+
+    print("=" * 60)
+    print("ARTIMLI MODEL EĞİTİMİ")
+    print("=" * 60)
+    start = time.perf_counter()
+
+    if not paths:
+        paths = [dataset_path()]
+
+    state, vectorizer = load_incremental_state()
+    manifest = predict.load_manifest()
+    if state is not None and not _incremental_state_is_current(state, manifest):
+        print(f"Model paketi artımlı durumdan sonra yeniden yayımlanmış (sürüm {manifest['version']}, "
+              f"kaynak: {manifest.get('source')}); artımlı durum bu paketten yeniden başlatılıyor")
+        state, vectorizer = None, None
+    bootstrap = state is None
+    if bootstrap:
+        state = {'models': new_incremental_models(), 'consumed': set(), 'rows': 0, 'updated_at': None}
+        # Yalnızca verilen dosyalarla (örn. sadece AI satırları içeren checkpoint) başlatılan
+        # modeller tek sınıfı öğrenir; önce tüm temizlenmiş veri setiyle başlatılır
+        try:
+            seed_path = dataset_path()
+        except FileNotFoundError:
+            seed_path = None
+            print("UYARI: Temizlenmiş veri seti bulunamadı, modeller yalnızca verilen dosyalarla başlatılacak")
+        if seed_path and os.path.abspath(seed_path) not in {os.path.abspath(path) for path in paths}:
+            paths = [seed_path] + list(paths)
+
+    texts, labels, fingerprints, skipped = load_new_rows(paths, state['consumed'])
+    print(f"\nYeni satır: {len(texts)} (daha önce tüketilmiş/tekrar: {skipped})")
+    if not texts:
+        print("Eklenecek yeni veri yok, modeller değişmedi.")
+        return None
+
+    missing = _missing_classes(state['models'], labels)
+    if missing:
+        raise ValueError(f"Eğitim verisinde şu sınıf(lar) yok: {', '.join(missing)}. "
+                         f"Tek sınıflı modeller yayımlanmadı; her iki sınıfı da içeren veriyle çalıştırın.")
+
+    if bootstrap:
+        print(f"Artımlı durum bulunamadı, {paths[0]} ile başlatılıyor (sözlük dondurulacak)...")
+        vectorizer = _bootstrap_vectorizer(texts)
+        prequential = {}
+    else:
+        prequential = _prequential_scores(state['models'], vectorizer, texts, labels)
+        for model_name, accuracy in prequential.items():
+            print(f"{model_name:25s} - Yeni satırlarda güncelleme öncesi accuracy: {accuracy:.4f}")
+
+    if 'ensemble' not in state['models']:
+        # Damıtma eklenmeden önce oluşturulmuş durum: öğrenci mevcut öğretmenlerden,
+        # temizlenmiş veri setinin metinleri üzerinde (etiketsiz) bir kez damıtılır
+        print("Artımlı durumda ensemble yok, mevcut modellerden damıtılıyor...")
+        state['models']['ensemble'] = new_incremental_ensemble()
+        try:
+            seed_texts = load_new_rows([dataset_path()], set())[0]
+        except FileNotFoundError:
+            seed_texts = []
+        _partial_fit_models(state['models'], vectorizer, seed_texts, np.zeros(len(seed_texts), dtype=np.int64),
+                            INCREMENTAL_BOOTSTRAP_EPOCHS, fit=['ensemble'])
+
+    _partial_fit_models(state['models'], vectorizer, texts, labels,
+                        INCREMENTAL_BOOTSTRAP_EPOCHS if bootstrap else 1)
+
+    state['consumed'].update(fingerprints)
+    state['rows'] += len(texts)
+    state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+    # Manifest'te modellerin artımlı (SGD/partial_fit) olduğu ve kaç satır gördüğü yazılır
+    metrics = {name: {'source': 'incremental', 'rows': state['rows']} for name in state['models']}
+    metrics['ensemble']['teachers'] = INCREMENTAL_TEACHERS
+    # Paket yeniden yayımlanınca dosyalar değişir; eşlemeli (mmap) açık tutulmaz
+    served = predict._load_sklearn_models(None)
+    models, kept_metrics, kept = _incremental_publish_set(state['models'], served['models'], manifest,
+                                                          replace_batch_models)
+    metrics.update(kept_metrics)
+    if kept:
+        print(f"Toplu eğitilmiş model(ler) korunuyor: {', '.join(kept)} "
+              f"(artımlı SGD karşılıklarını yayımlamak için: --replace-batch-models)")
+    accuracy_changes = _accuracy_changes(served, vectorizer, models, texts, labels)
+    for model_name, change in accuracy_changes.items():
+        note = "  UYARI: doğruluk düştü" if change['after'] < change['before'] else ""
+        print(f"{model_name:25s} - Bu satırlarda accuracy: {change['before']:.4f} -> {change['after']:.4f}{note}")
+    published = publish_bundle(vectorizer, models, metrics, source='incremental')
+
+    # Modeller ve tüketilen satırlar tek dosyada, atomik olarak kaydedilir:
+    # yarıda kesilen çalıştırma satırları ne kaybeder ne iki kez sayar. Durum
+    # yayımdan sonra yazılır; arada kesilirse sürüm tutmaz ve durum yeniden başlatılır.
+    state['bundle_version'] = published['version']
+    _write_atomically(os.path.join(_incremental_dir(), INCREMENTAL_STATE_FILE),
+                      lambda f: joblib.dump(state, f, compress=0))
+
+    seconds = time.perf_counter() - start
+    with open(os.path.join(_incremental_dir(), INCREMENTAL_LOG_FILE), 'a', encoding='utf-8') as f:
+        f.write(json.dumps({
+            'updated_at': state['updated_at'],
+            'sources': [os.path.abspath(path) for path in paths],
+            'new_rows': len(texts),
+            'skipped_rows': skipped,
+            'total_rows': state['rows'],
+            'bootstrap': bootstrap,
+            'prequential_accuracy': prequential,
+            'accuracy_change': accuracy_changes,
+            'kept_batch_models': kept,
+            'seconds': round(seconds, 2),
+        }, ensure_ascii=False) + "\n")
+
+    print(f"\n{len(texts)} satır eklendi (toplam {state['rows']}), {seconds:.1f} sn")
+    return state
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="TextHunter model eğitim scripti")
+    parser.add_argument('--export-compact', action='store_true',
+                        help="Eğitim yapmadan servis edilen modelleri serving_model.npz olarak dışa aktar")
+    parser.add_argument('--incremental', nargs='*', metavar='DOSYA',
+                        help="Artımlı eğitim: yalnızca yeni satırlarla modelleri güncelle "
+                             "(dosya verilmezse temizlenmiş veri seti)")
+    parser.add_argument('--replace-batch-models', action='store_true',
+                        help="Artımlı eğitimde toplu eğitilmiş logistic_regression/svm_model/ensemble "
+                             "yerine artımlı SGD karşılıklarını yayımla")
+    parser.add_argument('--jobs', type=int, default=0,
+                        help="Eşzamanlı eğitilecek model sayısı (0 = çekirdek sayısı kadar, 1 = sıralı)")
+    parser.add_argument('--search', action='store_true',
+                        help="Hiperparametre araması (successive halving + önbellekli çapraz doğrulama)")
+    parser.add_argument('--use-search-results', action='store_true',
+                        help=f"Eğitimde {SEARCH_RESULTS_FILE} içindeki en iyi model parametrelerini kullan")
+    parser.add_argument('--features', choices=FEATURE_SPACES, default='vocabulary',
+                        help="Özellik uzayı: vocabulary (5000 terimlik sözlük) veya hashing (sözlüksüz)")
+    parser.add_argument('--hash-buckets', type=int, default=HASH_BUCKETS,
+                        help=f"Hashing uzayında kova sayısı (varsayılan: {HASH_BUCKETS})")
+    parser.add_argument('--svm-solver', choices=SVM_SOLVERS, default='auto',
+                        help=f"SVM çözücüsü (auto: {SVM_LIBSVM_MAX_SAMPLES} örneğe kadar libsvm-calibrated, "
+                             f"üstünde liblinear; libsvm: SVC probability=True)")
+    parser.add_argument('--no-feature-cache', action='store_true',
+                        help=f"Özellik önbelleğini ({FEATURE_CACHE_DIR}/) kullanma, özellikleri yeniden çıkar")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.export_compact:
+        export_serving_compact_model()
+    elif args.incremental is not None:
+        train_incremental(args.incremental, args.replace_batch_models)
+    elif args.search:
+        run_search(args.jobs)
+    else:
+        main(args.jobs, args.svm_solver, args.features, args.hash_buckets, args.use_search_results,
+             not args.no_feature_cache)
 
@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using System.Text;
 using System.Text.Json;
 using TextHunter.Models;
 using Microsoft.AspNetCore.Hosting;
@@ -11,6 +12,15 @@ namespace TextHunter.Services
         private readonly IWebHostEnvironment _env;
         private readonly string _pythonScriptPath;
         private readonly string _pythonExecutable;
+        private readonly string? _predictionServerUrl;
+        private readonly string? _predictionCacheDb;
+
+        // predict.py --http sunucusu modelleri bellekte tuttuğu için tek tahmin kısa sürer;
+        // yanıt bu sürede gelmezse sunucu takılmış sayılır ve scripte geri dönülür
+        private static readonly TimeSpan PredictionServerTimeout = TimeSpan.FromSeconds(5);
+
+        // predict.py --http sunucusuna istek atmak için paylaşılan istemci
+        private static readonly HttpClient _httpClient = new HttpClient { Timeout = PredictionServerTimeout };
 
         public ModelPredictionService(ILogger<ModelPredictionService> logger, IConfiguration configuration, IWebHostEnvironment env )
         {
@@ -23,6 +33,12 @@ namespace TextHunter.Services
             
             // Python executable yolu (varsayılan olarak python veya python3)
             _pythonExecutable = configuration["PythonExecutable"] ?? "python";
+
+            // Tanımlıysa kalıcı tahmin sunucusu kullanılır (python predict.py --http 8765)
+            _predictionServerUrl = configuration["PredictionServerUrl"];
+
+            // Tanımlıysa her predict.py süreci aynı SQLite tahmin önbelleğini paylaşır
+            _predictionCacheDb = configuration["PredictionCacheDb"];
         }
 
         public async Task<PredictionResult> PredictAsync(string text, string modelName)
@@ -54,35 +70,9 @@ namespace TextHunter.Services
         {
             var results = new Dictionary<string, PredictionResult>();
 
-            try //bu kod blogu sankı cmd uzerınden python predict.py "metın" komutunu yazıyormusuz gıbı yapar 
-            { 
-                // Python scriptini çalıştır
-                var processStartInfo = new ProcessStartInfo
-                {
-                    FileName = _pythonExecutable, //calıstırılacak python exe yolu
-                    Arguments = $"\"{_pythonScriptPath}\" \"{text.Replace("\"", "\\\"")}\"",
-                    RedirectStandardOutput = true,
-                    RedirectStandardError = true,
-                    UseShellExecute = false,
-                    CreateNoWindow = true
-                };
-
-                using var process = Process.Start(processStartInfo);
-                if (process == null)
-                {
-                    throw new Exception("Python process başlatılamadı");
-                }
-
-                var output = await process.StandardOutput.ReadToEndAsync();
-                var error = await process.StandardError.ReadToEndAsync();
-
-                await process.WaitForExitAsync();
-
-                if (process.ExitCode != 0)
-                {
-                    _logger.LogError("Python script hatası: {Error}", error);
-                    throw new Exception($"Python script hatası: {error}");
-                }
+            try
+            {
+                var output = await RunPredictionAsync(text);
 
                 // JSON çıktısını parse et
                 var jsonResult = JsonSerializer.Deserialize<Dictionary<string, JsonElement>>(output); //test'e tabi
@@ -130,6 +120,83 @@ namespace TextHunter.Services
 
             return results;
         }
+
+        private async Task<string> RunPredictionAsync(string text, CancellationToken cancellationToken = default)
+        {
+            if (!string.IsNullOrEmpty(_predictionServerUrl))
+            {
+                try
+                {
+                    return await RequestPredictionServerAsync(text, cancellationToken);
+                }
+                catch (HttpRequestException ex)
+                {
+                    // Sunucuya ulaşılamazsa tek seferlik script çağrısına geri dön
+                    _logger.LogWarning(ex, "Tahmin sunucusuna ulaşılamadı, Python scripti çalıştırılacak");
+                }
+                catch (TaskCanceledException ex) when (!cancellationToken.IsCancellationRequested)
+                {
+                    // Çağıran iptal etmediyse iptal, istemci zaman aşımıdır (sunucu takıldı veya yavaş)
+                    _logger.LogWarning(ex, "Tahmin sunucusu {Timeout} sn içinde yanıt vermedi, Python scripti çalıştırılacak",
+                        PredictionServerTimeout.TotalSeconds);
+                }
+            }
+
+            return await RunPythonScriptAsync(text);
+        }
+
+        private async Task<string> RequestPredictionServerAsync(string text, CancellationToken cancellationToken = default)
+        {
+            var requestUrl = _predictionServerUrl!.TrimEnd('/') + "/predict";
+            var payload = JsonSerializer.Serialize(new { text });
+            using var content = new StringContent(payload, Encoding.UTF8, "application/json");
+            using var response = await _httpClient.PostAsync(requestUrl, content, cancellationToken);
+            var body = await response.Content.ReadAsStringAsync(cancellationToken);
+
+            if (!response.IsSuccessStatusCode)
+            {
+                _logger.LogError("Tahmin sunucusu hatası: {Error}", body);
+                throw new Exception($"Tahmin sunucusu hatası: {body}");
+            }
+
+            return body;
+        }
+
+        private async Task<string> RunPythonScriptAsync(string text)
+        {
+            //bu kod blogu sankı cmd uzerınden python predict.py "metın" komutunu yazıyormusuz gıbı yapar 
+            var processStartInfo = new ProcessStartInfo
+            {
+                FileName = _pythonExecutable, //calıstırılacak python exe yolu
+                Arguments = $"\"{_pythonScriptPath}\" \"{text.Replace("\"", "\\\"")}\"",
+                RedirectStandardOutput = true,
+                RedirectStandardError = true,
+                UseShellExecute = false,
+                CreateNoWindow = true
+            };
+            if (!string.IsNullOrEmpty(_predictionCacheDb))
+            {
+                processStartInfo.Environment["PREDICTION_CACHE_DB"] = _predictionCacheDb;
+            }
+
+            using var process = Process.Start(processStartInfo);
+            if (process == null)
+            {
+                throw new Exception("Python process başlatılamadı");
+            }
+
+            var output = await process.StandardOutput.ReadToEndAsync();
+            var error = await process.StandardError.ReadToEndAsync();
+
+            await process.WaitForExitAsync();
+
+            if (process.ExitCode != 0)
+            {
+                _logger.LogError("Python script hatası: {Error}", error);
+                throw new Exception($"Python script hatası: {error}");
+            }
+
+            return output;
+        }
     }
 }
-